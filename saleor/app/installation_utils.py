@@ -24,6 +24,7 @@ from ..plugins.manager import PluginsManager
 from ..thumbnail import ICON_MIME_TYPES
 from ..thumbnail.utils import get_filename_from_url
 from ..thumbnail.validators import validate_icon_image
+from ..webhook.cache import invalidate_webhooks_cache
 from ..webhook.models import Webhook, WebhookEvent
 from .error_codes import AppErrorCode
 from .manifest_validations import clean_manifest_data
@@ -323,6 +324,7 @@ def install_app(
                 WebhookEvent(webhook=db_webhook, event_type=event_type)
             )
     WebhookEvent.objects.bulk_create(webhook_events)
+    invalidate_webhooks_cache()
 
     token = None
     if tokent_target_url := manifest_data.get("tokenTargetUrl"):
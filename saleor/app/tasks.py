@@ -64,9 +64,12 @@ def install_app_task(job_id, activate=False):
 
 def _raw_remove_deliveries(deliveries_ids):
     deliveries = EventDelivery.objects.filter(id__in=deliveries_ids)
+    # payloads with identical content are shared with deliveries of other apps
+    other_deliveries = EventDelivery.objects.exclude(id__in=deliveries_ids)
     payloads_ids = list(
         EventPayload.objects.filter(
-            Exists(deliveries.filter(payload_id=OuterRef("id")))
+            Exists(deliveries.filter(payload_id=OuterRef("id"))),
+            ~Exists(other_deliveries.filter(payload_id=OuterRef("id"))),
         ).values_list("id", flat=True)
     )
     payloads = EventPayload.objects.filter(id__in=payloads_ids)
@@ -158,6 +158,21 @@ def test_remove_app_task_not_remove_not_own_payloads(
     assert EventPayload.objects.count() == 1
 
 
+def test_remove_app_task_not_remove_payloads_shared_with_other_apps(
+    event_attempt_removed_app, event_delivery, event_payload
+):
+    # given
+    assert event_delivery.payload_id == event_payload.pk
+
+    # when
+    remove_apps_task()
+
+    # then
+    assert EventPayload.objects.filter(pk=event_payload.pk).exists()
+    assert EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+    assert private_storage.exists(event_payload.payload_file.name)
+
+
 def test_remove_app_task_no_app_to_remove(app):
     # given
     assert App.objects.count() == 1
@@ -0,0 +1,253 @@
+import asyncio
+import contextvars
+import gzip
+import io
+import secrets
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# Bodies of at least that size are compressed with a faster level and outside of
+# the event loop, so large responses don't block other requests.
+LARGE_BODY_SIZE = 128 * 1024
+
+# Compression levels of an encoding used for bodies smaller and larger than
+# `LARGE_BODY_SIZE`. Higher levels cost several times more CPU for large JSON
+# responses while reducing their size only marginally.
+COMPRESSION_LEVELS = {
+    GZIP: (6, 4),
+    ZSTD: (6, 3),
+}
+
+COMPRESSION_THREADS = 4
+MAX_PADDING_LENGTH = 100
+ZSTD_SKIPPABLE_FRAME_MAGIC = 0x184D2A50
+
+COMPRESSION_RATIO_BUCKETS = [1, 1.5, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64]
+
+METRIC_COMPRESSION_DURATION = meter.create_metric(
+    "saleor.http.response.compression.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time spent compressing HTTP response bodies.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+METRIC_COMPRESSION_RATIO = meter.create_metric(
+    "saleor.http.response.compression.ratio",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.COUNT,
+    description="Ratio of the uncompressed to the compressed HTTP response size.",
+    bucket_boundaries=COMPRESSION_RATIO_BUCKETS,
+)
+CONTENT_ENCODING_ATTRIBUTE = "http.response.content_encoding"
+
+_executor = ThreadPoolExecutor(
+    max_workers=COMPRESSION_THREADS, thread_name_prefix="response-compression"
+)
+
+
+def get_random_padding_length() -> int:
+    """Return a random padding length up to 100 bytes (inclusive, i.e., [0,100]).
+
+    The padding makes the HTTP content-length random thus making it more difficult
+    to guess whether a given character is present in the response
+    (see https://ieeexplore.ieee.org/document/9754554).
+
+    Note: this doesn't use `random.randint()` because the `secrets` generates
+          stronger random numbers by utilizing the operating system's random
+          number generator (such as `/dev/urandom` or CryptGenRandom on Windows)
+    """
+    return secrets.randbelow(MAX_PADDING_LENGTH + 1)
+
+
+def get_supported_encodings() -> list[str]:
+    """Return the supported encodings, the most preferred first."""
+    if zstandard is not None:
+        return [ZSTD, GZIP]
+    return [GZIP]
+
+
+def _parse_accept_encoding(accept_encoding: bytes) -> dict[str, float]:
+    accepted = {}
+    for item in accept_encoding.decode("latin-1").split(","):
+        name, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def select_encoding(accept_encoding: bytes) -> str | None:
+    """Return the supported encoding the client prefers, if it accepts any.
+
+    Encodings with equal quality values are chosen in the server preference order.
+    """
+    accepted = _parse_accept_encoding(accept_encoding)
+    candidates = [
+        encoding
+        for encoding in get_supported_encodings()
+        if accepted.get(encoding, 0) > 0
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda encoding: accepted[encoding])
+
+
+def get_compression_level(encoding: str, body_size: int | None) -> int:
+    """Return the compression level for the body of the given size.
+
+    The size of streamed bodies is unknown, so they are treated as large ones.
+    """
+    small_body_level, large_body_level = COMPRESSION_LEVELS[encoding]
+    if body_size is None or body_size >= LARGE_BODY_SIZE:
+        return large_body_level
+    return small_body_level
+
+
+class Compressor(ABC):
+    """Compress chunks of a response body into a single encoded stream.
+
+    The input and output sizes and the time spent compressing are recorded as
+    metrics when the stream is finished.
+    """
+
+    encoding: str
+
+    def __init__(self):
+        self.input_size = 0
+        self.output_size = 0
+        self.duration = 0.0
+
+    @abstractmethod
+    def _compress(self, data: bytes) -> bytes:
+        """Return the compressed data available after writing the chunk."""
+
+    @abstractmethod
+    def _finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+
+    def _measure(self, func: Callable[[], bytes]) -> bytes:
+        start = time.monotonic()
+        result = func()
+        self.duration += time.monotonic() - start
+        self.output_size += len(result)
+        return result
+
+    def compress(self, data: bytes) -> bytes:
+        self.input_size += len(data)
+        return self._measure(lambda: self._compress(data))
+
+    def finish(self) -> bytes:
+        result = self._measure(self._finish)
+        self.record_metrics()
+        return result
+
+    def compress_all(self, data: bytes) -> bytes:
+        return self.compress(data) + self.finish()
+
+    def record_metrics(self):
+        attributes = {CONTENT_ENCODING_ATTRIBUTE: self.encoding}
+        meter.record(
+            METRIC_COMPRESSION_DURATION,
+            self.duration,
+            Unit.SECOND,
+            attributes=attributes,
+        )
+        if self.output_size:
+            meter.record(
+                METRIC_COMPRESSION_RATIO,
+                self.input_size / self.output_size,
+                Unit.COUNT,
+                attributes=attributes,
+            )
+
+
+class GzipCompressor(Compressor):
+    encoding = GZIP
+
+    def __init__(self, level: int, padding_length: int):
+        super().__init__()
+        self._buffer = io.BytesIO()
+        # The random filename stored in the gzip header is the padding.
+        self._file = gzip.GzipFile(
+            mode="wb",
+            fileobj=self._buffer,
+            compresslevel=level,
+            filename="x" * padding_length,
+        )
+
+    def _read_buffer(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def _compress(self, data: bytes) -> bytes:
+        self._file.write(data)
+        return self._read_buffer()
+
+    def _finish(self) -> bytes:
+        self._file.close()
+        data = self._read_buffer()
+        self._buffer.close()
+        return data
+
+
+class ZstdCompressor(Compressor):
+    encoding = ZSTD
+
+    def __init__(self, level: int, padding_length: int):
+        super().__init__()
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        self._padding_length = padding_length
+
+    def _compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def _finish(self) -> bytes:
+        # Zstandard has no header field for the padding, so it's appended as
+        # a skippable frame, which is ignored by decoders.
+        padding = struct.pack(
+            "<II", ZSTD_SKIPPABLE_FRAME_MAGIC, self._padding_length
+        ) + (b"\x00" * self._padding_length)
+        return self._compressor.flush() + padding
+
+
+COMPRESSORS: dict[str, type[GzipCompressor | ZstdCompressor]] = {
+    GZIP: GzipCompressor,
+    ZSTD: ZstdCompressor,
+}
+
+
+def get_compressor(encoding: str, body_size: int | None = None) -> Compressor:
+    level = get_compression_level(encoding, body_size)
+    return COMPRESSORS[encoding](level, get_random_padding_length())
+
+
+async def run_compression(func: Callable[[bytes], bytes], data: bytes) -> bytes:
+    """Run the compression of the data, in a thread pool for large data."""
+    if len(data) < LARGE_BODY_SIZE:
+        return func(data)
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_executor, context.run, func, data)
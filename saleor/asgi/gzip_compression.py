@@ -1,10 +1,6 @@
 # adapted from Starlette's GZipMiddleware
 # Starlette does not work with Django's case-sensitive headers
 
-import gzip
-import io
-import secrets
-
 from asgiref.typing import (
     ASGI3Application,
     ASGIReceiveCallable,
@@ -14,24 +10,36 @@ from asgiref.typing import (
     Scope,
 )
 
+from .compression import Compressor, get_compressor, run_compression, select_encoding
 
-def _get_random_filename() -> str:
-    """Generate a random filename with up to 100 bytes (inclusive, i.e., [0,100]).
-
-    This ensures the HTTP content-length is random thus making it more difficult
-    to guess whether a given character is present in the response
-    (see https://ieeexplore.ieee.org/document/9754554).
 
-    Note: this doesn't use `random.randint()` because the `secrets` generates
-          stronger random numbers by utilizing the operating system's random
-          number generator (such as `/dev/urandom` or CryptGenRandom on Windows)
-    """
-    return "x" * secrets.randbelow(101)
+def _get_compressed_headers(
+    headers, encoding: str, content_length: int | None = None
+) -> list[tuple[bytes, bytes]]:
+    compressed_headers = []
+    for key, value in headers:
+        if key.lower() in (b"content-length", b"content-encoding"):
+            continue
+        if key.lower() == b"vary" and b"accept-encoding" not in value.lower():
+            value += b", Accept-Encoding"
+        compressed_headers.append((key, value))
+    compressed_headers.append((b"content-encoding", encoding.encode("latin-1")))
+    if content_length is not None:
+        compressed_headers.append(
+            (b"content-length", str(content_length).encode("latin-1"))
+        )
+    return compressed_headers
 
 
 def gzip_compression(
-    app: ASGI3Application, minimum_size: int = 500, compresslevel: int = 9
+    app: ASGI3Application, minimum_size: int = 500
 ) -> ASGI3Application:
+    """Compress responses with the best encoding accepted by the client.
+
+    The compression level depends on the size of the response and large responses
+    are compressed in a thread pool, see `saleor.asgi.compression`.
+    """
+
     async def gzip_compression_wrapper(
         scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
     ) -> None:
@@ -44,22 +52,18 @@ def gzip_compression(
                 ),
                 b"",
             )
-            if b"gzip" in accepted_encoding:
+            encoding = select_encoding(accepted_encoding)
+            if encoding:
                 start_message: HTTPResponseStartEvent | None = None
                 content_encoding_set = False
                 started = False
-                gzip_buffer = io.BytesIO()
-                gzip_file = gzip.GzipFile(
-                    mode="wb",
-                    fileobj=gzip_buffer,
-                    compresslevel=compresslevel,
-                    filename=_get_random_filename(),
-                )
+                compressor: Compressor | None = None
 
                 async def send_compressed(message: ASGISendEvent) -> None:
                     nonlocal content_encoding_set
                     nonlocal start_message
                     nonlocal started
+                    nonlocal compressor
                     if message["type"] == "http.response.start":
                         start_message = message
                         headers = start_message["headers"]
@@ -82,83 +86,53 @@ def gzip_compression(
                         body = message.get("body", b"")
                         more_body = message.get("more_body", False)
                         if len(body) < minimum_size and not more_body:
-                            # Don't apply GZip to small outgoing responses.
+                            # Don't compress small outgoing responses.
                             await send(start_message)
                             await send(message)
                         elif not more_body:
-                            # Standard GZip response.
-                            gzip_file.write(body)
-                            gzip_file.close()
-                            body = gzip_buffer.getvalue()
-
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            headers.append(
-                                (
-                                    b"content-length",
-                                    str(len(body)).encode("latin-1"),
-                                )
+                            # Standard compressed response.
+                            compressor = get_compressor(encoding, len(body))
+                            body = await run_compression(compressor.compress_all, body)
+                            start_message["headers"] = _get_compressed_headers(
+                                start_message["headers"], encoding, len(body)
                             )
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
                             message["body"] = body
 
                             await send(start_message)
                             await send(message)
                         else:
-                            # Initial body in streaming GZip response.
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
-                            gzip_file.write(body)
-                            message["body"] = gzip_buffer.getvalue()
-                            gzip_buffer.seek(0)
-                            gzip_buffer.truncate()
+                            # Initial body in streaming compressed response.
+                            compressor = get_compressor(encoding)
+                            start_message["headers"] = _get_compressed_headers(
+                                start_message["headers"], encoding
+                            )
+                            message["body"] = await run_compression(
+                                compressor.compress, body
+                            )
 
                             await send(start_message)
                             await send(message)
 
                     elif message["type"] == "http.response.body":
-                        # Remaining body in streaming GZip response.
-                        body = message.get("body", b"")
-                        more_body = message.get("more_body", False)
-
-                        gzip_file.write(body)
-                        if not more_body:
-                            gzip_file.close()
-
-                        message["body"] = gzip_buffer.getvalue()
-                        gzip_buffer.seek(0)
-                        gzip_buffer.truncate()
+                        # Remaining body of a response started uncompressed is sent
+                        # as is.
+                        if compressor is not None:
+                            # Remaining body in streaming compressed response.
+                            body = message.get("body", b"")
+                            more_body = message.get("more_body", False)
+
+                            if more_body:
+                                message["body"] = await run_compression(
+                                    compressor.compress, body
+                                )
+                            else:
+                                message["body"] = await run_compression(
+                                    compressor.compress_all, body
+                                )
 
                         await send(message)
 
                 await app(scope, receive, send_compressed)
-                gzip_file.close()
-                gzip_buffer.close()
                 return
         await app(scope, receive, send)
 
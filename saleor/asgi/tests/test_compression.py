@@ -0,0 +1,153 @@
+import gzip
+from unittest import mock
+
+import pytest
+
+from .. import compression
+from ..compression import (
+    GZIP,
+    LARGE_BODY_SIZE,
+    ZSTD,
+    get_compression_level,
+    get_compressor,
+    run_compression,
+    select_encoding,
+)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected_encoding"),
+    [
+        (b"gzip, deflate", GZIP),
+        (b"GZIP", GZIP),
+        (b"deflate;q=1.0, gzip;q=0.5", GZIP),
+        (b"gzip;q=0", None),
+        (b"identity", None),
+        (b"", None),
+    ],
+)
+def test_select_encoding(accept_encoding, expected_encoding):
+    # when
+    encoding = select_encoding(accept_encoding)
+
+    # then
+    assert encoding == expected_encoding
+
+
+def test_select_encoding_prefers_zstd():
+    # given
+    with mock.patch.object(compression, "zstandard", mock.Mock()):
+        # when
+        encoding = select_encoding(b"gzip, zstd")
+        encoding_by_quality = select_encoding(b"gzip, zstd;q=0.5")
+
+    # then
+    assert encoding == ZSTD
+    assert encoding_by_quality == GZIP
+
+
+def test_select_encoding_without_zstandard():
+    # given
+    with mock.patch.object(compression, "zstandard", None):
+        # when
+        encoding = select_encoding(b"zstd, gzip")
+
+    # then
+    assert encoding == GZIP
+
+
+def test_get_compression_level_lower_for_large_bodies():
+    # when
+    small_body_level = get_compression_level(GZIP, 1000)
+    large_body_level = get_compression_level(GZIP, LARGE_BODY_SIZE)
+    streamed_body_level = get_compression_level(GZIP, None)
+
+    # then
+    assert small_body_level > large_body_level
+    assert streamed_body_level == large_body_level
+
+
+@mock.patch("saleor.asgi.compression.get_random_padding_length", return_value=5)
+def test_gzip_compressor(_mocked_padding_length):
+    # given
+    body = 10000 * b"x"
+    compressor = get_compressor(GZIP, len(body))
+
+    # when
+    data = compressor.compress(body[:5000]) + compressor.compress(body[5000:])
+    data += compressor.finish()
+
+    # then
+    assert gzip.decompress(data) == body
+    assert data[10:16] == b"xxxxx\x00"
+    assert compressor.input_size == len(body)
+    assert compressor.output_size == len(data)
+
+
+def test_zstd_compressor():
+    # given
+    zstandard = pytest.importorskip("zstandard")
+    body = 10000 * b"x"
+    with mock.patch(
+        "saleor.asgi.compression.get_random_padding_length", return_value=7
+    ):
+        compressor = get_compressor(ZSTD, len(body))
+
+    # when
+    data = compressor.compress_all(body)
+
+    # then
+    # the padding is stored in the skippable frame at the end of the stream
+    assert data.endswith(b"\x50\x2a\x4d\x18\x07\x00\x00\x00" + 7 * b"\x00")
+    reader = zstandard.ZstdDecompressor().stream_reader(data, read_across_frames=True)
+    assert reader.read() == body
+
+
+@mock.patch("saleor.asgi.compression.meter.record")
+def test_compressor_records_metrics(mocked_record):
+    # given
+    compressor = get_compressor(GZIP, 1000)
+
+    # when
+    compressor.compress_all(1000 * b"x")
+
+    # then
+    recorded_metrics = {call.args[0] for call in mocked_record.call_args_list}
+    assert recorded_metrics == {
+        compression.METRIC_COMPRESSION_DURATION,
+        compression.METRIC_COMPRESSION_RATIO,
+    }
+    for call in mocked_record.call_args_list:
+        assert call.kwargs["attributes"] == {
+            compression.CONTENT_ENCODING_ATTRIBUTE: GZIP
+        }
+
+
+async def test_run_compression_offloads_large_bodies():
+    # given
+    body = LARGE_BODY_SIZE * b"x"
+    compressor = get_compressor(GZIP, len(body))
+
+    # when
+    with mock.patch.object(
+        compression._executor, "submit", wraps=compression._executor.submit
+    ) as mocked_submit:
+        data = await run_compression(compressor.compress_all, body)
+
+    # then
+    mocked_submit.assert_called_once()
+    assert gzip.decompress(data) == body
+
+
+async def test_run_compression_small_body_in_event_loop():
+    # given
+    body = 1000 * b"x"
+    compressor = get_compressor(GZIP, len(body))
+
+    # when
+    with mock.patch.object(compression._executor, "submit") as mocked_submit:
+        data = await run_compression(compressor.compress_all, body)
+
+    # then
+    mocked_submit.assert_not_called()
+    assert gzip.decompress(data) == body
@@ -73,12 +73,12 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
     with mock.patch(
         # Returns an empty 'random' filename in order to make the HTTP response
         # predictable for this test case
-        "saleor.asgi.gzip_compression._get_random_filename",
-        wraps=lambda: "",
+        "saleor.asgi.compression.get_random_padding_length",
+        wraps=lambda: 0,
     ):
         cors_app = gzip_compression(large_asgi_app)
         events = await run_app(cors_app, build_scope("http://localhost:3000", b"gzip"))
-    expected_payload = gzip.compress(10000 * b"x", compresslevel=9)
+    expected_payload = gzip.compress(10000 * b"x", compresslevel=6)
     assert events == [
         HTTPResponseStartEvent(
             type="http.response.start",
@@ -134,7 +134,7 @@ async def test_response_content_length_includes_random_filename(
         b"content-type": b"text/plain",
         b"content-length": str(
             # content-length should include the random filename
-            len(gzip.compress(10000 * b"x", compresslevel=9))
+            len(gzip.compress(10000 * b"x", compresslevel=6))
             + dummy_random_filename_length
             + 1  # NUL (0x00) which separates the filename
         ).encode("latin1"),
@@ -205,3 +205,89 @@ async def test_response_content_length_is_random(
     # on average it should exceed the length of 'length_1byte_filename'
     avg: float = sum(lengths) / float(len(lengths))
     assert avg > length_1byte_filename
+
+
+async def test_compression_with_not_accepted_gzip(large_asgi_app: ASGI3Application):
+    # given
+    app = gzip_compression(large_asgi_app)
+
+    # when
+    events = await run_app(
+        app, build_scope("http://localhost:3000", b"gzip;q=0, identity")
+    )
+
+    # then
+    assert events[0]["headers"] == [
+        (b"content-length", b"10000"),
+        (b"content-type", b"text/plain"),
+    ]
+    assert events[1]["body"] == 10000 * b"x"
+
+
+async def test_compression_of_streamed_response():
+    # given
+    chunks = [1000 * b"x", 1000 * b"y", 1000 * b"z"]
+
+    async def streaming_app(scope, receive, send):
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[(b"content-type", b"text/plain"), (b"vary", b"Origin")],
+                trailers=False,
+            )
+        )
+        for index, chunk in enumerate(chunks):
+            await send(
+                HTTPResponseBodyEvent(
+                    type="http.response.body",
+                    body=chunk,
+                    more_body=index < len(chunks) - 1,
+                )
+            )
+
+    app = gzip_compression(streaming_app)
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    start_event, *body_events = events
+    assert start_event["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"vary", b"Origin, Accept-Encoding"),
+        (b"content-encoding", b"gzip"),
+    ]
+    body = b"".join(event["body"] for event in body_events)
+    assert gzip.decompress(body) == b"".join(chunks)
+
+
+async def test_body_sent_after_uncompressed_response_is_not_compressed():
+    # given
+    chunks = [10 * b"x", 1000 * b"y"]
+
+    async def app_sending_body_after_end(scope, receive, send):
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[(b"content-type", b"text/plain")],
+                trailers=False,
+            )
+        )
+        for chunk in chunks:
+            await send(
+                HTTPResponseBodyEvent(
+                    type="http.response.body", body=chunk, more_body=False
+                )
+            )
+
+    app = gzip_compression(app_sending_body_after_end)
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    start_event, *body_events = events
+    assert start_event["headers"] == [(b"content-type", b"text/plain")]
+    assert [event["body"] for event in body_events] == chunks
@@ -0,0 +1,76 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class CheckoutAppConfig(AppConfig):
+    name = "saleor.checkout"
+
+    def ready(self):
+        from ..channel.models import Channel
+        from ..discount.models import (
+            Promotion,
+            PromotionRule,
+            PromotionRuleTranslation,
+            PromotionTranslation,
+        )
+        from ..product.models import (
+            CollectionProduct,
+            Product,
+            ProductChannelListing,
+            ProductType,
+            ProductVariant,
+            ProductVariantChannelListing,
+            VariantChannelListingPromotionRule,
+        )
+        from ..tax.models import TaxClass, TaxClassCountryRate
+        from .signals import (
+            invalidate_checkout_catalogue_cache_on_change,
+            invalidate_checkout_catalogue_cache_on_listing_change,
+        )
+
+        # Only saves are tracked, so deletions of the high volume models remain fast
+        # deletes; removing listings marks the products as dirty, which invalidates
+        # the cache explicitly.
+        # dispatch_uid prevents duplicate signals
+        for model in (
+            Channel,
+            CollectionProduct,
+            Product,
+            ProductType,
+            ProductVariant,
+            Promotion,
+            PromotionRule,
+            PromotionRuleTranslation,
+            PromotionTranslation,
+            TaxClass,
+            TaxClassCountryRate,
+            VariantChannelListingPromotionRule,
+        ):
+            post_save.connect(
+                invalidate_checkout_catalogue_cache_on_change,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_checkout_catalogue_cache_on_{model.__name__}_save"
+                ),
+            )
+        for model in (ProductChannelListing, ProductVariantChannelListing):
+            post_save.connect(
+                invalidate_checkout_catalogue_cache_on_listing_change,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_checkout_catalogue_cache_on_{model.__name__}_save"
+                ),
+            )
+        for model in (TaxClass, TaxClassCountryRate):
+            post_delete.connect(
+                invalidate_checkout_catalogue_cache_on_change,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_checkout_catalogue_cache_on_{model.__name__}_delete"
+                ),
+            )
+        m2m_changed.connect(
+            invalidate_checkout_catalogue_cache_on_change,
+            sender=CollectionProduct,
+            dispatch_uid="invalidate_checkout_catalogue_cache_on_collection_change",
+        )
@@ -0,0 +1,86 @@
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+
+from ..core.utils.model_generation import (
+    Generation,
+    GenerationLocalCache,
+    get_generation,
+    invalidate_generation,
+)
+
+CATALOGUE_VERSION_CACHE_KEY = "checkout_catalogue_version"
+CATALOGUE_LOCAL_CACHE_SIZE = 10000
+
+_local_cache = GenerationLocalCache(CATALOGUE_LOCAL_CACHE_SIZE)
+
+
+def _get_channel_version_key(channel_id: int) -> str:
+    return f"{CATALOGUE_VERSION_CACHE_KEY}:{channel_id}"
+
+
+def get_catalogue_version(channel_id: int) -> Generation:
+    """Return the catalogue version of the channel.
+
+    The version consists of the global version, bumped on changes affecting all
+    channels, and the version of the channel, bumped on changes of its listings.
+    """
+    return get_generation(
+        [CATALOGUE_VERSION_CACHE_KEY, _get_channel_version_key(channel_id)]
+    )
+
+
+def invalidate_checkout_catalogue_cache(channel_ids: Iterable[int] | None = None):
+    """Invalidate the variant pricing snapshots cached by all processes.
+
+    Only the snapshots of the given channels are invalidated, or the snapshots of
+    all channels when no channels are given. Model signals call it automatically;
+    code using bulk operations, which don't send signals, has to call it explicitly.
+    """
+    if channel_ids is None:
+        invalidate_generation([CATALOGUE_VERSION_CACHE_KEY])
+        return
+    ids = sorted(set(channel_ids))
+    if ids:
+        invalidate_generation(_get_channel_version_key(pk) for pk in ids)
+
+
+def get_or_load_variant_snapshots(
+    variant_ids: Iterable[int],
+    channel_id: int,
+    load: Callable[[list[int]], Iterable],
+) -> dict:
+    """Return the variant pricing snapshots of the channel, keyed by variant ID.
+
+    Snapshots are variants with the related objects used to price checkout lines in
+    the channel. Snapshots missing in the process memory are loaded with `load`,
+    which is called once with the IDs of all missing variants.
+    """
+    timeout = settings.CHECKOUT_CATALOGUE_CACHE_TIMEOUT
+    variant_ids = list(dict.fromkeys(variant_ids))
+    if not timeout:
+        return {variant.pk: variant for variant in load(variant_ids)}
+
+    version = get_catalogue_version(channel_id)
+    cached = _local_cache.get_many(
+        [(channel_id, variant_id) for variant_id in variant_ids], version
+    )
+    snapshots = {variant_id: snapshot for (_, variant_id), snapshot in cached.items()}
+
+    missing_ids = [pk for pk in variant_ids if pk not in snapshots]
+    if missing_ids:
+        loaded = {variant.pk: variant for variant in load(missing_ids)}
+        _local_cache.set_many(
+            {
+                (channel_id, variant_id): variant
+                for variant_id, variant in loaded.items()
+            },
+            version,
+            timeout,
+        )
+        snapshots.update(loaded)
+    return snapshots
+
+
+def clear_local_checkout_catalogue_cache():
+    _local_cache.clear()
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from decimal import Decimal
 from typing import TYPE_CHECKING, Union, cast
 
@@ -39,6 +39,11 @@ from .fetch import find_checkout_line_info
 from .lock_objects import checkout_qs_select_for_update
 from .models import Checkout
 from .payment_utils import update_checkout_payment_statuses
+from .recalculation import (
+    CheckoutRecalculationContext,
+    get_checkout_prices_memo_key,
+    get_recalculation_context,
+)
 
 if TYPE_CHECKING:
     from ..account.models import User
@@ -48,6 +53,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Fields of checkout and its lines set by the prices recalculation.
+CHECKOUT_PRICE_FIELDS = [
+    "voucher_code",
+    "total_net_amount",
+    "total_gross_amount",
+    "subtotal_net_amount",
+    "subtotal_gross_amount",
+    "shipping_price_net_amount",
+    "shipping_price_gross_amount",
+    "undiscounted_base_shipping_price_amount",
+    "shipping_tax_rate",
+    "translated_discount_name",
+    "discount_amount",
+    "discount_name",
+    "currency",
+    "price_expiration",
+    "discount_expiration",
+    "tax_error",
+]
+CHECKOUT_LINE_PRICE_FIELDS = [
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "tax_rate",
+    "undiscounted_unit_price_amount",
+    "prior_unit_price_amount",
+]
+
 
 def checkout_shipping_price(
     *,
@@ -386,6 +418,16 @@ def _fetch_checkout_prices_if_expired(
     if not force_update and checkout.price_expiration > timezone.now():
         return Promise.resolve((checkout_info, lines))
 
+    # the same checkout state could be already recalculated within the request
+    recalculation_context = get_recalculation_context()
+    recalculation_memo_key: Hashable = None
+    if recalculation_context:
+        recalculation_memo_key = get_checkout_prices_memo_key(checkout_info, lines)
+        if _apply_memoized_checkout_prices(
+            recalculation_context, recalculation_memo_key, checkout_info, lines
+        ):
+            return Promise.resolve((checkout_info, lines))
+
     tax_configuration = checkout_info.tax_configuration
     with allow_writer_for_default_connection(database_connection_name):
         tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(
@@ -450,40 +492,22 @@ def _fetch_checkout_prices_if_expired(
                 # to avoid overwriting changes made by the other requests. Skipping the save function does not affect
                 # the query response because it returns the adjusted checkout and line info objects.
                 if checkout.last_change == locked_checkout.last_change:
-                    checkout_update_fields = [
-                        "voucher_code",
-                        "total_net_amount",
-                        "total_gross_amount",
-                        "subtotal_net_amount",
-                        "subtotal_gross_amount",
-                        "shipping_price_net_amount",
-                        "shipping_price_gross_amount",
-                        "undiscounted_base_shipping_price_amount",
-                        "shipping_tax_rate",
-                        "translated_discount_name",
-                        "discount_amount",
-                        "discount_name",
-                        "currency",
-                        "price_expiration",
-                        "discount_expiration",
-                        "tax_error",
-                    ]
-
                     from .utils import checkout_lines_bulk_update
 
                     checkout.save(
-                        update_fields=checkout_update_fields,
+                        update_fields=CHECKOUT_PRICE_FIELDS,
                         using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
                     )
                     checkout_lines_bulk_update(
                         [line_info.line for line_info in lines],
-                        [
-                            "total_price_net_amount",
-                            "total_price_gross_amount",
-                            "tax_rate",
-                            "undiscounted_unit_price_amount",
-                            "prior_unit_price_amount",
-                        ],
+                        CHECKOUT_LINE_PRICE_FIELDS,
+                    )
+                if recalculation_context:
+                    _memoize_checkout_prices(
+                        recalculation_context,
+                        recalculation_memo_key,
+                        checkout_info,
+                        lines,
                     )
                 return checkout_info, lines
 
@@ -509,6 +533,59 @@ def _fetch_checkout_prices_if_expired(
     )
 
 
+def _memoize_checkout_prices(
+    context: CheckoutRecalculationContext,
+    key: Hashable,
+    checkout_info: "CheckoutInfo",
+    lines: list["CheckoutLineInfo"],
+):
+    checkout = checkout_info.checkout
+    context.set(
+        "checkout_prices",
+        key,
+        (
+            {field: getattr(checkout, field) for field in CHECKOUT_PRICE_FIELDS},
+            list(checkout_info.discounts),
+            {
+                line_info.line.pk: (
+                    {
+                        field: getattr(line_info.line, field)
+                        for field in CHECKOUT_LINE_PRICE_FIELDS
+                    },
+                    list(line_info.discounts),
+                )
+                for line_info in lines
+            },
+        ),
+    )
+
+
+def _apply_memoized_checkout_prices(
+    context: CheckoutRecalculationContext,
+    key: Hashable,
+    checkout_info: "CheckoutInfo",
+    lines: list["CheckoutLineInfo"],
+) -> bool:
+    """Apply prices recalculated earlier in the request for the same checkout state.
+
+    Return False if the prices have to be recalculated.
+    """
+    memoized = context.get("checkout_prices", key)
+    if memoized is None:
+        return False
+
+    checkout_fields, checkout_discounts, lines_data = memoized
+    for field, value in checkout_fields.items():
+        setattr(checkout_info.checkout, field, value)
+    checkout_info.discounts = list(checkout_discounts)
+    for line_info in lines:
+        line_fields, line_discounts = lines_data[line_info.line.pk]
+        for field, value in line_fields.items():
+            setattr(line_info.line, field, value)
+        line_info.discounts = list(line_discounts)
+    return True
+
+
 @allow_writer()
 def recalculate_discounts(
     checkout_info: "CheckoutInfo",
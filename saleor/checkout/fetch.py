@@ -1,11 +1,12 @@
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
-from functools import cached_property
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from django.conf import settings
+from django.db.models import Prefetch
 from prices import Money
 
 from ..core.prices import quantize_price
@@ -22,6 +23,7 @@ from ..shipping.utils import (
     convert_checkout_delivery_to_shipping_method_data,
 )
 from ..warehouse.models import Warehouse
+from .cache import get_or_load_variant_snapshots
 from .delivery_context import (
     CollectionPointInfo,
     DeliveryMethodBase,
@@ -179,27 +181,48 @@ def fetch_checkout_lines(
     from ..discount.utils.voucher import attach_voucher_to_line_info
     from .utils import get_voucher_for_checkout
 
-    select_related_fields = ["variant__product__product_type__tax_class"]
-    prefetch_related_fields = [
-        "variant__product__collections",
-        "variant__product__channel_listings__channel",
-        "variant__product__product_type__tax_class__country_rates",
-        "variant__product__tax_class__country_rates",
-        "variant__channel_listings__channel",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
-        "discounts__promotion_rule__promotion",
-    ]
-    if prefetch_variant_attributes:
-        prefetch_related_fields.extend(
-            [
-                "variant__attributes__assignment__attribute",
-                "variant__attributes__values",
-            ]
+    lines: Iterable[CheckoutLine]
+    if settings.CHECKOUT_CATALOGUE_CACHE_TIMEOUT and not prefetch_variant_attributes:
+        # the catalogue data is taken from the cached variant snapshots, only the
+        # checkout specific data is fetched
+        checkout_lines = list(
+            checkout.lines.prefetch_related("discounts__promotion_rule__promotion")
+        )
+        variants = get_or_load_variant_snapshots(
+            [line.variant_id for line in checkout_lines],
+            checkout.channel_id,
+            partial(
+                _fetch_variant_snapshots,
+                channel_id=checkout.channel_id,
+                database_connection_name=checkout.lines.db,
+            ),
+        )
+        # the variant could be deleted together with the line in the meantime
+        lines = [line for line in checkout_lines if line.variant_id in variants]
+        for line in lines:
+            line.variant = variants[line.variant_id]
+    else:
+        select_related_fields = ["variant__product__product_type__tax_class"]
+        prefetch_related_fields = [
+            "variant__product__collections",
+            "variant__product__channel_listings__channel",
+            "variant__product__product_type__tax_class__country_rates",
+            "variant__product__tax_class__country_rates",
+            "variant__channel_listings__channel",
+            "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
+            "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+            "discounts__promotion_rule__promotion",
+        ]
+        if prefetch_variant_attributes:
+            prefetch_related_fields.extend(
+                [
+                    "variant__attributes__assignment__attribute",
+                    "variant__attributes__values",
+                ]
+            )
+        lines = checkout.lines.select_related(*select_related_fields).prefetch_related(
+            *prefetch_related_fields
         )
-    lines = checkout.lines.select_related(*select_related_fields).prefetch_related(
-        *prefetch_related_fields
-    )
     lines_info = []
     unavailable_variant_pks = []
     product_channel_listing_mapping: dict[int, ProductChannelListing | None] = {}
@@ -279,6 +302,46 @@ def fetch_checkout_lines(
     return lines_info, unavailable_variant_pks
 
 
+def _fetch_variant_snapshots(
+    variant_ids: list[int], channel_id: int, database_connection_name: str
+) -> list["ProductVariant"]:
+    """Fetch variants with the related objects used to price lines in the channel.
+
+    Only channel listings of the given channel are fetched, so the snapshots don't
+    depend on the listings of other channels.
+    """
+    from ..product.models import (
+        ProductChannelListing,
+        ProductVariant,
+        ProductVariantChannelListing,
+    )
+
+    return list(
+        ProductVariant.objects.using(database_connection_name)
+        .filter(pk__in=variant_ids)
+        .select_related("product__product_type__tax_class")
+        .prefetch_related(
+            "product__collections",
+            Prefetch(
+                "product__channel_listings",
+                queryset=ProductChannelListing.objects.filter(
+                    channel_id=channel_id
+                ).select_related("channel"),
+            ),
+            "product__product_type__tax_class__country_rates",
+            "product__tax_class__country_rates",
+            Prefetch(
+                "channel_listings",
+                queryset=ProductVariantChannelListing.objects.filter(
+                    channel_id=channel_id
+                ).select_related("channel"),
+            ),
+            "channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
+            "channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+        )
+    )
+
+
 def get_variant_channel_listing(
     variant: "ProductVariant", channel_id: int
 ) -> Optional["ProductVariantChannelListing"]:
@@ -0,0 +1,36 @@
+from collections.abc import Mapping
+
+from ..core.telemetry import MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_RECALCULATION_MEMO_HITS = meter.create_metric(
+    "saleor.checkout.recalculation_memo.hits",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of checkout recalculation values reused within a request.",
+)
+METRIC_RECALCULATION_MEMO_MISSES = meter.create_metric(
+    "saleor.checkout.recalculation_memo.misses",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of checkout recalculation values computed within a request.",
+)
+RECALCULATION_MEMO_VALUE_ATTRIBUTE = "saleor.checkout.recalculation_memo.value"
+
+
+def record_recalculation_memo_stats(
+    hits: Mapping[str, int], misses: Mapping[str, int]
+) -> None:
+    for metric, counts in (
+        (METRIC_RECALCULATION_MEMO_HITS, hits),
+        (METRIC_RECALCULATION_MEMO_MISSES, misses),
+    ):
+        for name, count in counts.items():
+            meter.record(
+                metric,
+                count,
+                Unit.COUNT,
+                attributes={RECALCULATION_MEMO_VALUE_ATTRIBUTE: name},
+            )
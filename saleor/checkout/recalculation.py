@@ -0,0 +1,128 @@
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from .metrics import record_recalculation_memo_stats
+
+if TYPE_CHECKING:
+    from ..account.models import Address
+    from .fetch import CheckoutInfo, CheckoutLineInfo
+
+
+_MISSING = object()
+
+
+class CheckoutRecalculationContext:
+    """Memoize checkout recalculation results for the lifetime of a request.
+
+    GraphQL resolvers of checkout prices and mutations re-enter the recalculation
+    several times for the same checkout; the memoized values are keyed by everything
+    the recalculation depends on, so a value is reused only for the same checkout
+    state. Hits and misses are counted per memoized value name.
+    """
+
+    def __init__(self):
+        self._memo: dict[tuple[str, Hashable], Any] = {}
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def get(self, name: str, key: Hashable, default=None):
+        value = self._memo.get((name, key), _MISSING)
+        if value is _MISSING:
+            self.misses[name] += 1
+            return default
+        self.hits[name] += 1
+        return value
+
+    def set(self, name: str, key: Hashable, value):
+        self._memo[(name, key)] = value
+
+    def get_or_compute[T](
+        self, name: str, key: Hashable, compute: Callable[[], T]
+    ) -> T:
+        value = self.get(name, key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(name, key, value)
+        return value
+
+
+_current_context: ContextVar[CheckoutRecalculationContext | None] = ContextVar(
+    "checkout_recalculation_context", default=None
+)
+
+
+def get_recalculation_context() -> CheckoutRecalculationContext | None:
+    return _current_context.get()
+
+
+@contextmanager
+def checkout_recalculation_context() -> Iterator[CheckoutRecalculationContext]:
+    """Memoize checkout recalculations within the block.
+
+    Nested blocks share the context of the outermost one.
+    """
+    context = _current_context.get()
+    if context is not None:
+        yield context
+        return
+
+    context = CheckoutRecalculationContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+        record_recalculation_memo_stats(context.hits, context.misses)
+
+
+def memoize_in_recalculation_context[T](
+    name: str, key: Hashable, compute: Callable[[], T]
+) -> T:
+    """Return the value memoized in the current context or compute it.
+
+    Outside of the recalculation context the value is always computed.
+    """
+    context = _current_context.get()
+    if context is None:
+        return compute()
+    return context.get_or_compute(name, key, compute)
+
+
+def _get_address_key(address: "Address | None") -> Hashable:
+    if address is None:
+        return None
+    address_data = address.as_data()
+    return tuple(sorted((name, str(value)) for name, value in address_data.items()))
+
+
+def get_checkout_prices_memo_key(
+    checkout_info: "CheckoutInfo", lines: list["CheckoutLineInfo"]
+) -> Hashable:
+    """Return the key of everything checkout prices recalculation depends on."""
+    checkout = checkout_info.checkout
+    return (
+        checkout.pk,
+        checkout.last_change,
+        checkout.channel_id,
+        checkout.currency,
+        checkout.voucher_code,
+        checkout.discount_amount,
+        checkout.tax_exemption,
+        checkout.assigned_delivery_id,
+        checkout.collection_point_id,
+        _get_address_key(checkout_info.shipping_address),
+        _get_address_key(checkout_info.billing_address),
+        tuple(
+            (
+                line_info.line.pk,
+                line_info.line.variant_id,
+                line_info.line.quantity,
+                line_info.line.price_override,
+                line_info.line.is_gift,
+            )
+            for line_info in lines
+        ),
+    )
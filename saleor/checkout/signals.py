@@ -0,0 +1,9 @@
+from .cache import invalidate_checkout_catalogue_cache
+
+
+def invalidate_checkout_catalogue_cache_on_change(sender, **kwargs):
+    invalidate_checkout_catalogue_cache()
+
+
+def invalidate_checkout_catalogue_cache_on_listing_change(sender, instance, **kwargs):
+    invalidate_checkout_catalogue_cache([instance.channel_id])
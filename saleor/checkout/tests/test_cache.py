@@ -0,0 +1,98 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...product.utils.product import mark_products_in_channels_as_dirty
+from ..cache import clear_local_checkout_catalogue_cache, get_catalogue_version
+from ..fetch import fetch_checkout_lines
+
+
+@pytest.fixture(autouse=True)
+def _enable_catalogue_cache(settings):
+    settings.CHECKOUT_CATALOGUE_CACHE_TIMEOUT = 60
+    clear_local_checkout_catalogue_cache()
+    yield
+    clear_local_checkout_catalogue_cache()
+
+
+def test_fetch_checkout_lines_uses_cached_variant_snapshots(
+    checkout_with_item_on_promotion,
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    with CaptureQueriesContext(connection) as first_fetch_queries:
+        expected_lines_info, _ = fetch_checkout_lines(checkout)
+
+    # when
+    with CaptureQueriesContext(connection) as second_fetch_queries:
+        lines_info, unavailable_variants = fetch_checkout_lines(checkout)
+
+    # then
+    assert len(second_fetch_queries) < len(first_fetch_queries)
+    assert not unavailable_variants
+    line_info = lines_info[0]
+    expected_line_info = expected_lines_info[0]
+    assert line_info.line.pk == expected_line_info.line.pk
+    assert line_info.variant == expected_line_info.variant
+    assert line_info.channel_listing == expected_line_info.channel_listing
+    assert line_info.rules_info == expected_line_info.rules_info
+    assert line_info.collections == expected_line_info.collections
+    assert line_info.tax_class == expected_line_info.tax_class
+
+
+def test_fetch_checkout_lines_snapshots_contain_only_checkout_channel_listings(
+    checkout_with_item_on_promotion, channel_PLN
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    variant = checkout.lines.first().variant
+    variant.channel_listings.create(
+        channel=channel_PLN,
+        price_amount=Decimal(10),
+        currency=channel_PLN.currency_code,
+    )
+
+    # when
+    lines_info, _ = fetch_checkout_lines(checkout)
+
+    # then
+    variant_listings = list(lines_info[0].variant.channel_listings.all())
+    assert [listing.channel_id for listing in variant_listings] == [checkout.channel_id]
+
+
+def test_fetch_checkout_lines_cache_invalidated_on_listing_change(
+    checkout_with_item_on_promotion, django_capture_on_commit_callbacks
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    fetch_checkout_lines(checkout)
+    variant_listing = checkout.lines.first().variant.channel_listings.get(
+        channel_id=checkout.channel_id
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        variant_listing.price_amount = Decimal(99)
+        variant_listing.save(update_fields=["price_amount"])
+    lines_info, _ = fetch_checkout_lines(checkout)
+
+    # then
+    assert lines_info[0].channel_listing.price_amount == Decimal(99)
+
+
+def test_mark_products_in_channels_as_dirty_invalidates_catalogue_cache(
+    product, channel_USD, channel_PLN, django_capture_on_commit_callbacks
+):
+    # given
+    usd_version = get_catalogue_version(channel_USD.pk)
+    pln_version = get_catalogue_version(channel_PLN.pk)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        mark_products_in_channels_as_dirty({channel_USD.pk: {product.pk}})
+
+    # then
+    assert get_catalogue_version(channel_USD.pk) != usd_version
+    assert get_catalogue_version(channel_PLN.pk) == pln_version
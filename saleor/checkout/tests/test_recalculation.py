@@ -0,0 +1,113 @@
+from unittest.mock import Mock, patch
+
+from django.utils import timezone
+
+from ...plugins.manager import get_plugins_manager
+from ...tax.utils import (
+    get_charge_taxes_for_checkout,
+    get_tax_calculation_strategy_for_checkout,
+)
+from ..calculations import fetch_checkout_data
+from ..fetch import fetch_checkout_info, fetch_checkout_lines
+from ..recalculation import (
+    checkout_recalculation_context,
+    get_recalculation_context,
+    memoize_in_recalculation_context,
+)
+
+
+def test_memoize_in_recalculation_context():
+    # given
+    compute = Mock(return_value="value")
+
+    # when
+    with checkout_recalculation_context() as context:
+        values = [memoize_in_recalculation_context("name", 1, compute) for _ in "ab"]
+
+    # then
+    assert values == ["value", "value"]
+    compute.assert_called_once_with()
+    assert context.hits["name"] == 1
+    assert context.misses["name"] == 1
+    assert get_recalculation_context() is None
+
+
+def test_memoize_in_recalculation_context_without_context():
+    # given
+    compute = Mock(return_value="value")
+
+    # when
+    memoize_in_recalculation_context("name", 1, compute)
+    memoize_in_recalculation_context("name", 1, compute)
+
+    # then
+    assert compute.call_count == 2
+
+
+def test_nested_recalculation_context_shares_memo():
+    # when
+    with checkout_recalculation_context() as context:
+        with checkout_recalculation_context() as nested_context:
+            pass
+
+    # then
+    assert nested_context is context
+
+
+def test_tax_configuration_lookups_memoized(checkout_with_item):
+    # given
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, manager)
+
+    # when
+    with checkout_recalculation_context() as context:
+        charge_taxes = get_charge_taxes_for_checkout(checkout_info)
+        tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(
+            checkout_info
+        )
+
+    # then
+    assert charge_taxes == checkout_info.tax_configuration.charge_taxes
+    assert (
+        tax_calculation_strategy
+        == checkout_info.tax_configuration.tax_calculation_strategy
+    )
+    assert context.misses["country_tax_configuration"] == 1
+    assert context.hits["country_tax_configuration"] == 1
+
+
+@patch("saleor.checkout.calculations.recalculate_discounts")
+def test_fetch_checkout_data_reuses_prices_recalculated_in_request(
+    recalculate_discounts_mock, checkout_with_items
+):
+    # given
+    checkout_with_items.price_expiration = timezone.now()
+    checkout_with_items.save(update_fields=["price_expiration"])
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout_with_items)
+    checkout_info = fetch_checkout_info(checkout_with_items, lines, manager)
+    # checkout loaded separately, e.g. by another dataloader
+    other_lines, _ = fetch_checkout_lines(checkout_with_items)
+    other_checkout_info = fetch_checkout_info(checkout_with_items, other_lines, manager)
+    other_checkout_info.checkout = type(checkout_with_items).objects.get(
+        pk=checkout_with_items.pk
+    )
+
+    # when
+    with checkout_recalculation_context() as context:
+        fetch_checkout_data(checkout_info, manager, lines, requestor=None).get()
+        fetch_checkout_data(
+            other_checkout_info, manager, other_lines, requestor=None
+        ).get()
+
+    # then
+    recalculate_discounts_mock.assert_called_once()
+    assert context.hits["checkout_prices"] == 1
+    assert other_checkout_info.checkout.total == checkout_info.checkout.total
+    assert (
+        other_checkout_info.checkout.price_expiration
+        == checkout_info.checkout.price_expiration
+    )
+    for line_info, other_line_info in zip(lines, other_lines, strict=True):
+        assert other_line_info.line.total_price == line_info.line.total_price
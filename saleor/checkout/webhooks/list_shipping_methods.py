@@ -9,7 +9,10 @@ from ...shipping.interface import ShippingMethodData
 from ...webhook.event_types import WebhookEventSyncType
 from ...webhook.payloads import generate_checkout_payload
 from ...webhook.response_schemas.shipping import ListShippingMethodsSchema
-from ...webhook.transport.synchronous.transport import trigger_webhook_sync_promise
+from ...webhook.transport.synchronous.transport import (
+    prefetch_circuit_breaker_states,
+    trigger_webhook_sync_promise,
+)
 from ...webhook.utils import get_webhooks_for_event
 from ..models import Checkout
 
@@ -34,6 +37,7 @@ def list_shipping_methods_for_checkout(
 
     promised_responses = []
     payload = generate_checkout_payload(checkout, requestor)
+    prefetch_circuit_breaker_states(event_type, webhooks)
     for webhook in webhooks:
         promised_responses.append(
             trigger_webhook_sync_promise(
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+
+from ....product.models import ProductVariant
+from ....warehouse.stock_availability import (
+    is_stock_availability_table_enabled,
+    update_stock_availability,
+)
+from ....warehouse.tasks import update_stock_availability_in_pk_range_task
+from ...utils.batches import BatchProgress, get_pk_ranges, queryset_in_batches
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = "Recalculate the stock availability table for all product variants."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Number of variants recalculated in a single transaction.",
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=0,
+            help=(
+                "Split variants into the given number of ID ranges recalculated by "
+                "Celery tasks in parallel, instead of in this process."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if not is_stock_availability_table_enabled():
+            self.stdout.write("STOCK_AVAILABILITY_TABLE_ENABLED is not set, skipping.")
+            return
+        variants = ProductVariant.objects.all()
+        if options["shards"]:
+            pk_ranges = get_pk_ranges(variants, options["shards"])
+            for pk_range in pk_ranges:
+                update_stock_availability_in_pk_range_task.delay(*pk_range)
+            self.stdout.write(f"Scheduled {len(pk_ranges)} tasks")
+            return
+        progress = BatchProgress("update_stock_availability", variants.count())
+        for variant_ids in queryset_in_batches(
+            variants, options["batch_size"], progress
+        ):
+            update_stock_availability(variant_ids)
+            self.stdout.write(
+                f"Updated {progress.processed + len(variant_ids)} of "
+                f"{progress.total} variants"
+            )
@@ -0,0 +1,39 @@
+from .telemetry import MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_EVENT_PAYLOAD_STORED_BYTES = meter.create_metric(
+    "saleor.core.event_payload.stored_bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Size of the event payload files written to the storage.",
+)
+METRIC_EVENT_PAYLOAD_COMPRESSION_SAVED_BYTES = meter.create_metric(
+    "saleor.core.event_payload.compression_saved_bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Number of bytes saved by compressing event payload files.",
+)
+METRIC_EVENT_PAYLOAD_DEDUPLICATION_SAVED_BYTES = meter.create_metric(
+    "saleor.core.event_payload.deduplication_saved_bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Number of bytes saved by reusing already stored event payloads.",
+)
+
+
+def record_event_payload_stored(*, payload_size: int, stored_size: int) -> None:
+    meter.record(METRIC_EVENT_PAYLOAD_STORED_BYTES, stored_size, Unit.BYTE)
+    meter.record(
+        METRIC_EVENT_PAYLOAD_COMPRESSION_SAVED_BYTES,
+        payload_size - stored_size,
+        Unit.BYTE,
+    )
+
+
+def record_event_payload_deduplicated(payload_size: int) -> None:
+    meter.record(
+        METRIC_EVENT_PAYLOAD_DEDUPLICATION_SAVED_BYTES, payload_size, Unit.BYTE
+    )
@@ -0,0 +1,25 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0012_persistedquery"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        AddIndexConcurrently(
+            model_name="eventpayload",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["payload_hash"], name="event_payload_hash_idx"
+            ),
+        ),
+    ]
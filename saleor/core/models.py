@@ -1,15 +1,20 @@
 import datetime
+import hashlib
+import zlib
 from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from django.contrib.postgres.indexes import GinIndex, PostgresIndex
+from django.conf import settings
+from django.contrib.postgres.indexes import BTreeIndex, GinIndex, PostgresIndex
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
+from django.utils import timezone
 from django.utils.crypto import get_random_string
 from storages.utils import safe_join
 
 from . import EventDeliveryStatus, JobStatus, private_storage
+from .metrics import record_event_payload_deduplicated, record_event_payload_stored
 from .utils.json_serializer import CustomJsonEncoder
 
 
@@ -156,52 +161,128 @@ class Job(models.Model):
         abstract = True
 
 
+def get_payload_hash(payload_bytes: bytes) -> str:
+    return hashlib.sha256(payload_bytes).hexdigest()
+
+
 class EventPayloadManager(models.Manager["EventPayload"]):
-    @transaction.atomic
     def create_with_payload_file(self, payload: str) -> "EventPayload":
-        obj = super().create()
-        obj.save_payload_file(payload)
-        return obj
+        return self.bulk_create_with_payload_files([self.model()], [payload])[0]
 
     @transaction.atomic
     def bulk_create_with_payload_files(
-        self, objs: Iterable["EventPayload"], payloads=Iterable[str]
+        self, objs: Iterable["EventPayload"], payloads: Iterable[str]
     ) -> list["EventPayload"]:
-        created_objs = self.bulk_create(objs)
-        for obj, payload_data in zip(created_objs, payloads, strict=False):
-            obj.save_payload_file(payload_data, save_instance=False)
+        """Save payloads in files, reusing stored payloads with the same content.
+
+        Payloads are addressed by the hash of their content. Objects whose payload is
+        already stored (in the database or earlier in `objs`) are pointed to the
+        existing row instead of creating a new one, so the deliveries referencing
+        them share the payload; it's deleted once no delivery references it.
+        Only payloads created within `EVENT_PAYLOAD_DELETE_PERIOD` are reused, as
+        older ones are about to be deleted. Reused rows are locked until the end of
+        the transaction, so they can't be deleted before the new deliveries are
+        created.
+        """
+        objs = list(objs)
+        payloads_bytes = [payload.encode("utf-8") for payload in payloads]
+        payload_hashes = [
+            get_payload_hash(payload_bytes) for payload_bytes in payloads_bytes
+        ]
+        stored_payloads = {
+            stored_payload.payload_hash: stored_payload
+            for stored_payload in self.filter(
+                payload_hash__in=set(payload_hashes),
+                created_at__gt=timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD,
+            )
+            .order_by("pk")
+            .select_for_update(of=("self",))
+        }
+
+        objs_to_create = []
+        payloads_to_save = []
+        for obj, payload_bytes, payload_hash in zip(
+            objs, payloads_bytes, payload_hashes, strict=False
+        ):
+            obj.payload_hash = payload_hash
+            if payload_hash in stored_payloads:
+                record_event_payload_deduplicated(len(payload_bytes))
+                continue
+            stored_payloads[payload_hash] = obj
+            objs_to_create.append(obj)
+            payloads_to_save.append(payload_bytes)
+
+        created_objs = self.bulk_create(objs_to_create)
+        for obj, payload_bytes in zip(created_objs, payloads_to_save, strict=False):
+            obj.save_payload_bytes(payload_bytes, save_instance=False)
         self.bulk_update(created_objs, ["payload_file"])
-        return created_objs
+
+        for obj in objs:
+            stored_payload = stored_payloads[obj.payload_hash]
+            if stored_payload is not obj:
+                obj.use_stored_payload(stored_payload)
+        return objs
 
 
 class EventPayload(models.Model):
     PAYLOADS_DIR = "payloads"
+    COMPRESSED_FILE_SUFFIX = ".zlib"
 
     payload = models.TextField(default="")
     payload_file = models.FileField(
         storage=private_storage, upload_to=PAYLOADS_DIR, null=True
     )
+    # SHA-256 of the payload saved in the file, used to reuse identical payloads.
+    payload_hash = models.CharField(max_length=64, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
 
     objects = EventPayloadManager()
 
+    class Meta:
+        indexes = [
+            BTreeIndex(fields=["payload_hash"], name="event_payload_hash_idx"),
+        ]
+
     # TODO (PE-568): change typing of return payload to `bytes` to avoid unnecessary decoding.
     def get_payload(self):
         if self.payload_file:
             with self.payload_file.open("rb") as f:
                 payload_data = f.read()
-                return payload_data.decode("utf-8")
+            if self.payload_file.name.endswith(self.COMPRESSED_FILE_SUFFIX):
+                payload_data = zlib.decompress(payload_data)
+            return payload_data.decode("utf-8")
         return self.payload
 
     def save_payload_file(self, payload_data: str, save_instance=True):
-        payload_bytes = payload_data.encode("utf-8")
+        self.save_payload_bytes(payload_data.encode("utf-8"), save_instance)
+
+    def save_payload_bytes(self, payload_bytes: bytes, save_instance=True):
+        self.payload_hash = get_payload_hash(payload_bytes)
         prefix = get_random_string(length=12)
         file_name = f"{self.pk}.json"
+        file_content = payload_bytes
+        if level := settings.EVENT_PAYLOAD_COMPRESSION_LEVEL:
+            compressed_bytes = zlib.compress(payload_bytes, level)
+            # small payloads don't benefit from the compression
+            if len(compressed_bytes) < len(payload_bytes):
+                file_name += self.COMPRESSED_FILE_SUFFIX
+                file_content = compressed_bytes
         file_path = safe_join(prefix, file_name)
-        self.payload_file.save(
-            file_path, ContentFile(payload_bytes), save=save_instance
+        self.payload_file.save(file_path, ContentFile(file_content), save=save_instance)
+        record_event_payload_stored(
+            payload_size=len(payload_bytes), stored_size=len(file_content)
         )
 
+    def use_stored_payload(self, stored_payload: "EventPayload"):
+        """Turn the unsaved instance into the given, already stored payload."""
+        self.pk = stored_payload.pk
+        self.payload = stored_payload.payload
+        self.payload_file = stored_payload.payload_file.name
+        self.payload_hash = stored_payload.payload_hash
+        self.created_at = stored_payload.created_at
+        self._state.adding = False
+        self._state.db = stored_payload._state.db
+
     def save_as_file(self):
         payload_data = self.payload
         self.payload = ""
@@ -209,6 +290,17 @@ class EventPayload(models.Model):
         self.save_payload_file(payload_data)
 
 
+class PersistedQuery(models.Model):
+    """GraphQL document registered to be executed by its SHA-256 hash."""
+
+    hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("pk",)
+
+
 class EventDelivery(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(
@@ -44,6 +44,8 @@ class NoValidationSearchVector(SearchVector, NoValidationSearchVectorCombinable)
     and/or over clause.
     """
 
+    weight: Value | None
+
     def __init__(self, *expressions, config=None, weight=None):
         processed = []
         for expr in expressions:
@@ -150,3 +152,28 @@ class FlatConcat(Expression):
 class FlatConcatSearchVector(FlatConcat):
     max_expression_count = settings.INDEX_MAXIMUM_EXPR_COUNT
     silent_drop_expression = True
+
+
+def get_weighted_search_documents(
+    search_vectors: list[NoValidationSearchVector],
+) -> dict[str, str]:
+    """Return the texts of the search vectors joined per weight.
+
+    The documents can be turned into a `tsvector` on the database side with
+    `setweight(to_tsvector(config, document), weight)`, without compiling a separate
+    expression for every vector. Only vectors built from `Value` expressions
+    are supported, and vectors over `INDEX_MAXIMUM_EXPR_COUNT` are dropped the same
+    way as in `FlatConcatSearchVector`.
+    """
+    max_expression_count = FlatConcatSearchVector.max_expression_count
+    if max_expression_count is not None:
+        search_vectors = search_vectors[:max_expression_count]
+
+    texts_per_weight: dict[str, list[str]] = {}
+    for search_vector in search_vectors:
+        weight = search_vector.weight.value if search_vector.weight else "D"
+        texts = texts_per_weight.setdefault(weight, [])
+        for expression in search_vector.get_source_expressions():
+            if expression.value is not None:
+                texts.append(str(expression.value))
+    return {weight: " ".join(texts) for weight, texts in texts_per_weight.items()}
@@ -1,10 +1,11 @@
+import datetime
 import logging
 
 from celery import Task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db import connections
+from django.db import connections, transaction
 from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
@@ -78,20 +79,46 @@ def delete_event_payloads_task(expiration_date=None):
     ids = list(payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE])
     if ids:
         if expiration_date > timezone.now():
-            qs = EventPayload.objects.filter(pk__in=ids)
-            files_to_delete = [
-                event_payload.payload_file.name
-                for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                if event_payload.payload_file
-            ]
             with allow_writer():
-                qs.delete()
-            delete_files_from_private_storage_task.delay(files_to_delete)
-            delete_event_payloads_task.delay(expiration_date)
+                deleted_payloads = _delete_unused_event_payloads(ids, delete_period)
+            if deleted_payloads:
+                delete_files_from_private_storage_task.delay(
+                    [
+                        event_payload.payload_file.name
+                        for event_payload in deleted_payloads
+                        if event_payload.payload_file
+                    ]
+                )
+                delete_event_payloads_task.delay(expiration_date)
         else:
             task_logger.error("Task invocation time limit reached, aborting task")
 
 
+def _delete_unused_event_payloads(
+    ids: list[int], delete_period: datetime.datetime
+) -> list[EventPayload]:
+    """Delete the payloads unless deliveries created in the meantime reuse them.
+
+    Payloads with the same content are reused by new deliveries, so the payloads
+    selected on the replica are checked again on the writer. Payloads locked by
+    transactions creating deliveries that reuse them are skipped.
+    """
+    valid_deliveries = EventDelivery.objects.filter(
+        created_at__gt=delete_period, payload_id=OuterRef("id")
+    )
+    with transaction.atomic():
+        payloads = list(
+            EventPayload.objects.filter(pk__in=ids)
+            .filter(~Exists(valid_deliveries))
+            .select_for_update(of=("self",), skip_locked=True)
+            .only("pk", "payload_file")
+        )
+        EventPayload.objects.filter(
+            pk__in=[payload.pk for payload in payloads]
+        ).delete()
+    return payloads
+
+
 @app.task
 def delete_files_from_storage_task(paths):
     for path in paths:
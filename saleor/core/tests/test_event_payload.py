@@ -1,6 +1,10 @@
+import datetime
+
 import pytest
 from django.core.files.base import ContentFile
+from django.utils import timezone
 from django.utils.crypto import get_random_string
+from freezegun import freeze_time
 from storages.utils import safe_join
 
 from ..models import EventPayload
@@ -37,3 +41,87 @@ def test_reading_event_payload_saved_as_string(payload_data):
 
     # then
     assert read_payload == payload_data
+
+
+def test_save_payload_file_compresses_payload(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_COMPRESSION_LEVEL = 6
+    payload_data = payload_data * 10
+    payload = EventPayload.objects.create()
+
+    # when
+    payload.save_payload_file(payload_data)
+
+    # then
+    payload.refresh_from_db()
+    assert payload.payload_file.name.endswith(EventPayload.COMPRESSED_FILE_SUFFIX)
+    assert payload.payload_file.size < len(payload_data.encode("utf-8"))
+    assert payload.payload_hash
+    assert payload.get_payload() == payload_data
+
+
+def test_save_payload_file_compression_disabled(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_COMPRESSION_LEVEL = 0
+    payload = EventPayload.objects.create()
+
+    # when
+    payload.save_payload_file(payload_data)
+
+    # then
+    assert payload.payload_file.name.endswith(".json")
+    assert payload.get_payload() == payload_data
+
+
+def test_create_with_payload_file_reuses_stored_payload(payload_data):
+    # given
+    stored_payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # when
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # then
+    assert payload.pk == stored_payload.pk
+    assert payload.payload_file.name == stored_payload.payload_file.name
+    assert EventPayload.objects.count() == 1
+    assert payload.get_payload() == payload_data
+
+
+def test_create_with_payload_file_skips_payload_older_than_delete_period(
+    payload_data, settings
+):
+    # given
+    created_at = (
+        timezone.now()
+        - settings.EVENT_PAYLOAD_DELETE_PERIOD
+        - datetime.timedelta(seconds=1)
+    )
+    with freeze_time(created_at):
+        stored_payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # when
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # then
+    assert payload.pk != stored_payload.pk
+    assert EventPayload.objects.count() == 2
+    assert payload.get_payload() == payload_data
+
+
+def test_bulk_create_with_payload_files_deduplicates_payloads(payload_data):
+    # given
+    other_payload_data = payload_data.replace("ćma", "mucha")
+    objs = [EventPayload(), EventPayload(), EventPayload()]
+
+    # when
+    payloads = EventPayload.objects.bulk_create_with_payload_files(
+        objs, [payload_data, other_payload_data, payload_data]
+    )
+
+    # then
+    assert payloads == objs
+    assert EventPayload.objects.count() == 2
+    assert payloads[0].pk == payloads[2].pk
+    assert payloads[0].pk != payloads[1].pk
+    assert payloads[1].get_payload() == other_payload_data
+    assert payloads[2].get_payload() == payload_data
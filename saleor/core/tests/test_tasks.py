@@ -8,6 +8,7 @@ from ...webhook.event_types import WebhookEventAsyncType
 from .. import private_storage
 from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..tasks import (
+    _delete_unused_event_payloads,
     delete_event_payloads_task,
     delete_files_from_storage_task,
     delete_from_storage_task,
@@ -44,7 +45,9 @@ def test_delete_event_payloads_task(webhook, settings):
     payload_files = {}
     for creation_time in [before_delete_period, after_delete_period]:
         with freeze_time(creation_time):
-            payload = EventPayload.objects.create_with_payload_file(payload="dummy")
+            payload = EventPayload.objects.create_with_payload_file(
+                payload=f"dummy {creation_time}"
+            )
             payload_files[creation_time] = payload.payload_file.name
             delivery = EventDelivery.objects.create(
                 event_type=WebhookEventAsyncType.ANY,
@@ -65,6 +68,31 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_unused_event_payloads_skips_reused_payload(webhook, settings):
+    # given
+    delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    with freeze_time(delete_period - datetime.timedelta(seconds=1)):
+        payload = EventPayload.objects.create_with_payload_file(payload="dummy")
+        unused_payload = EventPayload.objects.create_with_payload_file(payload="unused")
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+        )
+    # delivery reusing the payload after it was selected for deletion
+    EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+    )
+
+    # when
+    deleted_payloads = _delete_unused_event_payloads(
+        [payload.pk, unused_payload.pk], delete_period
+    )
+
+    # then
+    assert deleted_payloads == [unused_payload]
+    assert EventPayload.objects.filter(pk=payload.pk).exists()
+    assert EventDelivery.objects.filter(payload=payload).count() == 2
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
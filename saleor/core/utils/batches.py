@@ -1,7 +1,95 @@
-from django.db.models import QuerySet
+import logging
+import math
+import time
+from collections.abc import Iterator
+from typing import Any, NamedTuple
 
+from django.db.models import Max, Min, Model, QuerySet
 
-def queryset_in_batches(queryset: QuerySet, batch_size: int):
+from ..telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+logger = logging.getLogger(__name__)
+
+METRIC_BATCHES_ROWS = meter.create_metric(
+    "saleor.batches.rows",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of rows processed in batches by background jobs.",
+)
+METRIC_BATCHES_DURATION = meter.create_metric(
+    "saleor.batches.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of processing a single batch by background jobs.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+BATCHES_JOB_ATTRIBUTE = "saleor.batches.job"
+
+
+class BatchProgress:
+    """Track the progress of a job processing rows in batches.
+
+    The number of processed rows and the duration of every batch are recorded as
+    metrics with the job name as an attribute.
+    """
+
+    def __init__(self, job_name: str, total: int | None = None):
+        self.job_name = job_name
+        self.total = total
+        self.processed = 0
+        self.batches = 0
+        self.started_at = time.monotonic()
+        self._batch_started_at = self.started_at
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed else 0.0
+
+    @property
+    def percent(self) -> float | None:
+        if not self.total:
+            return None
+        return min(100.0, self.processed * 100 / self.total)
+
+    def update(self, rows_count: int):
+        now = time.monotonic()
+        self.processed += rows_count
+        self.batches += 1
+        attributes = {BATCHES_JOB_ATTRIBUTE: self.job_name}
+        meter.record(METRIC_BATCHES_ROWS, rows_count, Unit.COUNT, attributes=attributes)
+        meter.record(
+            METRIC_BATCHES_DURATION,
+            now - self._batch_started_at,
+            Unit.SECOND,
+            attributes=attributes,
+        )
+        self._batch_started_at = now
+        logger.debug(
+            "%s: processed %d rows in %d batches (%.1f rows/s).",
+            self.job_name,
+            self.processed,
+            self.batches,
+            self.rows_per_second,
+        )
+
+
+class PkRange(NamedTuple):
+    """Inclusive range of primary keys; serializable as a Celery task argument."""
+
+    start: int
+    end: int
+
+
+def queryset_in_batches(
+    queryset: QuerySet, batch_size: int, progress: BatchProgress | None = None
+):
     """Slice a queryset into batches."""
     start_pk = 0
 
@@ -14,4 +102,63 @@ def queryset_in_batches(queryset: QuerySet, batch_size: int):
 
         yield pks
 
+        if progress:
+            progress.update(len(pks))
         start_pk = pks[-1]
+
+
+def queryset_rows_in_batches(
+    queryset: QuerySet, batch_size: int, progress: BatchProgress | None = None
+) -> Iterator[list[Any]]:
+    """Yield batches of the queryset rows, paginating by the primary key.
+
+    Unlike `queryset_in_batches`, model instances (or dicts for `values()`
+    querysets, which must include the primary key) are returned directly, so the
+    rows don't need to be fetched again by their primary keys. Every batch is
+    a separate query, so no transaction is held open between batches.
+    """
+    pk_name = queryset.model._meta.pk.attname
+    last_pk = None
+
+    while True:
+        qs = queryset.order_by("pk")
+        if last_pk is not None:
+            qs = qs.filter(pk__gt=last_pk)
+        rows = list(qs[:batch_size])
+
+        if not rows:
+            break
+
+        yield rows
+
+        if progress:
+            progress.update(len(rows))
+        last_row = rows[-1]
+        if isinstance(last_row, Model):
+            last_pk = last_row.pk
+        else:
+            last_pk = last_row["pk"] if "pk" in last_row else last_row[pk_name]
+
+
+def get_pk_ranges(queryset: QuerySet, shards_count: int) -> list[PkRange]:
+    """Split primary keys of the queryset into ranges that can be processed in parallel.
+
+    The range between the lowest and the highest primary key is split into
+    `shards_count` ranges of equal width, e.g. to be processed by separate Celery
+    tasks with `queryset_in_batches(filter_by_pk_range(queryset, pk_range), ...)`.
+    """
+    limits = queryset.aggregate(min_pk=Min("pk"), max_pk=Max("pk"))
+    min_pk, max_pk = limits["min_pk"], limits["max_pk"]
+    if min_pk is None or max_pk is None:
+        return []
+
+    width = math.ceil((max_pk - min_pk + 1) / max(shards_count, 1))
+    return [
+        PkRange(start, min(start + width - 1, max_pk))
+        for start in range(min_pk, max_pk + 1, width)
+    ]
+
+
+def filter_by_pk_range(queryset: QuerySet, pk_range: PkRange) -> QuerySet:
+    start, end = pk_range
+    return queryset.filter(pk__gte=start, pk__lte=end)
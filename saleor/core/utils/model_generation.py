@@ -0,0 +1,149 @@
+import pickle
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, TypeVar
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from .cache import CacheDict
+
+T = TypeVar("T")
+
+MODEL_GENERATION_CACHE_KEY = "dataloader_model_generation"
+
+Generation = tuple[int, ...]
+# Keys of values cached in the process memory; callers prefix the keys with their
+# namespace, e.g. a channel ID.
+LocalCacheKey = tuple[Hashable, ...]
+
+
+def _new_generation() -> int:
+    # Use a time based value, so the counter recreated after eviction from the cache
+    # never matches a generation remembered by other processes.
+    return time.time_ns()
+
+
+def get_generation(keys: Iterable[str]) -> Generation:
+    """Return the generation of the cache keys, changed whenever any is invalidated.
+
+    Generations are shared by all processes through the cache, so data stored in
+    the memory of a process with the generation is valid as long as it matches.
+    """
+    keys = list(keys)
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, _new_generation(), timeout=None)
+            generations[key] = cache.get(key)
+    return tuple(generations[key] for key in keys)
+
+
+def _bump_generation(keys: list[str]):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_generation(), timeout=None)
+
+
+def invalidate_generation(keys: Iterable[str]):
+    """Invalidate the data stored with the generation of the keys by all processes.
+
+    The generation is bumped after the transaction is committed, so other processes
+    can't store the state from before the change with the new generation.
+    """
+    keys = list(keys)
+    transaction.on_commit(lambda: _bump_generation(keys))
+
+
+def _get_generation_key(model: type[Model]) -> str:
+    return f"{MODEL_GENERATION_CACHE_KEY}:{model._meta.label_lower}"
+
+
+def get_models_generation(models: Iterable[type[Model]]) -> Generation:
+    """Return the generation of the models, changed whenever any of them changes."""
+    return get_generation(_get_generation_key(model) for model in models)
+
+
+def invalidate_model_generation(model: type[Model]):
+    """Invalidate the data derived from the model by all processes.
+
+    Model signals call it automatically for models passed to `watch_model_changes`;
+    code using bulk operations, which don't send signals, has to call it explicitly.
+    """
+    invalidate_generation([_get_generation_key(model)])
+
+
+def _handle_model_change(sender, **_kwargs):
+    invalidate_model_generation(sender)
+
+
+def watch_model_changes(model: type[Model]):
+    for signal in (post_save, post_delete):
+        signal.connect(
+            _handle_model_change,
+            sender=model,
+            dispatch_uid=f"model_generation_{model._meta.label_lower}",
+        )
+
+
+class GenerationLocalCache:
+    """Values cached in the process memory for the generation they were loaded with.
+
+    Entries are valid until the generation changes or their timeout passes. Values
+    are stored pickled and a fresh copy is returned on every call, so instances are
+    never shared between callers.
+    """
+
+    def __init__(self, size: int):
+        self._cache: CacheDict = CacheDict(size)
+        self._lock = threading.Lock()
+
+    def get_many(
+        self, keys: Iterable[LocalCacheKey], generation: Generation
+    ) -> dict[LocalCacheKey, Any]:
+        now = time.monotonic()
+        with self._lock:
+            entries = {key: self._cache.get(key) for key in keys}
+        values = {}
+        for key, entry in entries.items():
+            if entry is None:
+                continue
+            entry_generation, expires_at, data = entry
+            if entry_generation == generation and expires_at > now:
+                values[key] = pickle.loads(data)
+        return values
+
+    def set_many(
+        self, values: dict[LocalCacheKey, Any], generation: Generation, timeout: float
+    ):
+        expires_at = time.monotonic() + timeout
+        entries = {
+            key: (generation, expires_at, pickle.dumps(value))
+            for key, value in values.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._cache[key] = entry
+
+    def get_or_load(
+        self,
+        key: LocalCacheKey,
+        generation: Generation,
+        timeout: float,
+        load: Callable[[], T],
+    ) -> T:
+        values = self.get_many([key], generation)
+        if key in values:
+            return values[key]
+        value = load()
+        self.set_many({key: value}, generation, timeout)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,98 @@
+from ....product.models import Product
+from ..batches import (
+    BatchProgress,
+    PkRange,
+    filter_by_pk_range,
+    get_pk_ranges,
+    queryset_in_batches,
+    queryset_rows_in_batches,
+)
+
+
+def test_queryset_in_batches(product_list):
+    # given
+    queryset = Product.objects.all()
+    progress = BatchProgress("test", total=len(product_list))
+
+    # when
+    batches = list(queryset_in_batches(queryset, 2, progress=progress))
+
+    # then
+    pks = sorted(product.pk for product in product_list)
+    assert batches == [pks[:2], pks[2:]]
+    assert progress.processed == len(product_list)
+    assert progress.batches == 2
+    assert progress.percent == 100
+
+
+def test_queryset_rows_in_batches(product_list, django_assert_num_queries):
+    # given
+    queryset = Product.objects.all()
+
+    # when
+    with django_assert_num_queries(3):
+        batches = list(queryset_rows_in_batches(queryset, 2))
+
+    # then
+    pks = sorted(product.pk for product in product_list)
+    assert [[product.pk for product in batch] for batch in batches] == [
+        pks[:2],
+        pks[2:],
+    ]
+
+
+def test_queryset_rows_in_batches_values(product_list):
+    # given
+    queryset = Product.objects.values("id", "name")
+
+    # when
+    batches = list(queryset_rows_in_batches(queryset, 2))
+
+    # then
+    rows = [row for batch in batches for row in batch]
+    assert rows == [
+        {"id": product.pk, "name": product.name}
+        for product in sorted(product_list, key=lambda product: product.pk)
+    ]
+
+
+def test_get_pk_ranges(product_list):
+    # given
+    queryset = Product.objects.all()
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    pk_ranges = get_pk_ranges(queryset, 2)
+
+    # then
+    assert pk_ranges[0].start == pks[0]
+    assert pk_ranges[-1].end == pks[-1]
+    sharded_pks = [
+        pk
+        for pk_range in pk_ranges
+        for pk in filter_by_pk_range(queryset, pk_range)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    ]
+    assert sharded_pks == pks
+
+
+def test_get_pk_ranges_empty_queryset(db):
+    # when
+    pk_ranges = get_pk_ranges(Product.objects.all(), 4)
+
+    # then
+    assert pk_ranges == []
+
+
+def test_filter_by_pk_range_from_serialized_range(product_list):
+    # given
+    product = product_list[0]
+
+    # when
+    queryset = filter_by_pk_range(
+        Product.objects.all(), PkRange(*[product.pk, product.pk])
+    )
+
+    # then
+    assert list(queryset) == [product]
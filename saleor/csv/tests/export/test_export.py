@@ -1,4 +1,5 @@
 import datetime
+import gzip
 import json
 import shutil
 from tempfile import NamedTemporaryFile
@@ -6,7 +7,6 @@ from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -19,7 +19,6 @@ from ....product.models import Product, ProductChannelListing
 from ....warehouse.models import Allocation
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
     create_file_with_headers,
     export_products,
     export_products_in_batches,
@@ -28,6 +27,7 @@ from ...utils.export import (
     parse_input,
     save_csv_file_in_export_file,
 )
+from ...utils.file_writers import ExportFileWriter
 
 
 @pytest.mark.parametrize(
@@ -60,8 +60,8 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -70,7 +70,11 @@ def test_export_products(
 
     # then
     create_file_with_headers_mock.assert_called_once_with(
-        ["id", "name", "variant id", "variant sku", "charge taxes"], ",", file_type
+        ANY,
+        ["id", "name", "variant id", "variant sku", "charge taxes"],
+        ",",
+        file_type,
+        False,
     )
     assert export_products_in_batches_mock.call_count == 1
     args, kwargs = export_products_in_batches_mock.call_args
@@ -84,12 +88,11 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku", expected_charge_taxes},
         ["id", "name", "variants__id", "variants__sku", expected_charge_taxes],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, ANY, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -112,14 +115,16 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(["id"], ",", file_type)
+    create_file_with_headers_mock.assert_called_once_with(
+        ANY, ["id"], ",", file_type, False
+    )
 
     assert export_products_in_batches_mock.call_count == 1
     args, kwargs = export_products_in_batches_mock.call_args
@@ -131,12 +136,11 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, ANY, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -163,8 +167,8 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -175,7 +179,9 @@ def test_export_products_filter_is_published(
     )
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(["id"], ",", file_type)
+    create_file_with_headers_mock.assert_called_once_with(
+        ANY, ["id"], ",", file_type, False
+    )
 
     assert export_products_in_batches_mock.call_count == 1
     args, _ = export_products_in_batches_mock.call_args
@@ -188,12 +194,11 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, ANY, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -219,8 +224,8 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -235,14 +240,17 @@ def test_export_products_filter_collections(
     )
 
     # then
-    create_file_with_headers_mock.assert_called_once_with(["id"], ",", file_type)
+    create_file_with_headers_mock.assert_called_once_with(
+        ANY, ["id"], ",", file_type, False
+    )
 
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    mock_writer.close.assert_called_once_with()
+    save_file_mock.assert_called_once_with(user_export_file, ANY, ANY)
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -266,15 +274,15 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
 
     # then
     create_file_with_headers_mock.assert_called_once_with(
-        ["id", "name"], ",", file_type
+        ANY, ["id", "name"], ",", file_type, False
     )
 
     assert export_products_in_batches_mock.call_count == 1
@@ -286,14 +294,12 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(app_export_file, ANY, ANY)
 
 
 @patch("saleor.plugins.manager.PluginsManager.product_export_completed")
@@ -381,38 +387,55 @@ def test_get_product_queryset_filter_stock_availability(
     assert queryset.count() == 1
 
 
-def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
+def test_create_file_with_headers_csv():
     # given
     file_headers = ["id", "name", "collections"]
-
-    assert not user_export_file.content_file
+    temp_file = NamedTemporaryFile()
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(temp_file, file_headers, ",", FileTypes.CSV)
+    writer.close()
 
     # then
-    assert csv_file
-
-    file_content = csv_file.read().decode().split("\r\n")
+    temp_file.seek(0)
+    file_content = temp_file.read().decode().split("\r\n")
 
     assert ",".join(file_headers) in file_content
 
-    shutil.rmtree(tmpdir)
+    temp_file.close()
 
 
-def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
+def test_create_file_with_headers_csv_compressed():
     # given
     file_headers = ["id", "name", "collections"]
-
-    assert not user_export_file.content_file
+    temp_file = NamedTemporaryFile()
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(
+        temp_file, file_headers, ",", FileTypes.CSV, compress=True
+    )
+    writer.close()
 
     # then
-    assert xlsx_file
+    temp_file.seek(0)
+    file_content = gzip.decompress(temp_file.read()).decode().split("\r\n")
+
+    assert ",".join(file_headers) in file_content
+
+    temp_file.close()
+
+
+def test_create_file_with_headers_xlsx():
+    # given
+    file_headers = ["id", "name", "collections"]
+    temp_file = NamedTemporaryFile(suffix=".xlsx")
 
-    wb_obj = openpyxl.load_workbook(xlsx_file)
+    # when
+    writer = create_file_with_headers(temp_file, file_headers, ",", FileTypes.XLSX)
+    writer.close()
+
+    # then
+    wb_obj = openpyxl.load_workbook(temp_file.name)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -420,7 +443,7 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
 
     assert headers == file_headers
 
-    shutil.rmtree(tmpdir)
+    temp_file.close()
 
 
 def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
@@ -438,73 +461,6 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
-    # given
-    export_data = [
-        {"id": "123", "name": "test1", "collections": "coll1"},
-        {"id": "345", "name": "test2"},
-    ]
-    headers = ["id", "name", "collections"]
-    delimiter = ","
-
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing="")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
-
-    # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
-
-    # then
-    user_export_file.refresh_from_db()
-
-    file_content = temp_file.read().decode().split("\r\n")
-    assert ",".join(headers) in file_content
-    assert ",".join(export_data[0].values()) in file_content
-    assert (",".join(export_data[1].values()) + ",") in file_content
-
-    temp_file.close()
-    shutil.rmtree(tmpdir)
-
-
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
-    # given
-    export_data = [
-        {"id": "123", "name": "test1", "collections": "coll1"},
-        {"id": "345", "name": "test2"},
-    ]
-    expected_headers = ["id", "name", "collections"]
-
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=""
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
-
-    # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
-
-    # then
-    user_export_file.refresh_from_db()
-
-    workbook = openpyxl.load_workbook(temp_file)
-
-    sheet = workbook.worksheets[0]
-    assert sheet.cell(1, 1).value == expected_headers[0]
-    assert sheet.cell(1, 2).value == expected_headers[1]
-    assert sheet.cell(1, 3).value == expected_headers[2]
-    assert sheet.cell(3, 1).value == export_data[0]["id"]
-    assert sheet.cell(3, 2).value == export_data[0]["name"]
-    assert sheet.cell(3, 3).value == export_data[0]["collections"]
-    assert sheet.cell(4, 1).value == export_data[1]["id"]
-    assert sheet.cell(4, 2).value == export_data[1]["name"]
-    assert sheet.cell(4, 3).value is None
-
-    temp_file.close()
-    shutil.rmtree(tmpdir)
-
-
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
 def test_export_products_in_batches_for_csv(
     product_list,
@@ -527,10 +483,8 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
     temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(temp_file, expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -538,10 +492,9 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
     )
+    writer.close()
 
     # then
 
@@ -556,6 +509,7 @@ def test_export_products_in_batches_for_csv(
             product_data.append(str(variant.sku))
             expected_data.append(product_data)
 
+    temp_file.seek(0)
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in file
@@ -564,6 +518,7 @@ def test_export_products_in_batches_for_csv(
     for row in expected_data:
         assert ",".join(row) in file_content
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -597,10 +552,8 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
     temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(temp_file, expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -608,10 +561,9 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
+    writer.close()
 
     # then
     expected_data = []
@@ -626,7 +578,7 @@ def test_export_products_in_batches_for_xlsx(
             product_data.append(variant.sku)
             expected_data.append(product_data)
 
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(temp_file.name)
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -643,9 +595,30 @@ def test_export_products_in_batches_for_xlsx(
     for row in expected_data:
         assert row in data
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
+def test_export_products_saves_compressed_csv(
+    product_list, user_export_file, media_root, settings
+):
+    # given
+    settings.EXPORT_FILES_GZIP_ENABLED = True
+    export_info = {"fields": [ProductFieldEnum.NAME.value]}
+
+    # when
+    export_products(user_export_file, {"all": ""}, export_info, FileTypes.CSV)
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.content_file.name.endswith(".csv.gz")
+    with user_export_file.content_file.open("rb") as content_file:
+        file_content = gzip.decompress(content_file.read()).decode().split("\r\n")
+    assert file_content[0] == "id,name"
+    for product in product_list:
+        assert product.name in "".join(file_content)
+
+
 def test_parse_input():
     data = {
         "collections": None,
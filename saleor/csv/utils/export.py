@@ -1,17 +1,18 @@
 import datetime
 import uuid
+from collections.abc import Iterator
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Any
 
-import petl as etl
 from django.conf import settings
 from django.utils import timezone
 
 from ...core.db.connection import allow_writer
-from ...core.utils.batches import queryset_in_batches
+from ...core.utils.batches import BatchProgress, queryset_rows_in_batches
 from ...product.models import Product
 from .. import FileTypes
 from ..notifications import send_export_download_link_notification
+from .file_writers import CSVFileWriter, ExportFileWriter, XLSXFileWriter
 from .product_headers import get_product_export_fields_and_headers_info
 from .products_data import get_products_data
 
@@ -33,7 +34,10 @@ def export_products(
 ):
     from ...graphql.product.filters.product import ProductFilter
 
+    compress = file_type == FileTypes.CSV and settings.EXPORT_FILES_GZIP_ENABLED
     file_name = get_filename("product", file_type)
+    if compress:
+        file_name += ".gz"
     queryset = get_queryset(Product, ProductFilter, scope)
 
     (
@@ -42,20 +46,22 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
-
-    export_products_in_batches(
-        queryset,
-        export_info,
-        set(export_fields),
-        data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
-    )
+    # the file is written to the disk and uploaded to the storage in chunks,
+    # so it's never kept in memory as a whole
+    with NamedTemporaryFile(suffix=f".{file_type}") as temporary_file:
+        writer = create_file_with_headers(
+            temporary_file, file_headers, delimiter, file_type, compress
+        )
+        export_products_in_batches(
+            queryset,
+            export_info,
+            set(export_fields),
+            data_headers,
+            writer,
+        )
+        writer.close()
 
-    save_csv_file_in_export_file(export_file, temporary_file, file_name)
-    temporary_file.close()
+        save_csv_file_in_export_file(export_file, temporary_file, file_name)
     send_export_download_link_notification(export_file, "products")
 
 
@@ -109,17 +115,20 @@ def parse_input(data: Any) -> dict[str, str | dict]:
     return data
 
 
-def create_file_with_headers(file_headers: list[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
-
+def create_file_with_headers(
+    temporary_file: IO[bytes],
+    file_headers: list[str],
+    delimiter: str,
+    file_type: str,
+    compress: bool = False,
+) -> ExportFileWriter:
+    writer: ExportFileWriter
     if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
+        writer = CSVFileWriter(temporary_file, delimiter, compress=compress)
     else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
-
-    return temp_file
+        writer = XLSXFileWriter(temporary_file)
+    writer.write_rows([file_headers])
+    return writer
 
 
 def export_products_in_batches(
@@ -127,48 +136,39 @@ def export_products_in_batches(
     export_info: dict[str, list],
     export_fields: set[str],
     headers: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
+    export_data = get_products_export_data_in_batches(
+        queryset, export_info, export_fields
+    )
+    writer.write_rows(
+        [row.get(header, "") for header in headers] for row in export_data
+    )
+
+
+def get_products_export_data_in_batches(
+    queryset: "QuerySet",
+    export_info: dict[str, list],
+    export_fields: set[str],
+) -> Iterator[dict[str, str | bool]]:
+    """Yield export data of products, fetching them from the replica in batches."""
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
-        product_batch = (
-            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            .filter(pk__in=batch_pks)
-            .prefetch_related(
-                "attributevalues",
-                "variants",
-                "collections",
-                "media",
-                "product_type",
-                "category",
-            )
-        )
-        export_data = get_products_data(
+    # The export data is fetched with `values()` queries built on the batch, so
+    # only primary keys of the products are needed here.
+    progress = BatchProgress("csv.export_products")
+    for rows in queryset_rows_in_batches(
+        queryset.values("pk"), BATCH_SIZE, progress=progress
+    ):
+        product_batch = Product.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(pk__in=[row["pk"] for row in rows])
+        yield from get_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
-
-
-def append_to_file(
-    export_data: list[dict[str, str | bool]],
-    headers: list[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
-
 
 @allow_writer()
 def save_csv_file_in_export_file(
@@ -0,0 +1,60 @@
+import csv
+import gzip
+import io
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import IO, Any
+
+import openpyxl
+
+
+class ExportFileWriter(ABC):
+    """Write rows to the export file incrementally.
+
+    Rows are written as they come, so the memory usage doesn't depend on the number
+    of exported rows. `close` must be called to flush the data; the underlying file
+    is left open.
+    """
+
+    @abstractmethod
+    def write_rows(self, rows: Iterable[list[Any]]):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+
+class CSVFileWriter(ExportFileWriter):
+    def __init__(self, file: IO[bytes], delimiter: str = ",", compress: bool = False):
+        self.gzip_file = gzip.GzipFile(fileobj=file, mode="wb") if compress else None
+        self.text_file = io.TextIOWrapper(
+            self.gzip_file or file, encoding="utf-8", newline=""
+        )
+        self.writer = csv.writer(self.text_file, delimiter=delimiter)
+
+    def write_rows(self, rows: Iterable[list[Any]]):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.text_file.flush()
+        # detach the wrapper, so it doesn't close the underlying file
+        self.text_file.detach()
+        if self.gzip_file:
+            self.gzip_file.close()
+
+
+class XLSXFileWriter(ExportFileWriter):
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        # write-only workbook streams rows to a temporary file instead of keeping
+        # all cells in memory
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+
+    def write_rows(self, rows: Iterable[list[Any]]):
+        for row in rows:
+            self.sheet.append([None if value == "" else value for value in row])
+
+    def close(self):
+        self.workbook.save(self.file)
@@ -1105,6 +1105,8 @@ class User(ModelObjectType[models.User]):
 
 
 class UserCountableConnection(CountableConnection):
+    approximate_total_count = True
+
     class Meta:
         doc_category = DOC_CATEGORY_USERS
         node = User
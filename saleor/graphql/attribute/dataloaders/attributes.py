@@ -1,7 +1,7 @@
 from collections import defaultdict
 
 from ....attribute.models import Attribute, AttributeValue
-from ...core.dataloaders import DataLoader
+from ...core.dataloaders import DataLoader, ProcessCachedDataLoader
 
 
 class AttributeValuesByAttributeIdLoader(DataLoader[int, list[AttributeValue]]):
@@ -19,8 +19,9 @@ class AttributeValuesByAttributeIdLoader(DataLoader[int, list[AttributeValue]]):
         return [attribute_to_attributevalues[attribute_id] for attribute_id in keys]
 
 
-class AttributesByAttributeId(DataLoader[int, Attribute]):
+class AttributesByAttributeId(ProcessCachedDataLoader[int, Attribute]):
     context_key = "attributes_by_id"
+    cached_models = (Attribute,)
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
@@ -29,8 +30,9 @@ class AttributesByAttributeId(DataLoader[int, Attribute]):
         return [attributes.get(key) for key in keys]
 
 
-class AttributesBySlugLoader(DataLoader[str, Attribute]):
+class AttributesBySlugLoader(ProcessCachedDataLoader[str, Attribute]):
     context_key = "attributes_by_slug"
+    cached_models = (Attribute,)
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
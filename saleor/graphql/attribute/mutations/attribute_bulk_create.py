@@ -16,6 +16,7 @@ from ....attribute import (
 from ....attribute.error_codes import AttributeBulkCreateErrorCode
 from ....core.tracing import traced_atomic_transaction
 from ....core.utils import prepare_unique_slug
+from ....core.utils.model_generation import invalidate_model_generation
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...core import ResolveInfo
@@ -627,6 +628,7 @@ class AttributeBulkCreate(BaseMutation):
                 page_reference_types_to_create.extend(ref_types)
 
         models.Attribute.objects.bulk_create(attributes_to_create)
+        invalidate_model_generation(models.Attribute)
         models.AttributeValue.objects.bulk_create(values_to_create)
         if product_reference_types_to_create:
             ReferenceTypeModel = product_reference_types_to_create[0]._meta.model
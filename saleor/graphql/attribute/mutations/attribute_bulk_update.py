@@ -18,6 +18,7 @@ from ....attribute.lock_objects import (
     attribute_value_qs_select_for_update,
 )
 from ....core.tracing import traced_atomic_transaction
+from ....core.utils.model_generation import invalidate_model_generation
 from ....page.utils import mark_pages_search_vector_as_dirty_in_batches
 from ....product.utils.search_helpers import (
     mark_products_search_vector_as_dirty_in_batches,
@@ -731,6 +732,7 @@ class AttributeBulkUpdate(BaseMutation):
                     "external_reference",
                 ],
             )
+            invalidate_model_generation(models.Attribute)
             locked_ids = (
                 attribute_value_qs_select_for_update()
                 .filter(pk__in=[value.pk for value in values_to_remove])
@@ -1,17 +1,19 @@
 from ....channel.models import Channel
-from ...core.dataloaders import DataLoader
+from ...core.dataloaders import ProcessCachedDataLoader
 
 
-class ChannelByIdLoader(DataLoader[int, Channel]):
+class ChannelByIdLoader(ProcessCachedDataLoader[int, Channel]):
     context_key = "channel_by_id"
+    cached_models = (Channel,)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
         return [channels.get(channel_id) for channel_id in keys]
 
 
-class ChannelBySlugLoader(DataLoader[str, Channel]):
+class ChannelBySlugLoader(ProcessCachedDataLoader[str, Channel]):
     context_key = "channel_by_slug"
+    cached_models = (Channel,)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
@@ -22,6 +22,7 @@ from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
 from .context import SyncWebhookControlContext
+from .total_count import get_approximate_total_count
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
@@ -299,6 +300,8 @@ def connection_from_queryset_slice(
     if "total_count" in connection_type._meta.fields:
 
         def get_total_count():
+            if getattr(connection_type, "approximate_total_count", False):
+                return get_approximate_total_count(qs)
             return qs.count()
 
         return connection_type(
@@ -737,6 +740,10 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collection.")
+    # Use the counting strategy configured with `GRAPHQL_TOTAL_COUNT_*` settings,
+    # which may return approximate counts for large collections. Only lists of all
+    # rows of a table are estimated from the table statistics.
+    approximate_total_count = False
 
     @staticmethod
     def resolve_total_count(root, _info):
@@ -0,0 +1,36 @@
+from collections.abc import Hashable, Iterable
+from typing import cast
+
+from django.conf import settings
+
+from ...core.utils.model_generation import Generation, GenerationLocalCache
+
+DATALOADER_LOCAL_CACHE_SIZE = 10000
+
+_local_cache = GenerationLocalCache(DATALOADER_LOCAL_CACHE_SIZE)
+
+
+def get_cached_results[K: Hashable, R](
+    context_key: str, generation: Generation, keys: Iterable[K]
+) -> dict[K, R]:
+    """Return the results of the data loader cached in the process memory.
+
+    Only keys with results cached for the given generation of the models and not
+    expired yet are returned.
+    """
+    cached = _local_cache.get_many([(context_key, key) for key in keys], generation)
+    return {cast(K, key): result for (_, key), result in cached.items()}
+
+
+def store_results[K: Hashable, R](
+    context_key: str, generation: Generation, results: dict[K, R]
+):
+    _local_cache.set_many(
+        {(context_key, key): result for key, result in results.items()},
+        generation,
+        settings.DATALOADER_PROCESS_CACHE_TIMEOUT,
+    )
+
+
+def clear_local_dataloader_cache():
+    _local_cache.clear()
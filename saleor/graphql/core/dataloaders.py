@@ -1,17 +1,22 @@
 import threading
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from typing import TypeVar
 
+from django.conf import settings
+from django.db.models import Model
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
-from ...core.db.connection import allow_writer_in_context
+from ...core.db.connection import allow_writer, allow_writer_in_context
 from ...core.telemetry import saleor_attributes, tracer
+from ...core.utils.model_generation import get_models_generation, watch_model_changes
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
+from ..metrics import record_dataloader_cache_lookup
 from . import SaleorContext
 from .context import get_database_connection_name
+from .dataloader_cache import get_cached_results, store_results
 
 K = TypeVar("K")
 R = TypeVar("R")
@@ -85,6 +90,60 @@ class DataLoader[K, R](BaseLoader):
         raise NotImplementedError()
 
 
+class ProcessCachedDataLoader[K: Hashable, R](DataLoader[K, R]):
+    """Data loader caching its results in the process memory across requests.
+
+    Meant for reference data that rarely changes. Results are cached for
+    `DATALOADER_PROCESS_CACHE_TIMEOUT` seconds and invalidated whenever an instance
+    of any of `cached_models` is saved or deleted. Only loaders reading from the
+    replica use the cache, so mutations always see their own changes. Missing results
+    are loaded from the writer, as the replica may lag behind the commit that bumped
+    the generation they are cached with.
+    """
+
+    cached_models: tuple[type[Model], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for model in cls.cached_models:
+            watch_model_changes(model)
+
+    def _use_process_cache(self) -> bool:
+        return bool(settings.DATALOADER_PROCESS_CACHE_TIMEOUT) and (
+            self.database_connection_name == settings.DATABASE_CONNECTION_REPLICA_NAME
+        )
+
+    def batch_load_fn(  # pylint: disable=method-hidden
+        self, keys: Iterable[K]
+    ) -> Promise[list[R]]:
+        if not self._use_process_cache():
+            return super().batch_load_fn(keys)
+
+        keys = list(keys)
+        generation = get_models_generation(self.cached_models)
+        results: dict[K, R] = get_cached_results(self.context_key, generation, keys)
+        missing_keys = [key for key in keys if key not in results]
+        record_dataloader_cache_lookup(
+            self.context_key, hits=len(results), misses=len(missing_keys)
+        )
+        if not missing_keys:
+            return Promise.resolve([results[key] for key in keys])
+
+        def store_loaded_results(loaded: list[R]) -> list[R]:
+            loaded_results = dict(zip(missing_keys, loaded, strict=True))
+            store_results(self.context_key, generation, loaded_results)
+            results.update(loaded_results)
+            return [results[key] for key in keys]
+
+        self.database_connection_name = settings.DATABASE_CONNECTION_DEFAULT_NAME
+        try:
+            with allow_writer():
+                loaded_promise = super().batch_load_fn(missing_keys)
+        finally:
+            self.database_connection_name = settings.DATABASE_CONNECTION_REPLICA_NAME
+        return loaded_promise.then(store_loaded_results)
+
+
 class BaseThumbnailBySizeAndFormatLoader(
     DataLoader[tuple[int, int, str | None], Thumbnail]
 ):
@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+import pytest
+
+from ....channel.models import Channel
+from ...channel.dataloaders.by_self import ChannelBySlugLoader
+from ..context import SaleorContext, disallow_replica_in_context
+from ..dataloader_cache import clear_local_dataloader_cache
+
+
+@pytest.fixture(autouse=True)
+def _enable_dataloader_cache(settings):
+    settings.DATALOADER_PROCESS_CACHE_TIMEOUT = 60
+    clear_local_dataloader_cache()
+    yield
+    clear_local_dataloader_cache()
+
+
+def _load_channel(slug, context=None):
+    loader = ChannelBySlugLoader(context or SaleorContext())
+    return loader.batch_load_fn([slug]).get()[0]
+
+
+def test_process_cached_loader_reuses_results_across_requests(channel_USD):
+    # given
+    _load_channel(channel_USD.slug)
+    Channel.objects.filter(pk=channel_USD.pk).update(name="Updated name")
+
+    # when
+    channel = _load_channel(channel_USD.slug)
+
+    # then
+    assert channel.pk == channel_USD.pk
+    assert channel.name == channel_USD.name
+    assert channel is not _load_channel(channel_USD.slug)
+
+
+def test_process_cached_loader_caches_missing_results(channel_USD):
+    # when
+    channel = _load_channel("missing-channel")
+    cached_channel = _load_channel("missing-channel")
+
+    # then
+    assert channel is None
+    assert cached_channel is None
+
+
+def test_process_cached_loader_invalidated_on_save(
+    channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    _load_channel(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.name = "Updated name"
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    assert _load_channel(channel_USD.slug).name == "Updated name"
+
+
+def test_process_cached_loader_invalidated_on_delete(
+    channel_USD, channel_PLN, django_capture_on_commit_callbacks
+):
+    # given
+    _load_channel(channel_PLN.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_PLN.delete()
+
+    # then
+    assert _load_channel(channel_PLN.slug) is None
+
+
+def test_process_cached_loader_skips_cache_for_writer(channel_USD):
+    # given
+    _load_channel(channel_USD.slug)
+    Channel.objects.filter(pk=channel_USD.pk).update(name="Updated name")
+    context = SaleorContext()
+    disallow_replica_in_context(context)
+
+    # when
+    channel = _load_channel(channel_USD.slug, context)
+
+    # then
+    assert channel.name == "Updated name"
+
+
+def test_process_cached_loader_loads_missing_results_from_writer(channel_USD, settings):
+    # given
+    loader = ChannelBySlugLoader(SaleorContext())
+    connection_names = []
+    batch_load = ChannelBySlugLoader.batch_load
+
+    def record_connection_name(self, keys):
+        connection_names.append(self.database_connection_name)
+        return batch_load(self, keys)
+
+    # when
+    with patch.object(ChannelBySlugLoader, "batch_load", record_connection_name):
+        channel = loader.batch_load_fn([channel_USD.slug]).get()[0]
+
+    # then
+    assert channel.pk == channel_USD.pk
+    assert connection_names == [settings.DATABASE_CONNECTION_DEFAULT_NAME]
+    assert loader.database_connection_name == (
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    )
+
+
+def test_process_cached_loader_disabled(channel_USD, settings):
+    # given
+    settings.DATALOADER_PROCESS_CACHE_TIMEOUT = 0
+    _load_channel(channel_USD.slug)
+    Channel.objects.filter(pk=channel_USD.pk).update(name="Updated name")
+
+    # when
+    channel = _load_channel(channel_USD.slug)
+
+    # then
+    assert channel.name == "Updated name"
+
+
+@patch("saleor.graphql.core.dataloaders.record_dataloader_cache_lookup")
+def test_process_cached_loader_records_cache_lookups(
+    mocked_record_lookup, channel_USD, channel_PLN
+):
+    # given
+    _load_channel(channel_USD.slug)
+    mocked_record_lookup.reset_mock()
+
+    # when
+    ChannelBySlugLoader(SaleorContext()).batch_load_fn(
+        [channel_USD.slug, channel_PLN.slug]
+    ).get()
+
+    # then
+    mocked_record_lookup.assert_called_once_with(
+        ChannelBySlugLoader.context_key, hits=1, misses=1
+    )
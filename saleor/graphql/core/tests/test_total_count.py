@@ -0,0 +1,163 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.cache import cache
+
+from ....account.models import User
+from ....order.models import Order
+from ....tests.models import Book
+from ..connection import CountableConnection, create_connection_slice
+from ..fields import ConnectionField
+from ..total_count import get_approximate_total_count
+
+
+class BookType(graphene.ObjectType):
+    name = graphene.String()
+
+
+class BookTypeApproximateCountableConnection(CountableConnection):
+    approximate_total_count = True
+
+    class Meta:
+        node = BookType
+
+
+class Query(graphene.ObjectType):
+    books = ConnectionField(BookTypeApproximateCountableConnection)
+
+    @staticmethod
+    def resolve_books(_root, info, **kwargs):
+        qs = Book.objects.all()
+        return create_connection_slice(
+            qs, info, kwargs, BookTypeApproximateCountableConnection
+        )
+
+
+schema = graphene.Schema(query=Query)
+
+
+@pytest.fixture
+def books(db):
+    books = [Book(name=f"Book{index}") for index in range(24)]
+    return Book.objects.bulk_create(books)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_get_approximate_total_count_without_strategy(books):
+    # when
+    count = get_approximate_total_count(Book.objects.all())
+
+    # then
+    assert count == len(books)
+
+
+def test_get_approximate_total_count_capped_at_limit(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 10
+
+    # when
+    capped_count = get_approximate_total_count(Book.objects.all())
+    count = get_approximate_total_count(Book.objects.filter(name__startswith="Book2"))
+
+    # then
+    assert capped_count == 10
+    assert count == 5
+
+
+def test_get_approximate_total_count_cached_for_same_filters(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = 60
+    get_approximate_total_count(Book.objects.filter(name__startswith="Book1"))
+    Book.objects.create(name="Book100")
+
+    # when
+    cached_count = get_approximate_total_count(
+        Book.objects.filter(name__startswith="Book1").order_by("-name")
+    )
+    count = get_approximate_total_count(Book.objects.filter(name__startswith="Book2"))
+
+    # then
+    assert cached_count == 11
+    assert count == 5
+
+
+def test_get_approximate_total_count_cached_for_empty_result(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = 60
+
+    # when
+    count = get_approximate_total_count(Book.objects.filter(pk__in=[]))
+
+    # then
+    assert count == 0
+
+
+@patch("saleor.graphql.core.total_count.get_estimated_count", return_value=1000)
+def test_get_approximate_total_count_estimated_for_unfiltered_table(
+    mocked_estimated_count, books, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 500
+
+    # when
+    estimated_count = get_approximate_total_count(Book.objects.all())
+    filtered_count = get_approximate_total_count(
+        Book.objects.filter(name__startswith="Book1")
+    )
+
+    # then
+    assert estimated_count == 1000
+    assert filtered_count == 11
+    mocked_estimated_count.assert_called_once()
+
+
+@patch("saleor.graphql.core.total_count.get_estimated_count", return_value=1000)
+def test_get_approximate_total_count_not_estimated_for_orders_and_customers(
+    mocked_estimated_count, order, draft_order, customer_user, staff_user, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 500
+
+    # when
+    orders_count = get_approximate_total_count(Order.objects.non_draft())
+    customers_count = get_approximate_total_count(User.objects.customers())
+
+    # then
+    assert orders_count == Order.objects.non_draft().count()
+    assert customers_count == User.objects.customers().count()
+    mocked_estimated_count.assert_not_called()
+
+
+@patch("saleor.graphql.core.total_count.get_estimated_count", return_value=100)
+def test_get_approximate_total_count_small_table_counted(
+    _mocked_estimated_count, books, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 500
+
+    # when
+    count = get_approximate_total_count(Book.objects.all())
+
+    # then
+    assert count == len(books)
+
+
+def test_connection_total_count_uses_counting_strategy(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 10
+    query = "{ books(first: 5) { totalCount edges { node { name } } } }"
+
+    # when
+    result = schema.execute(query)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == 10
+    assert len(result.data["books"]["edges"]) == 5
@@ -0,0 +1,87 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+
+TOTAL_COUNT_CACHE_KEY = "graphql_total_count"
+
+
+def _is_unfiltered(qs: QuerySet) -> bool:
+    query = qs.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and not query.is_sliced
+    )
+
+
+def get_estimated_count(qs: QuerySet) -> int | None:
+    """Return the number of rows in the table of the model from the planner stats.
+
+    `None` is returned when the table was not analyzed yet.
+    """
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [qs.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def _get_cache_key(qs: QuerySet) -> str:
+    # The ordering doesn't change the count, so it's not part of the key.
+    query = qs.order_by().query
+    sql, params = query.get_compiler(using=qs.db).as_sql()
+    fingerprint = hashlib.sha256(
+        f"{qs.db}:{sql}:{params!r}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{TOTAL_COUNT_CACHE_KEY}:{fingerprint}"
+
+
+def _count(qs: QuerySet) -> int:
+    limit = settings.GRAPHQL_TOTAL_COUNT_LIMIT
+    if not limit:
+        return qs.count()
+    # Count one row more than the limit to know if there are more rows.
+    count = qs.order_by()[: limit + 1].count()
+    return min(count, limit)
+
+
+def get_approximate_total_count(qs: QuerySet) -> int:
+    """Return the number of rows in the queryset, estimated when it's expensive.
+
+    - Unfiltered querysets of tables with at least
+      `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD` rows return the planner estimate.
+      The estimate counts all rows of the table, so querysets with any filter,
+      like orders without drafts, are never estimated.
+    - Counting stops at `GRAPHQL_TOTAL_COUNT_LIMIT` rows, so the limit means that
+      there are at least that many rows.
+    - Counts are cached for `GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT` seconds, keyed by
+      the SQL of the queryset, so the same filters don't recount rows on every page.
+    """
+    threshold = settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD
+    if threshold and _is_unfiltered(qs):
+        estimated_count = get_estimated_count(qs)
+        if estimated_count is not None and estimated_count >= threshold:
+            return estimated_count
+
+    timeout = settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT
+    if not timeout:
+        return _count(qs)
+
+    try:
+        cache_key = _get_cache_key(qs)
+    except EmptyResultSet:
+        return 0
+    count = cache.get(cache_key)
+    if count is None:
+        count = _count(qs)
+        cache.set(cache_key, count, timeout=timeout)
+    return count
@@ -1,24 +1,55 @@
+from django.conf import settings
 from graphql.execution import executor
 from graphql.execution.base import ExecutionResult
+from promise import Promise
 
 original_complete_value_catching_error = executor.complete_value_catching_error
 
 
-def _patched_complete_value_catching_error(*args, **kwargs):
-    info = args[3]
+def _uses_writer(context) -> bool:
+    # Same check as in `allow_writer_in_context`, without entering a context manager
+    # for every resolved field.
+    from saleor.graphql.core.context import get_database_connection_name
+
+    return (
+        get_database_connection_name(context)
+        == settings.DATABASE_CONNECTION_DEFAULT_NAME
+    )
+
+
+def _patched_complete_value_catching_error(
+    exe_context, return_type, field_asts, info, path, result
+):
+    if isinstance(result, Promise) and result.is_fulfilled:
+        # Complete values that are already available, like data loader results
+        # from the cache, right away instead of chaining a callback to the promise.
+        result = result.value
+
+    if not _uses_writer(info.context):
+        return original_complete_value_catching_error(
+            exe_context, return_type, field_asts, info, path, result
+        )
+
     from saleor.core.db.connection import allow_writer_in_context
 
     with allow_writer_in_context(info.context):
-        return original_complete_value_catching_error(*args, **kwargs)
+        return original_complete_value_catching_error(
+            exe_context, return_type, field_asts, info, path, result
+        )
 
 
 def patch_executor():
     """Patch `complete_value_catching_error` function to allow writer DB in mutations.
 
     The `complete_value_catching_error` function is called when resolving a field in
-    GraphQL. This patch wraps each call with `allow_writer_in_context` context manager.When a ValidationError is raised, the execution context does not store the error.
-    This allows to use writer DB in resolvers, when they are called via mutation, while
-    they will still raise or log error when a resolver is run in a query.
+    GraphQL. When the context uses the writer DB, this patch wraps each call with
+    `allow_writer_in_context` context manager. This allows to use writer DB in
+    resolvers, when they are called via mutation, while they will still raise or log
+    error when a resolver is run in a query. Queries using the replica skip the context
+    manager, as it has nothing to allow for them.
+
+    Results of resolvers returned as already fulfilled promises are completed
+    synchronously, without scheduling the completion on the promise.
     """
 
     executor.complete_value_catching_error = _patched_complete_value_catching_error
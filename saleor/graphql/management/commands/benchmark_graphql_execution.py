@@ -0,0 +1,80 @@
+import time
+
+import graphene
+from django.core.management.base import BaseCommand, CommandError
+from promise import Promise
+
+from ...core.context import SaleorContext, disallow_replica_in_context
+
+
+def build_benchmark_schema(fields: int) -> graphene.Schema:
+    """Build a schema with a list of objects exposing the given number of fields.
+
+    Even fields are resolved by the default resolver, odd ones return fulfilled
+    promises, as data loaders with cached results do.
+    """
+    attrs = {}
+    for index in range(fields):
+        field_name = f"field{index}"
+        attrs[field_name] = graphene.String()
+        if index % 2:
+            attrs[f"resolve_{field_name}"] = lambda root, _info, name=field_name: (
+                Promise.resolve(root[name])
+            )
+    product_type = type("BenchmarkProduct", (graphene.ObjectType,), attrs)
+
+    class Query(graphene.ObjectType):
+        products = graphene.List(
+            graphene.NonNull(product_type), first=graphene.Int(required=True)
+        )
+
+        @staticmethod
+        def resolve_products(_root, _info, first):
+            return [
+                {f"field{index}": f"{row}-{index}" for index in range(fields)}
+                for row in range(first)
+            ]
+
+    return graphene.Schema(query=Query)
+
+
+def build_benchmark_query(objects: int, fields: int) -> str:
+    selection = " ".join(f"field{index}" for index in range(fields))
+    return f"{{ products(first: {objects}) {{ {selection} }} }}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the overhead of executing GraphQL fields on a large selection, "
+        "for queries and for mutations, which use the writer database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--objects", type=int, default=100)
+        parser.add_argument("--fields", type=int, default=30)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        objects = options["objects"]
+        fields = options["fields"]
+        repeat = options["repeat"]
+        schema = build_benchmark_schema(fields)
+        query = build_benchmark_query(objects, fields)
+
+        for label, allow_replica in (("query", True), ("mutation", False)):
+            timings = []
+            for _ in range(repeat):
+                context = SaleorContext()
+                if not allow_replica:
+                    disallow_replica_in_context(context)
+                start = time.perf_counter()
+                result = schema.execute(query, context_value=context)
+                timings.append(time.perf_counter() - start)
+                if result.errors:
+                    raise CommandError(str(result.errors[0]))
+            best = min(timings)
+            self.stdout.write(
+                f"{label}: {objects} objects x {fields} fields, "
+                f"best of {repeat}: {best * 1000:.2f} ms, "
+                f"{best / (objects * fields) * 1_000_000:.2f} us per field"
+            )
@@ -0,0 +1,59 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from graphql import parse, validate
+from graphql.error import GraphQLSyntaxError
+
+from ...api import schema
+from ...persisted_queries import hash_query, register_query
+
+
+class Command(BaseCommand):
+    help = (
+        "Registers GraphQL queries that can be executed by their SHA-256 hash. "
+        "Accepts `.graphql` files with a single document or JSON files with a list "
+        "of queries or a mapping of hashes to queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", type=str)
+
+    def handle(self, *args, **options):
+        queries = []
+        for path in options["paths"]:
+            queries.extend(self.read_queries(path))
+
+        for query in queries:
+            self.validate_query(query)
+
+        for query in queries:
+            persisted_query = register_query(query)
+            self.stdout.write(f"Registered query {persisted_query.hash}")
+
+    def read_queries(self, path: str) -> list[str]:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        if not path.endswith(".json"):
+            return [content]
+
+        data = json.loads(content)
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            for query_hash, query in data.items():
+                if hash_query(query) != query_hash.lower():
+                    raise CommandError(
+                        f"Hash {query_hash} from {path} does not match its query."
+                    )
+            return list(data.values())
+        raise CommandError(f"Unsupported format of {path}.")
+
+    def validate_query(self, query: str):
+        try:
+            document_ast = parse(query)
+        except GraphQLSyntaxError as e:
+            raise CommandError(f"Invalid query {hash_query(query)}: {e}") from e
+        errors = validate(schema, document_ast)
+        if errors:
+            messages = "; ".join(str(error) for error in errors)
+            raise CommandError(f"Invalid query {hash_query(query)}: {messages}")
@@ -1,6 +1,7 @@
 import time
 from collections.abc import Iterator
 from contextlib import AbstractContextManager, contextmanager
+from functools import cache
 
 from django.conf import settings
 from opentelemetry.semconv._incubating.attributes import graphql_attributes
@@ -119,6 +120,22 @@ METRIC_GRAPHQL_MUTATION_COUNT = meter.create_metric(
     description="Number of mutations sent within a GraphQL request.",
 )
 
+METRIC_DATALOADER_CACHE_HITS = meter.create_metric(
+    "saleor.graphql.dataloader.cache.hits",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of data loader keys found in the process memory cache.",
+)
+
+METRIC_DATALOADER_CACHE_MISSES = meter.create_metric(
+    "saleor.graphql.dataloader.cache.misses",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of data loader keys missing in the process memory cache.",
+)
+
 
 # Helper functions
 def record_graphql_query_count(
@@ -189,13 +206,23 @@ def record_request_duration() -> AbstractContextManager[dict[str, AttributeValue
     return meter.record_duration(METRIC_REQUEST_DURATION, attributes=attributes)
 
 
-def record_field_usage(parent_type: str, field_name: str, deprecated: bool) -> None:
+@cache
+def _get_field_usage_attributes(
+    parent_type: str, field_name: str, deprecated: bool
+) -> dict[str, AttributeValue]:
+    # Built once per field, as usage is recorded on every resolver call. The meter
+    # copies the attributes, so the shared dict is never modified.
     attributes: dict[str, AttributeValue] = {
         saleor_attributes.GRAPHQL_PARENT_TYPE: parent_type,
         saleor_attributes.GRAPHQL_FIELD_NAME: field_name,
     }
     if deprecated:
         attributes[saleor_attributes.GRAPHQL_FIELD_DEPRECATED] = True
+    return attributes
+
+
+def record_field_usage(parent_type: str, field_name: str, deprecated: bool) -> None:
+    attributes = _get_field_usage_attributes(parent_type, field_name, deprecated)
     meter.record(METRIC_GRAPHQL_FIELD_USAGE, 1, Unit.CALL, attributes=attributes)
 
 
@@ -209,3 +236,15 @@ def record_graphql_alias_count(count: int) -> None:
 
 def record_graphql_mutation_count(count: int) -> None:
     meter.record(METRIC_GRAPHQL_MUTATION_COUNT, amount=count, unit=Unit.COUNT)
+
+
+def record_dataloader_cache_lookup(loader_name: str, hits: int, misses: int) -> None:
+    attributes = {saleor_attributes.GRAPHQL_DATALOADER_NAME: loader_name}
+    if hits:
+        meter.record(
+            METRIC_DATALOADER_CACHE_HITS, hits, Unit.COUNT, attributes=attributes
+        )
+    if misses:
+        meter.record(
+            METRIC_DATALOADER_CACHE_MISSES, misses, Unit.COUNT, attributes=attributes
+        )
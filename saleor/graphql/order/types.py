@@ -3200,6 +3200,8 @@ class Order(SyncWebhookControlContextModelObjectType[ModelObjectType[models.Orde
 
 
 class OrderCountableConnection(CountableConnection):
+    approximate_total_count = True
+
     class Meta:
         doc_category = DOC_CATEGORY_ORDERS
         node = Order
@@ -0,0 +1,155 @@
+import hashlib
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from ..core.models import PersistedQuery
+
+PERSISTED_QUERY_CACHE_KEY_PREFIX = "persisted_query"
+AUTOMATIC_PERSISTED_QUERY_CACHE_KEY_PREFIX = "automatic_persisted_query"
+PERSISTED_QUERY_CACHE_TIMEOUT = 60 * 60 * 24
+PERSISTED_QUERY_SUPPORTED_VERSION = 1
+
+PERSISTED_QUERY_NOT_FOUND_CODE = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_NOT_FOUND_MESSAGE = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_SUPPORTED_CODE = "PERSISTED_QUERY_NOT_SUPPORTED"
+PERSISTED_QUERY_NOT_SUPPORTED_MESSAGE = "PersistedQueryNotSupported"
+PERSISTED_QUERY_HASH_MISMATCH_CODE = "PERSISTED_QUERY_HASH_MISMATCH"
+PERSISTED_QUERY_HASH_MISMATCH_MESSAGE = "Provided sha256 hash does not match query."
+PERSISTED_QUERY_NOT_ALLOWED_CODE = "PERSISTED_QUERY_NOT_ALLOWED"
+PERSISTED_QUERY_NOT_ALLOWED_MESSAGE = "Only registered persisted queries are allowed."
+
+
+class PersistedQueryError(GraphQLError):
+    def __init__(self, message: str, code: str):
+        super().__init__(message, extensions={"code": code})
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _get_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def _get_automatic_cache_key(query_hash: str) -> str:
+    return f"{AUTOMATIC_PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_persisted_query_hash(data: Any) -> str | None:
+    """Return the hash from the `persistedQuery` extension of the request.
+
+    The extension follows the Automatic Persisted Queries protocol:
+    `{"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}`.
+    """
+    extensions = data.get("extensions") if hasattr(data, "get") else None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_SUPPORTED_VERSION:
+        raise PersistedQueryError(
+            PERSISTED_QUERY_NOT_SUPPORTED_MESSAGE, PERSISTED_QUERY_NOT_SUPPORTED_CODE
+        )
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        return None
+    return query_hash.lower()
+
+
+def get_registered_query(query_hash: str) -> str | None:
+    """Return the query registered in the database, caching the result."""
+    cache_key = _get_cache_key(query_hash)
+    query = cache.get(cache_key)
+    if query is not None:
+        return query
+    query = (
+        PersistedQuery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(hash=query_hash)
+        .values_list("query", flat=True)
+        .first()
+    )
+    if query is not None:
+        cache.set(cache_key, query, PERSISTED_QUERY_CACHE_TIMEOUT)
+    return query
+
+
+def get_persisted_query(query_hash: str) -> str | None:
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ONLY:
+        query = cache.get(_get_automatic_cache_key(query_hash))
+        if query is not None:
+            return query
+    return get_registered_query(query_hash)
+
+
+def register_query(query: str) -> PersistedQuery:
+    """Store the query in the database, so it can be executed by its hash."""
+    query_hash = hash_query(query)
+    persisted_query, _ = PersistedQuery.objects.get_or_create(
+        hash=query_hash, defaults={"query": query}
+    )
+    cache.set(_get_cache_key(query_hash), query, PERSISTED_QUERY_CACHE_TIMEOUT)
+    return persisted_query
+
+
+def resolve_persisted_query(query: str | None, query_hash: str | None) -> str | None:
+    """Return the query string to execute for the request.
+
+    When only a hash is sent, the query is resolved from the cache or the registered
+    queries. In the allow-list mode (`GRAPHQL_PERSISTED_QUERIES_ONLY`) only queries
+    registered in the database are executed.
+    """
+    if not query_hash:
+        if settings.GRAPHQL_PERSISTED_QUERIES_ONLY and query:
+            if get_registered_query(hash_query(query)) is None:
+                raise PersistedQueryError(
+                    PERSISTED_QUERY_NOT_ALLOWED_MESSAGE,
+                    PERSISTED_QUERY_NOT_ALLOWED_CODE,
+                )
+        return query
+
+    if (
+        not settings.GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED
+        and not settings.GRAPHQL_PERSISTED_QUERIES_ONLY
+    ):
+        raise PersistedQueryError(
+            PERSISTED_QUERY_NOT_SUPPORTED_MESSAGE, PERSISTED_QUERY_NOT_SUPPORTED_CODE
+        )
+
+    if not query:
+        persisted_query = get_persisted_query(query_hash)
+        if persisted_query is None:
+            raise PersistedQueryError(
+                PERSISTED_QUERY_NOT_FOUND_MESSAGE, PERSISTED_QUERY_NOT_FOUND_CODE
+            )
+        return persisted_query
+
+    if hash_query(query) != query_hash:
+        raise PersistedQueryError(
+            PERSISTED_QUERY_HASH_MISMATCH_MESSAGE, PERSISTED_QUERY_HASH_MISMATCH_CODE
+        )
+    if settings.GRAPHQL_PERSISTED_QUERIES_ONLY:
+        if get_registered_query(query_hash) is None:
+            raise PersistedQueryError(
+                PERSISTED_QUERY_NOT_ALLOWED_MESSAGE, PERSISTED_QUERY_NOT_ALLOWED_CODE
+            )
+    return query
+
+
+def store_automatic_persisted_query(query: str, query_hash: str):
+    """Remember the query, so the following requests may send only its hash.
+
+    Call it only for queries that were parsed and validated, so invalid documents
+    are not stored in the cache.
+    """
+    if (
+        settings.GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED
+        and not settings.GRAPHQL_PERSISTED_QUERIES_ONLY
+    ):
+        cache.set(
+            _get_automatic_cache_key(query_hash), query, PERSISTED_QUERY_CACHE_TIMEOUT
+        )
@@ -13,7 +13,9 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
+from ....product.utils.product import mark_products_in_channels_as_dirty
 from ....warehouse import models as warehouse_models
+from ....warehouse.stock_availability import update_stock_availability_for_stocks
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.types import (
@@ -912,6 +914,7 @@ class ProductVariantBulkCreate(BaseMutation):
             AttributeAssignmentMixin.save(variant, attributes)
 
         warehouse_models.Stock.objects.bulk_create(stocks_to_create)
+        update_stock_availability_for_stocks(stocks_to_create)
         models.ProductVariantChannelListing.objects.bulk_create(listings_to_create)
 
         if product and not product.default_variant and variants_to_create:
@@ -941,6 +944,10 @@ class ProductVariantBulkCreate(BaseMutation):
         )
         # This will finally recalculate discounted prices for products.
         cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+        cls.call_event(
+            mark_products_in_channels_as_dirty,
+            {channel_id: {product.pk} for channel_id in channel_ids},
+        )
 
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
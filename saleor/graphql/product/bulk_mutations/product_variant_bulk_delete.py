@@ -1,3 +1,4 @@
+from collections import defaultdict
 from collections.abc import Iterable
 
 import graphene
@@ -19,6 +20,7 @@ from ....order.tasks import recalculate_orders_task
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.search import prepare_product_search_vector_value
+from ....product.utils.product import mark_products_in_channels_as_dirty
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...app.dataloaders import get_app_promise
@@ -62,15 +64,19 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
     @classmethod
     def post_save_actions(cls, info, variants):
         impacted_channels = set()
+        channel_to_product_ids: dict[int, set[int]] = defaultdict(set)
         for variant in variants:
             channel_ids = [
                 listing.channel_id for listing in variant.channel_listings.all()
             ]
             impacted_channels.update(channel_ids)
+            for channel_id in channel_ids:
+                channel_to_product_ids[channel_id].add(variant.product_id)
         # This will finally recalculate discounted prices for products.
         cls.call_event(
             mark_active_catalogue_promotion_rules_as_dirty, impacted_channels
         )
+        cls.call_event(mark_products_in_channels_as_dirty, channel_to_product_ids)
 
         manager = get_plugin_manager_promise(info.context).get()
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_DELETED)
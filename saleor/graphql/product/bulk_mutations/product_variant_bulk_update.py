@@ -12,8 +12,10 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
+from ....product.utils.product import mark_products_in_channels_as_dirty
 from ....warehouse import models as warehouse_models
 from ....warehouse.management import delete_stocks, stock_bulk_update
+from ....warehouse.stock_availability import update_stock_availability_for_stocks
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.utils.attribute_assignment import AttributeAssignmentMixin
@@ -734,6 +736,7 @@ class ProductVariantBulkUpdate(BaseMutation):
             warehouse_models.Stock.objects.bulk_create(
                 stocks_to_create, ignore_conflicts=True
             )
+        update_stock_availability_for_stocks(stocks_to_create)
         if stocks_to_update:
             stock_bulk_update(stocks_to_update, ["quantity"])
 
@@ -777,6 +780,12 @@ class ProductVariantBulkUpdate(BaseMutation):
             cls.call_event(
                 mark_active_catalogue_promotion_rules_as_dirty, impacted_channel_ids
             )
+            # Prices of the product in the channels have to be recalculated also
+            # when no promotion applies to it.
+            cls.call_event(
+                mark_products_in_channels_as_dirty,
+                {channel_id: {product.pk} for channel_id in impacted_channel_ids},
+            )
         manager = get_plugin_manager_promise(info.context).get()
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
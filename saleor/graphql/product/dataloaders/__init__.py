@@ -24,6 +24,7 @@ from .products import (
     ProductChannelListingByProductIdAndChannelSlugLoader,
     ProductChannelListingByProductIdLoader,
     ProductMediaByIdLoader,
+    ProductPricingByProductIdAndChannelSlugLoader,
     ProductTypeByIdLoader,
     ProductTypeByProductIdLoader,
     ProductTypeByVariantIdLoader,
@@ -62,6 +63,7 @@ __all__ = [
     "ProductChannelListingByIdLoader",
     "ProductChannelListingByProductIdLoader",
     "ProductChannelListingByProductIdAndChannelSlugLoader",
+    "ProductPricingByProductIdAndChannelSlugLoader",
     "ProductTypeByIdLoader",
     "ProductVariantByIdLoader",
     "ProductVariantChannelListingByIdLoader",
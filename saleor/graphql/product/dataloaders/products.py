@@ -13,22 +13,29 @@ from ....product.models import (
     Product,
     ProductChannelListing,
     ProductMedia,
+    ProductPricing,
     ProductType,
     ProductVariant,
     ProductVariantChannelListing,
     VariantChannelListingPromotionRule,
     VariantMedia,
 )
+from ....product.utils.pricing import get_tax_version
 from ...channel.dataloaders.by_self import ChannelBySlugLoader
-from ...core.dataloaders import BaseThumbnailBySizeAndFormatLoader, DataLoader
+from ...core.dataloaders import (
+    BaseThumbnailBySizeAndFormatLoader,
+    DataLoader,
+    ProcessCachedDataLoader,
+)
 
 ProductIdAndChannelSlug = tuple[int, str]
 VariantIdAndChannelSlug = tuple[int, str]
 VariantIdAndChannelId = tuple[int, int | None]
 
 
-class CategoryByIdLoader(DataLoader[int, Category]):
+class CategoryByIdLoader(ProcessCachedDataLoader[int, Category]):
     context_key = "category_by_id"
+    cached_models = (Category,)
 
     def batch_load(self, keys):
         categories = Category.objects.using(self.database_connection_name).in_bulk(keys)
@@ -147,8 +154,37 @@ class ProductChannelListingByProductIdAndChannelSlugLoader(
         ]
 
 
-class ProductTypeByIdLoader(DataLoader[int, ProductType]):
+class ProductPricingByProductIdAndChannelSlugLoader(
+    DataLoader[ProductIdAndChannelSlug, ProductPricing | None]
+):
+    """Load the pricing precomputed for the default country of the channel.
+
+    Only pricing calculated with the current taxes is returned.
+    """
+
+    context_key = "productpricing_by_product_and_channel"
+
+    def batch_load(self, keys):
+        pricings = (
+            ProductPricing.objects.using(self.database_connection_name)
+            .filter(
+                product_id__in={product_id for product_id, _ in keys},
+                channel__slug__in={channel_slug for _, channel_slug in keys},
+                country_code=F("channel__default_country"),
+                tax_version=get_tax_version(),
+            )
+            .annotate(channel_slug=F("channel__slug"))
+        )
+        pricings_map = {
+            (pricing.product_id, getattr(pricing, "channel_slug")): pricing
+            for pricing in pricings
+        }
+        return [pricings_map.get(key) for key in keys]
+
+
+class ProductTypeByIdLoader(ProcessCachedDataLoader[int, ProductType]):
     context_key = "product_type_by_id"
+    cached_models = (ProductType,)
 
     def batch_load(self, keys):
         product_types = ProductType.objects.using(
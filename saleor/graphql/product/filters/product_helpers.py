@@ -18,7 +18,9 @@ from ....product.models import (
     ProductVariant,
     ProductVariantChannelListing,
 )
+from ....warehouse.availability import can_use_stock_availability_table
 from ....warehouse.models import Allocation, Reservation, Stock, Warehouse
+from ....warehouse.stock_availability import get_in_stock_availability
 from ...utils import resolve_global_ids_to_primary_keys
 from ...utils.filters import (
     filter_range_field,
@@ -104,7 +106,21 @@ def _get_in_stock_variant_stocks(qs, channel_slug):
     (i.e. quantity greater than the sum of allocated and actively reserved quantity)
     in a warehouse available for the given channel. The returned queryset is keyed by
     ``product_variant_id``.
+
+    When the stock availability table can be used, the variant is considered in stock
+    when its available quantity summed from the channel's warehouses is positive.
     """
+    # refetch the site to make sure that we have the latest settings
+    Site.objects.clear_cache()
+    site_settings = Site.objects.get_current().settings
+    include_shipping_zones = site_settings.use_legacy_shipping_zone_stock_availability
+    if can_use_stock_availability_table(
+        site_settings, include_shipping_zones=include_shipping_zones
+    ):
+        return get_in_stock_availability(
+            channel_slug, database_connection_name=qs.db
+        ).values("product_variant_id")
+
     allocations = (
         Allocation.objects.using(qs.db)
         .values("stock_id")
@@ -125,7 +141,9 @@ def _get_in_stock_variant_stocks(qs, channel_slug):
     )
     reservation_subquery = Subquery(queryset=reservations, output_field=IntegerField())
 
-    warehouse_pks = get_available_warehouse_pks_for_product(qs, channel_slug)
+    warehouse_pks = _get_available_warehouse_pks(
+        qs, channel_slug, include_shipping_zones
+    )
     return (
         Stock.objects.using(qs.db)
         .filter(
@@ -168,7 +186,10 @@ def get_available_warehouse_pks_for_product(qs, channel_slug):
     include_shipping_zones = (
         Site.objects.get_current().settings.use_legacy_shipping_zone_stock_availability
     )
+    return _get_available_warehouse_pks(qs, channel_slug, include_shipping_zones)
+
 
+def _get_available_warehouse_pks(qs, channel_slug, include_shipping_zones):
     if include_shipping_zones:
         warehouse_pks = list(
             Warehouse.objects.using(qs.db)
@@ -5,6 +5,7 @@ from .....permission.enums import ProductPermissions
 from .....product import ProductMediaTypes, models
 from .....product.error_codes import ProductErrorCode
 from .....product.tasks import fetch_product_media_image_task
+from .....thumbnail.tasks import schedule_product_media_thumbnails
 from ....core import ResolveInfo
 from ....core.context import ChannelContext
 from ....core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -101,6 +102,7 @@ class ProductMediaCreate(BaseMutation):
             media = product.media.create(
                 image=image_data, alt=alt, type=ProductMediaTypes.IMAGE
             )
+            schedule_product_media_thumbnails(media.pk)
         elif media_url:
             # Remote URLs can point to the images or oembed data.
             # In case of images, the image is fetched asynchronously by a task.
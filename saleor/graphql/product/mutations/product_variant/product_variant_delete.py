@@ -13,6 +13,7 @@ from .....order import models as order_models
 from .....order.tasks import recalculate_orders_task
 from .....permission.enums import ProductPermissions
 from .....product import models
+from .....product.utils.product import mark_products_in_channels_as_dirty
 from ....app.dataloaders import get_app_promise
 from ....core import ResolveInfo
 from ....core.context import ChannelContext
@@ -139,6 +140,10 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
 
         # This will finally recalculate discounted prices for products.
         cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+        cls.call_event(
+            mark_products_in_channels_as_dirty,
+            {channel_id: {variant.product_id} for channel_id in channel_ids},
+        )
 
         return response
 
@@ -898,6 +898,50 @@ def test_product_variant_bulk_update_channel_listings_input(
     assert promotion_rule.variants_dirty is True
 
 
+def test_product_variant_bulk_update_channel_listings_marks_products_as_dirty(
+    staff_api_client, variant, permission_manage_products, channel_USD
+):
+    # given
+    product = variant.product
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_dirty=False
+    )
+    variant_listing = variant.channel_listings.get(channel=channel_USD)
+    variants = [
+        {
+            "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channelListings": {
+                "update": [
+                    {
+                        "price": 50.0,
+                        "channelListing": graphene.Node.to_global_id(
+                            "ProductVariantChannelListing", variant_listing.id
+                        ),
+                    }
+                ],
+            },
+        },
+    ]
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "variants": variants,
+    }
+
+    # when
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_UPDATE_MUTATION, variables
+    )
+    content = get_graphql_content(response)
+
+    # then
+    assert content["data"]["productVariantBulkUpdate"]["count"] == 1
+    product_channel_listing = ProductChannelListing.objects.get(
+        product=product, channel=channel_USD
+    )
+    assert product_channel_listing.discounted_price_dirty is True
+
+
 def test_product_variant_bulk_update_and_remove_channel_listings(
     staff_api_client,
     variant,
@@ -7,7 +7,7 @@ from prices import Money, TaxedMoney
 from .....discount.utils.promotion import get_active_catalogue_promotion_rules
 from .....order import OrderEvents, OrderStatus
 from .....order.models import OrderEvent, OrderLine
-from .....product.models import ProductVariant
+from .....product.models import ProductChannelListing, ProductVariant
 from ....tests.utils import get_graphql_content
 
 DELETE_VARIANT_BY_SKU_MUTATION = """
@@ -96,6 +96,29 @@ def test_delete_variant(
         assert rule.variants_dirty
 
 
+def test_delete_variant_marks_product_as_dirty(
+    staff_api_client, product_with_two_variants, permission_manage_products
+):
+    # given
+    product = product_with_two_variants
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_dirty=False
+    )
+    variant = product.variants.first()
+    variables = {"id": graphene.Node.to_global_id("ProductVariant", variant.pk)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        DELETE_VARIANT_MUTATION, variables, permissions=[permission_manage_products]
+    )
+    get_graphql_content(response)
+
+    # then
+    product_channel_listings = ProductChannelListing.objects.filter(product=product)
+    assert product_channel_listings
+    assert all(listing.discounted_price_dirty for listing in product_channel_listings)
+
+
 def test_delete_variant_remove_checkout_lines(
     staff_api_client,
     checkout_with_items,
@@ -0,0 +1,112 @@
+import graphene
+import pytest
+
+from .....product.models import ProductChannelListing, ProductPricing
+from .....product.utils.pricing import update_products_pricing
+from ....tests.utils import get_graphql_content
+
+QUERY_PRODUCT_PRICING = """
+    query ($id: ID!, $channel: String, $address: AddressInput) {
+        product(id: $id, channel: $channel) {
+            pricing(address: $address) {
+                onSale
+                displayGrossPrices
+                priceRange {
+                    start { gross { amount } net { amount } }
+                    stop { gross { amount } net { amount } }
+                }
+                priceRangeUndiscounted {
+                    start { gross { amount } net { amount } }
+                    stop { gross { amount } net { amount } }
+                }
+                discount { gross { amount } }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def _enable_product_pricing(settings):
+    settings.PRODUCT_PRICING_PROJECTION_ENABLED = True
+
+
+def _query_pricing(api_client, product, channel, address=None):
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel.slug,
+        "address": address,
+    }
+    response = api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+    content = get_graphql_content(response)
+    return content["data"]["product"]["pricing"]
+
+
+def _set_precomputed_gross_amount(product, channel, amount):
+    pricing = ProductPricing.objects.get(product=product, channel=channel)
+    pricing.pricing["price_range"]["start"]["gross"] = amount
+    pricing.pricing["price_range"]["stop"]["gross"] = amount
+    pricing.save(update_fields=["pricing"])
+
+
+def test_product_pricing_matches_calculated_pricing(
+    user_api_client, product, channel_USD, settings
+):
+    # given
+    settings.PRODUCT_PRICING_PROJECTION_ENABLED = False
+    calculated_pricing = _query_pricing(user_api_client, product, channel_USD)
+    settings.PRODUCT_PRICING_PROJECTION_ENABLED = True
+    update_products_pricing([product.pk])
+
+    # when
+    pricing = _query_pricing(user_api_client, product, channel_USD)
+
+    # then
+    assert pricing == calculated_pricing
+
+
+def test_product_pricing_read_from_precomputed_pricing(
+    user_api_client, product, channel_USD
+):
+    # given
+    update_products_pricing([product.pk])
+    _set_precomputed_gross_amount(product, channel_USD, "1234.00")
+
+    # when
+    pricing = _query_pricing(user_api_client, product, channel_USD)
+
+    # then
+    assert pricing["priceRange"]["start"]["gross"]["amount"] == 1234
+
+
+def test_product_pricing_with_address_is_calculated(
+    user_api_client, product, channel_USD
+):
+    # given
+    update_products_pricing([product.pk])
+    _set_precomputed_gross_amount(product, channel_USD, "1234.00")
+
+    # when
+    pricing = _query_pricing(
+        user_api_client, product, channel_USD, address={"country": "US"}
+    )
+
+    # then
+    assert pricing["priceRange"]["start"]["gross"]["amount"] != 1234
+
+
+def test_product_pricing_with_dirty_listing_is_calculated(
+    user_api_client, product, channel_USD
+):
+    # given
+    update_products_pricing([product.pk])
+    _set_precomputed_gross_amount(product, channel_USD, "1234.00")
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_dirty=True
+    )
+
+    # when
+    pricing = _query_pricing(user_api_client, product, channel_USD)
+
+    # then
+    assert pricing["priceRange"]["start"]["gross"]["amount"] != 1234
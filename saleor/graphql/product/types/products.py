@@ -23,6 +23,10 @@ from ....product.utils.availability import (
     get_product_availability,
     get_variant_availability,
 )
+from ....product.utils.pricing import (
+    get_product_availability_from_pricing,
+    is_product_pricing_enabled,
+)
 from ....product.utils.variants import get_variant_selection_attributes
 from ....tax.utils import (
     get_display_gross_prices,
@@ -143,6 +147,7 @@ from ..dataloaders import (
     ProductByIdLoader,
     ProductChannelListingByProductIdAndChannelSlugLoader,
     ProductChannelListingByProductIdLoader,
+    ProductPricingByProductIdAndChannelSlugLoader,
     ProductTypeByIdLoader,
     ProductVariantByIdLoader,
     ProductVariantsByProductIdLoader,
@@ -1230,7 +1235,51 @@ class Product(ChannelContextType[models.Product]):
     def resolve_pricing(root: ChannelContext[models.Product], info, *, address=None):
         if not root.channel_slug:
             return None
+        if address is None and is_product_pricing_enabled():
+            return Product._resolve_precomputed_pricing(root, info)
+        return Product._resolve_calculated_pricing(root, info, address=address)
 
+    @staticmethod
+    def _resolve_precomputed_pricing(root: ChannelContext[models.Product], info):
+        channel_slug = str(root.channel_slug)
+        context = info.context
+
+        product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
+            context
+        ).load((root.node.id, channel_slug))
+        pricing = ProductPricingByProductIdAndChannelSlugLoader(context).load(
+            (root.node.id, channel_slug)
+        )
+        tax_class_id = TaxClassIdByProductIdLoader(context).load(root.node.id)
+
+        def get_pricing_info(data):
+            product_channel_listing, pricing, tax_class_id = data
+            if (
+                pricing is None
+                or product_channel_listing is None
+                or product_channel_listing.discounted_price_dirty
+                or pricing.tax_class_id != tax_class_id
+            ):
+                # The pricing is missing or outdated, calculate it on the fly.
+                return Product._resolve_calculated_pricing(root, info)
+
+            availability = get_product_availability_from_pricing(
+                pricing, product_channel_listing
+            )
+            if availability is None:
+                return None
+            pricing_info = asdict(availability)
+            pricing_info["display_gross_prices"] = pricing.display_gross_prices
+            return ProductPricingInfo(**pricing_info)
+
+        return Promise.all([product_channel_listing, pricing, tax_class_id]).then(
+            get_pricing_info
+        )
+
+    @staticmethod
+    def _resolve_calculated_pricing(
+        root: ChannelContext[models.Product], info, *, address=None
+    ):
         channel_slug = str(root.channel_slug)
         context = info.context
 
@@ -1727,6 +1776,8 @@ class Product(ChannelContextType[models.Product]):
 
 
 class ProductCountableConnection(CountableConnection):
+    approximate_total_count = True
+
     class Meta:
         doc_category = DOC_CATEGORY_PRODUCTS
         node = Product
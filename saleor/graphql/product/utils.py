@@ -24,6 +24,7 @@ from ...order import OrderStatus
 from ...order import models as order_models
 from ...product import MEDIA_URL_CHAR_LIMIT
 from ...warehouse.models import Stock
+from ...warehouse.stock_availability import update_stock_availability
 from ..core.enums import ProductErrorCode
 
 if TYPE_CHECKING:
@@ -209,6 +210,7 @@ def create_stocks(
     except IntegrityError as e:
         msg = "Stock for one of warehouses already exists for this product variant."
         raise ValidationError(msg) from e
+    update_stock_availability([variant.pk])
     return new_stocks
 
 
@@ -0,0 +1,172 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from django.conf import settings
+from graphql import GraphQLDocument, GraphQLSchema
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    InlineFragment,
+    ListValue,
+    ObjectValue,
+    OperationDefinition,
+    Variable,
+)
+
+from ..core.utils.cache import CacheDict
+from .core.validators import validate_query
+from .utils import query_fingerprint, query_identifier
+from .utils.validators import check_if_query_contains_only_schema
+
+QUERY_PLAN_CACHE_SIZE = 1000
+# Number of distinct cost-relevant variable combinations remembered per document,
+# e.g. different `first` values used by the storefront for the same query.
+QUERY_PLAN_COSTS_CACHE_SIZE = 32
+
+
+@dataclass
+class QueryPlan:
+    """Static, request-independent metadata of a parsed GraphQL document.
+
+    A plan is created once per document string and reused by subsequent requests
+    sending the same document. Cost depends on the values of variables used as
+    cost multipliers (e.g. `first`), so successful validation results are stored
+    per combination of those values.
+    """
+
+    identifier: str
+    fingerprint: str
+    contains_only_schema: bool
+    cost_variables: tuple[str, ...]
+    costs: CacheDict = field(
+        default_factory=lambda: CacheDict(QUERY_PLAN_COSTS_CACHE_SIZE)
+    )
+
+
+_query_plans: CacheDict = CacheDict(QUERY_PLAN_CACHE_SIZE)
+
+
+def clear_query_plans_cache():
+    _query_plans.clear()
+
+
+def get_cost_multiplier_arguments(cost_map: dict[str, Any]) -> set[str]:
+    """Return names of the field arguments that can affect the query cost."""
+    arguments = set()
+    for type_fields in cost_map.values():
+        for cost_args in type_fields.values():
+            for multiplier in cost_args.get("multipliers", []):
+                arguments.add(multiplier.split(".")[0])
+    return arguments
+
+
+def _collect_variables_from_value(value, variables: set[str]):
+    if isinstance(value, Variable):
+        variables.add(value.name.value)
+    elif isinstance(value, ListValue):
+        for item in value.values:
+            _collect_variables_from_value(item, variables)
+    elif isinstance(value, ObjectValue):
+        for object_field in value.fields:
+            _collect_variables_from_value(object_field.value, variables)
+
+
+def _collect_cost_variables(node, arguments: set[str], variables: set[str]):
+    if isinstance(node, Field):
+        for argument in node.arguments or []:
+            if argument.name.value in arguments:
+                _collect_variables_from_value(argument.value, variables)
+    selection_set = getattr(node, "selection_set", None)
+    if not selection_set:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, Field | InlineFragment):
+            _collect_cost_variables(selection, arguments, variables)
+
+
+def get_cost_variables(
+    document: GraphQLDocument, cost_map: dict[str, Any]
+) -> tuple[str, ...]:
+    """Return names of the variables used by the cost multiplier arguments."""
+    arguments = get_cost_multiplier_arguments(cost_map)
+    variables: set[str] = set()
+    for definition in document.document_ast.definitions:
+        if isinstance(definition, OperationDefinition | FragmentDefinition):
+            _collect_cost_variables(definition, arguments, variables)
+    return tuple(sorted(variables))
+
+
+def get_query_plan(document: GraphQLDocument, cost_map: dict[str, Any]) -> QueryPlan:
+    """Return the cached plan of the document or build a new one.
+
+    Raises `GraphQLError` when the document mixes queries and introspection; such
+    documents are never cached.
+    """
+    key = document.document_string
+    try:
+        return _query_plans[key]
+    except KeyError:
+        pass
+
+    plan = QueryPlan(
+        identifier=query_identifier(document),
+        fingerprint=query_fingerprint(document),
+        contains_only_schema=check_if_query_contains_only_schema(document),
+        cost_variables=get_cost_variables(document, cost_map),
+    )
+    _query_plans[key] = plan
+    return plan
+
+
+def _get_costs_key(plan: QueryPlan, variables: dict[str, Any] | None) -> bytes:
+    cost_variables = {}
+    if variables:
+        cost_variables = {name: variables.get(name) for name in plan.cost_variables}
+    # Validation limits are part of the key, so the cached result is not reused
+    # when they change during the lifetime of the process.
+    return orjson.dumps(
+        [
+            settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+            settings.GRAPHQL_ALIAS_COUNT_LIMIT,
+            settings.GRAPHQL_MUTATION_COUNT_LIMIT,
+            cost_variables,
+        ],
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+
+def validate_query_with_plan(
+    plan: QueryPlan,
+    *,
+    schema: GraphQLSchema,
+    document: GraphQLDocument,
+    variables: dict[str, Any] | None,
+    cost_map: dict[str, Any],
+):
+    """Validate the query, reusing the cost of previous successful validations.
+
+    Only successful results are cached; documents failing the validation are
+    validated again on every request.
+    """
+    try:
+        costs_key = _get_costs_key(plan, variables)
+    except TypeError:
+        # Variables that can't be serialized are rejected later during execution.
+        costs_key = None
+
+    if costs_key is not None:
+        try:
+            return plan.costs[costs_key], None
+        except KeyError:
+            pass
+
+    query_cost, cost_errors = validate_query(
+        schema=schema,
+        document_ast=document.document_ast,
+        variables=variables,
+        cost_map=cost_map,
+    )
+    if not cost_errors and costs_key is not None:
+        plan.costs[costs_key] = query_cost
+    return query_cost, cost_errors
@@ -10,7 +10,7 @@ from ...tax.models import (
     TaxConfiguration,
     TaxConfigurationPerCountry,
 )
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, ProcessCachedDataLoader
 from ..product.dataloaders import (
     ProductByIdLoader,
     ProductByVariantIdLoader,
@@ -19,8 +19,9 @@ from ..product.dataloaders import (
 )
 
 
-class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
+class TaxConfigurationPerCountryByTaxConfigurationIDLoader(ProcessCachedDataLoader):
     context_key = "tax_configuration_per_country_by_tax_configuration_id"
+    cached_models = (TaxConfigurationPerCountry,)
 
     def batch_load(self, keys):
         tax_configs_per_country = TaxConfigurationPerCountry.objects.using(
@@ -34,8 +35,9 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
         return [one_to_many[key] for key in keys]
 
 
-class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
+class TaxConfigurationByChannelId(ProcessCachedDataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
+    cached_models = (TaxConfiguration,)
 
     def batch_load(self, keys):
         tax_configs = TaxConfiguration.objects.using(
@@ -44,8 +46,11 @@ class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
         return [tax_configs[key] for key in keys]
 
 
-class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountryRate]]):
+class TaxClassCountryRateByTaxClassIDLoader(
+    ProcessCachedDataLoader[int, list[TaxClassCountryRate]]
+):
     context_key = "tax_class_country_rate_by_tax_class_id"
+    cached_models = (TaxClassCountryRate,)
 
     def batch_load(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
@@ -59,8 +64,9 @@ class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountry
         return [one_to_many[key] for key in keys]
 
 
-class TaxClassDefaultRateByCountryLoader(DataLoader):
+class TaxClassDefaultRateByCountryLoader(ProcessCachedDataLoader):
     context_key = "tax_class_default_rate_by_country"
+    cached_models = (TaxClassCountryRate,)
 
     def batch_load(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
@@ -70,8 +76,9 @@ class TaxClassDefaultRateByCountryLoader(DataLoader):
         return [tax_rates_map.get(key) for key in keys]
 
 
-class TaxClassByIdLoader(DataLoader):
+class TaxClassByIdLoader(ProcessCachedDataLoader):
     context_key = "tax_class_by_id"
+    cached_models = (TaxClass,)
 
     def batch_load(self, keys):
         tax_class_map = TaxClass.objects.using(self.database_connection_name).in_bulk(
@@ -2,6 +2,8 @@ from typing import Final
 
 import graphene
 
+from ....checkout.cache import invalidate_checkout_catalogue_cache
+from ....core.utils.model_generation import invalidate_model_generation
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -77,6 +79,8 @@ class TaxClassCreate(DeprecatedModelMutation):
             for item in country_rates
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        invalidate_model_generation(models.TaxClassCountryRate)
+        invalidate_checkout_catalogue_cache()
 
     @classmethod
     def save(cls, _info, instance, cleaned_input, instance_tracker=None):
@@ -3,6 +3,8 @@ from typing import Final
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout.cache import invalidate_checkout_catalogue_cache
+from ....core.utils.model_generation import invalidate_model_generation
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -148,3 +150,6 @@ class TaxClassUpdate(DeprecatedModelMutation):
         remove_country_rates = cleaned_input.get("remove_country_rates", [])
         cls.update_country_rates(instance, update_country_rates)
         cls.remove_country_rates(remove_country_rates)
+        # Rates are changed with bulk operations, which don't send signals.
+        invalidate_model_generation(models.TaxClassCountryRate)
+        invalidate_checkout_catalogue_cache()
@@ -4,6 +4,7 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....app.utils import get_active_tax_apps
+from ....core.utils.model_generation import invalidate_model_generation
 from ....permission.enums import CheckoutPermissions
 from ....plugins import PLUGIN_IDENTIFIER_PREFIX
 from ....tax import error_codes, models
@@ -356,6 +357,7 @@ class TaxConfigurationUpdate(DeprecatedModelMutation):
             if item["country_code"] not in updated_countries
         ]
         models.TaxConfigurationPerCountry.objects.bulk_create(to_create)
+        invalidate_model_generation(models.TaxConfigurationPerCountry)
 
     @classmethod
     def remove_countries_configuration(cls, country_codes):
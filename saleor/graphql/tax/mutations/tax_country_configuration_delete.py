@@ -3,6 +3,8 @@ from typing import Final
 import graphene
 from django_countries.fields import Country
 
+from ....checkout.cache import invalidate_checkout_catalogue_cache
+from ....core.utils.model_generation import invalidate_model_generation
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -49,6 +51,8 @@ class TaxCountryConfigurationDelete(BaseMutation):
         country_code = data["country_code"]
         rates = models.TaxClassCountryRate.objects.filter(country=country_code)
         rates.delete()
+        invalidate_model_generation(models.TaxClassCountryRate)
+        invalidate_checkout_catalogue_cache()
         country_config = TaxCountryConfiguration(
             country=Country(country_code), tax_class_country_rates=[]
         )
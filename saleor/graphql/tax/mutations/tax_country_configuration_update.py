@@ -6,6 +6,8 @@ from django.db.models import Q
 from django_countries.fields import Country
 from graphql import GraphQLError
 
+from ....checkout.cache import invalidate_checkout_catalogue_cache
+from ....core.utils.model_generation import invalidate_model_generation
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -222,6 +224,8 @@ class TaxCountryConfigurationUpdate(BaseMutation):
             country=country_code,
             tax_class_id__in=delete_ids,
         ).delete()
+        invalidate_model_generation(models.TaxClassCountryRate)
+        invalidate_checkout_catalogue_cache()
 
     @classmethod
     def perform_mutation(cls, _root, _info: ResolveInfo, /, **data):
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 
@@ -98,6 +100,37 @@ def test_update_rates_as_app(app_api_client, permission_manage_taxes):
     _test_country_rates_update(app_api_client, permission_manage_taxes)
 
 
+@patch(
+    "saleor.graphql.tax.mutations.tax_country_configuration_update."
+    "invalidate_checkout_catalogue_cache"
+)
+def test_update_rates_invalidates_checkout_catalogue_cache(
+    mocked_invalidate_cache, staff_api_client, permission_manage_taxes
+):
+    # given
+    tax_class = TaxClass.objects.create(name="Books")
+    tax_class.country_rates.create(country="PL", rate=23)
+    variables = {
+        "countryCode": "PL",
+        "updateTaxClassRates": [
+            {
+                "taxClassId": graphene.Node.to_global_id("TaxClass", tax_class.pk),
+                "rate": 8,
+            }
+        ],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        MUTATION, variables, permissions=[permission_manage_taxes]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["taxCountryConfigurationUpdate"]["errors"]
+    mocked_invalidate_cache.assert_called_once_with()
+
+
 def test_create_country_rate_ignore_input_item_when_rate_is_none(
     staff_api_client, permission_manage_taxes
 ):
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from ..core.context import SaleorContext, disallow_replica_in_context
+from ..management.commands.benchmark_graphql_execution import (
+    build_benchmark_query,
+    build_benchmark_schema,
+)
+
+schema = build_benchmark_schema(fields=4)
+query = build_benchmark_query(objects=2, fields=4)
+
+
+@patch("saleor.core.db.connection.allow_writer_in_context")
+def test_query_skips_allow_writer_in_context(mocked_allow_writer_in_context):
+    # when
+    result = schema.execute(query, context_value=SaleorContext())
+
+    # then
+    assert not result.errors
+    assert result.data["products"][1] == {
+        "field0": "1-0",
+        "field1": "1-1",
+        "field2": "1-2",
+        "field3": "1-3",
+    }
+    mocked_allow_writer_in_context.assert_not_called()
+
+
+@patch("saleor.core.db.connection.allow_writer_in_context")
+def test_mutation_context_wraps_fields_with_allow_writer_in_context(
+    mocked_allow_writer_in_context,
+):
+    # given
+    context = SaleorContext()
+    disallow_replica_in_context(context)
+
+    # when
+    result = schema.execute(query, context_value=context)
+
+    # then
+    assert not result.errors
+    # One call for the list, one for each object and one for each field.
+    assert mocked_allow_writer_in_context.call_count == 1 + 2 + 2 * 4
+    mocked_allow_writer_in_context.assert_called_with(context)
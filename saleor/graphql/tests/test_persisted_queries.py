@@ -0,0 +1,166 @@
+import pytest
+from django.core.cache import cache
+
+from ...core.models import PersistedQuery
+from ..persisted_queries import (
+    AUTOMATIC_PERSISTED_QUERY_CACHE_KEY_PREFIX,
+    PERSISTED_QUERY_CACHE_KEY_PREFIX,
+    PERSISTED_QUERY_HASH_MISMATCH_CODE,
+    PERSISTED_QUERY_NOT_ALLOWED_CODE,
+    PERSISTED_QUERY_NOT_FOUND_CODE,
+    PERSISTED_QUERY_NOT_FOUND_MESSAGE,
+    PERSISTED_QUERY_NOT_SUPPORTED_CODE,
+    hash_query,
+    register_query,
+)
+
+QUERY = "query Shop { shop { name } }"
+
+
+def _clear_persisted_query_cache():
+    query_hash = hash_query(QUERY)
+    cache.delete(f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}")
+    cache.delete(f"{AUTOMATIC_PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}")
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _clear_persisted_query_cache()
+    yield
+    _clear_persisted_query_cache()
+
+
+@pytest.fixture(autouse=True)
+def _enable_automatic_persisted_queries(settings):
+    settings.GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED = True
+
+
+def _persisted_query_extension(query_hash, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": query_hash}}
+
+
+def _post(api_client, query_hash, query=None, version=1):
+    data = {"extensions": _persisted_query_extension(query_hash, version)}
+    if query:
+        data["query"] = query
+    return api_client.post(data)
+
+
+def _get_error_code(response):
+    return response.json()["errors"][0]["extensions"]["code"]
+
+
+def test_automatic_persisted_query_not_found(api_client):
+    # when
+    response = _post(api_client, hash_query(QUERY))
+
+    # then
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["message"] == PERSISTED_QUERY_NOT_FOUND_MESSAGE
+    assert _get_error_code(response) == PERSISTED_QUERY_NOT_FOUND_CODE
+
+
+def test_automatic_persisted_query_registered_by_client(api_client, site_settings):
+    # given
+    query_hash = hash_query(QUERY)
+    _post(api_client, query_hash, QUERY)
+
+    # when
+    response = _post(api_client, query_hash)
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_automatic_persisted_query_not_stored_when_invalid(api_client):
+    # given
+    query = "query { shop { notExistingField } }"
+    query_hash = hash_query(query)
+
+    # when
+    _post(api_client, query_hash, query)
+
+    # then
+    assert (
+        cache.get(f"{AUTOMATIC_PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}") is None
+    )
+
+
+def test_automatic_persisted_query_hash_mismatch(api_client):
+    # when
+    response = _post(api_client, hash_query("query { shop { name } }"), QUERY)
+
+    # then
+    assert _get_error_code(response) == PERSISTED_QUERY_HASH_MISMATCH_CODE
+
+
+def test_automatic_persisted_query_unsupported_version(api_client):
+    # when
+    response = _post(api_client, hash_query(QUERY), QUERY, version=2)
+
+    # then
+    assert _get_error_code(response) == PERSISTED_QUERY_NOT_SUPPORTED_CODE
+
+
+def test_automatic_persisted_queries_disabled(api_client, settings):
+    # given
+    settings.GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = _post(api_client, hash_query(QUERY), QUERY)
+
+    # then
+    assert _get_error_code(response) == PERSISTED_QUERY_NOT_SUPPORTED_CODE
+
+
+def test_registered_query_executed_by_hash(api_client, site_settings):
+    # given
+    persisted_query = register_query(QUERY)
+    _clear_persisted_query_cache()
+
+    # when
+    response = _post(api_client, persisted_query.hash)
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_queries_only_rejects_not_registered_query(api_client, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ONLY = True
+
+    # when
+    response = api_client.post_graphql(QUERY)
+
+    # then
+    assert _get_error_code(response) == PERSISTED_QUERY_NOT_ALLOWED_CODE
+
+
+def test_persisted_queries_only_ignores_client_registered_query(api_client, settings):
+    # given
+    query_hash = hash_query(QUERY)
+    _post(api_client, query_hash, QUERY)
+    settings.GRAPHQL_PERSISTED_QUERIES_ONLY = True
+
+    # when
+    response = _post(api_client, query_hash)
+
+    # then
+    assert _get_error_code(response) == PERSISTED_QUERY_NOT_FOUND_CODE
+
+
+def test_persisted_queries_only_executes_registered_query(
+    api_client, settings, site_settings
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ONLY = True
+    register_query(QUERY)
+
+    # when
+    response = api_client.post_graphql(QUERY)
+
+    # then
+    assert response.json()["data"]["shop"]["name"] == site_settings.site.name
+    assert PersistedQuery.objects.count() == 1
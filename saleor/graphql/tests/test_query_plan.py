@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+import pytest
+
+from ..api import backend, schema
+from ..core.validators import validate_query
+from ..query_cost_map import COST_MAP
+from ..query_plan import clear_query_plans_cache, get_cost_variables, get_query_plan
+
+PRODUCTS_QUERY = """
+    query Products($first: Int, $channel: String, $search: String) {
+        products(first: $first, channel: $channel, filter: {search: $search}) {
+            edges {
+                node {
+                    id
+                    variants {
+                        id
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_plans_cache():
+    clear_query_plans_cache()
+    yield
+    clear_query_plans_cache()
+
+
+def test_get_cost_variables_returns_only_multiplier_variables():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+
+    # when
+    cost_variables = get_cost_variables(document, COST_MAP)
+
+    # then
+    assert cost_variables == ("first",)
+
+
+def test_get_query_plan_is_cached():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+
+    # when
+    plan = get_query_plan(document, COST_MAP)
+
+    # then
+    assert get_query_plan(document, COST_MAP) is plan
+    assert plan.identifier == "products"
+    assert plan.fingerprint.startswith("query:Products:")
+    assert plan.contains_only_schema is False
+
+
+@patch("saleor.graphql.query_plan.validate_query", wraps=validate_query)
+def test_query_validation_is_cached_per_cost_variables(
+    mocked_validate_query, api_client, channel_USD
+):
+    # given
+    variables = {"first": 10, "channel": channel_USD.slug, "search": "a"}
+
+    # when
+    api_client.post_graphql(PRODUCTS_QUERY, variables)
+    first_response = api_client.post_graphql(
+        PRODUCTS_QUERY, {**variables, "search": "b"}
+    )
+    second_response = api_client.post_graphql(
+        PRODUCTS_QUERY, {**variables, "first": 20}
+    )
+
+    # then
+    assert mocked_validate_query.call_count == 2
+    first_cost = first_response.json()["extensions"]["cost"]["requestedQueryCost"]
+    second_cost = second_response.json()["extensions"]["cost"]["requestedQueryCost"]
+    assert second_cost > first_cost
+
+
+@patch("saleor.graphql.query_plan.validate_query", wraps=validate_query)
+def test_query_validation_is_not_cached_when_cost_exceeded(
+    mocked_validate_query, api_client, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_QUERY_MAX_COMPLEXITY = 1
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    # when
+    api_client.post_graphql(PRODUCTS_QUERY, variables)
+    response = api_client.post_graphql(PRODUCTS_QUERY, variables)
+
+    # then
+    assert mocked_validate_query.call_count == 2
+    assert response.json()["errors"][0]["message"].startswith(
+        "The query exceeds the maximum cost of 1."
+    )
@@ -31,13 +31,13 @@ from opentelemetry.trace import StatusCode
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from .. import __version__ as saleor_version
+from ..checkout.recalculation import checkout_recalculation_context
 from ..core.exceptions import PermissionDenied
 from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
 from ..webhook import observability
 from . import GraphQLOperationResult
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
-from .core.validators import validate_query
 from .error import clear_errors
 from .metrics import (
     record_graphql_batch_size,
@@ -47,19 +47,20 @@ from .metrics import (
     record_request_count,
     record_request_duration,
 )
+from .persisted_queries import (
+    PersistedQueryError,
+    get_persisted_query_hash,
+    resolve_persisted_query,
+    store_automatic_persisted_query,
+)
 from .query_cost_map import COST_MAP, QUERY_COST_FAILED_OPERATION
+from .query_plan import get_query_plan, validate_query_with_plan
 from .storefront_traffic import (
     STOREFRONT_TRAFFIC_ERROR_CODE,
     STOREFRONT_TRAFFIC_ERROR_MESSAGE,
     is_storefront_traffic_blocked,
 )
-from .utils import (
-    format_error,
-    get_source_service_name_value,
-    query_fingerprint,
-    query_identifier,
-)
-from .utils.validators import check_if_query_contains_only_schema
+from .utils import format_error, get_source_service_name_value
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
@@ -369,11 +370,26 @@ class GraphQLView(View):
                 "GraphQL Operation", scope=Scope.SERVICE
             ) as span,
             record_graphql_query_duration() as query_duration_attrs,
+            checkout_recalculation_context(),
         ):
             span.set_attribute(saleor_attributes.OPERATION_NAME, "graphql_query")
             span.set_attribute(saleor_attributes.COMPONENT, "graphql")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            sent_query = query
+            error_type: str | None
+            try:
+                query_hash = get_persisted_query_hash(data)
+                query = resolve_persisted_query(query, query_hash)
+            except PersistedQueryError as e:
+                span.set_status(status=StatusCode.ERROR, description=str(e))
+                error_type = e.__class__.__name__
+                record_graphql_query_count(error_type=error_type)
+                record_graphql_query_cost(
+                    QUERY_COST_FAILED_OPERATION, error_type=error_type
+                )
+                query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
+                return ExecutionResult(errors=[e], invalid=True)
             document, error = self.parse_query(query)
 
             with observability.report_gql_operation() as operation:
@@ -399,7 +415,10 @@ class GraphQLView(View):
             document = cast(GraphQLDocument, document)
 
             try:
-                query_contains_schema = check_if_query_contains_only_schema(document)
+                # The plan holds the document metadata that doesn't depend on the
+                # request, so it's computed only for the first request sending the
+                # document.
+                plan = get_query_plan(document, COST_MAP)
             except GraphQLError as e:
                 span.set_status(status=StatusCode.ERROR, description=str(e))
                 error_type = e.__class__.__name__
@@ -410,10 +429,9 @@ class GraphQLView(View):
                 query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
                 return ExecutionResult(errors=[e], invalid=True)
 
-            # Query identifier and fingerprint cannot be calculated earlier, as they
-            # require a parsed and valid GraphQL document.
-            operation_identifier = query_identifier(document)
-            operation_fingerprint = query_fingerprint(document)
+            query_contains_schema = plan.contains_only_schema
+            operation_identifier = plan.identifier
+            operation_fingerprint = plan.fingerprint
             operation_type = document.get_operation_type(operation_name)
 
             self._query = operation_identifier
@@ -451,9 +469,10 @@ class GraphQLView(View):
                     saleor_attributes.SALEOR_SOURCE_SERVICE_NAME, source_service_name
                 )
 
-            query_cost, cost_errors = validate_query(
+            query_cost, cost_errors = validate_query_with_plan(
+                plan,
                 schema=schema,
-                document_ast=document.document_ast,
+                document=document,
                 variables=variables,
                 cost_map=COST_MAP,
             )
@@ -523,6 +542,10 @@ class GraphQLView(View):
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
 
+                if sent_query and query_hash and not response.invalid:
+                    # Store the query only once it was parsed and validated.
+                    store_automatic_persisted_query(sent_query, query_hash)
+
                 record_graphql_query_count(
                     operation_type=operation_type,
                     error_type=error_type,
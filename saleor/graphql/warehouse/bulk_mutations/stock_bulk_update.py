@@ -10,6 +10,7 @@ from ....permission.enums import ProductPermissions
 from ....warehouse import models
 from ....warehouse.error_codes import StockBulkUpdateErrorCode
 from ....warehouse.lock_objects import stock_qs_select_for_update
+from ....warehouse.stock_availability import update_stock_availability_for_stocks
 from ....warehouse.webhooks.stock_events import (
     trigger_product_variant_stocks_updated,
 )
@@ -390,6 +391,7 @@ class StockBulkUpdate(BaseMutation):
 
         # Stocks are locked in `get_stocks`
         models.Stock.objects.bulk_update(stocks_to_update, fields=["quantity"])
+        update_stock_availability_for_stocks(stocks_to_update)
 
         return stocks_to_update
 
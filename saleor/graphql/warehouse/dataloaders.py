@@ -15,6 +15,7 @@ from promise import Promise
 from ...channel.models import Channel
 from ...product.models import ProductVariantChannelListing
 from ...warehouse import WarehouseClickAndCollectOption
+from ...warehouse.availability import can_use_stock_availability_table
 from ...warehouse.models import (
     ChannelWarehouse,
     PreorderReservation,
@@ -24,6 +25,7 @@ from ...warehouse.models import (
     Warehouse,
 )
 from ...warehouse.reservations import is_reservation_enabled
+from ...warehouse.stock_availability import get_stock_availability
 from ..channel.dataloaders.by_self import ChannelBySlugLoader
 from ..core.dataloaders import DataLoader
 from ..shipping.dataloaders import (
@@ -81,9 +83,20 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             site = get_site_promise(self.context).get()
             for key, variant_ids in variants_by_country_and_channel.items():
                 country_code, channel_slug = key
-                quantities = self.batch_load_quantities_by_country(
-                    country_code, channel_slug, variant_ids, site
-                )
+                if channel_slug and can_use_stock_availability_table(
+                    site.settings,
+                    include_shipping_zones=(
+                        site.settings.use_legacy_shipping_zone_stock_availability
+                    ),
+                    country_code=country_code,
+                ):
+                    quantities = self.batch_load_quantities_from_availability_table(
+                        country_code, channel_slug, variant_ids, site
+                    )
+                else:
+                    quantities = self.batch_load_quantities_by_country(
+                        country_code, channel_slug, variant_ids, site
+                    )
                 for variant_id, quantity in quantities:
                     quantity_by_variant_and_country[
                         (variant_id, country_code, channel_slug)
@@ -91,6 +104,26 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
 
         return [quantity_by_variant_and_country[key] for key in keys]
 
+    def batch_load_quantities_from_availability_table(
+        self,
+        country_code: CountryCode | None,
+        channel_slug: str,
+        variant_ids: Iterable[int],
+        site: Site,
+    ) -> Iterable[tuple[int, int]]:
+        quantity_map = get_stock_availability(
+            variant_ids,
+            channel_slug,
+            country_code,
+            database_connection_name=self.database_connection_name,
+        )
+        global_quantity_limit = site.settings.limit_quantity_per_checkout
+        quantity_limit = global_quantity_limit or sys.maxsize
+        return [
+            (variant_id, min(quantity_map.get(variant_id, 0), quantity_limit))
+            for variant_id in variant_ids
+        ]
+
     def batch_load_quantities_by_country(
         self,
         country_code: CountryCode | None,
@@ -596,10 +629,34 @@ class AvailableQuantityByProductVariantIdAndChannelSlugLoader(
                 stocks_reservations[stock_id] = quantity_reserved
         return stocks_reservations
 
-    def batch_load(self, keys: Iterable[VariantIdChannelSlug]):
-        def with_stocks_and_site(data):
-            stocks_per_key, site = data
+    def batch_load_from_availability_table(
+        self, keys: Iterable[VariantIdChannelSlug], site
+    ) -> list[int]:
+        variant_ids_by_channel_slug: defaultdict[str, list[int]] = defaultdict(list)
+        for variant_id, channel_slug in keys:
+            variant_ids_by_channel_slug[channel_slug].append(variant_id)
+
+        quantity_map: dict[VariantIdChannelSlug, int] = {}
+        for channel_slug, variant_ids in variant_ids_by_channel_slug.items():
+            quantities = get_stock_availability(
+                variant_ids,
+                channel_slug,
+                database_connection_name=self.database_connection_name,
+            )
+            for variant_id, quantity in quantities.items():
+                quantity_map[(variant_id, channel_slug)] = quantity
+
+        global_quantity_limit = site.settings.limit_quantity_per_checkout
+        return [
+            max(
+                0,
+                min(quantity_map.get(key, 0), global_quantity_limit or sys.maxsize),
+            )
+            for key in keys
+        ]
 
+    def batch_load(self, keys: Iterable[VariantIdChannelSlug]):
+        def with_stocks_and_site(stocks_per_key, site):
             all_variant_ids = list({variant_id for variant_id, _ in keys})
             stocks_reservations = self.prepare_stocks_reservations_map(
                 all_variant_ids, site
@@ -625,13 +682,20 @@ class AvailableQuantityByProductVariantIdAndChannelSlugLoader(
                 )
             return results
 
+        site = get_site_promise(self.context).get()
+        if can_use_stock_availability_table(
+            site.settings, include_shipping_zones=False
+        ):
+            return self.batch_load_from_availability_table(keys, site)
+
         stocks_promise = (
             StocksWithAvailableQuantityByProductVariantIdAndChannelSlugLoader(
                 self.context
             ).load_many(keys)
         )
-        site_promise = get_site_promise(self.context)
-        return Promise.all([stocks_promise, site_promise]).then(with_stocks_and_site)
+        return stocks_promise.then(
+            lambda stocks_per_key: with_stocks_and_site(stocks_per_key, site)
+        )
 
 
 class StocksWithAvailableQuantityByProductVariantIdAndChannelSlugLoader(
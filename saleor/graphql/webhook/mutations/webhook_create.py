@@ -4,6 +4,7 @@ from django.core.exceptions import ValidationError
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.cache import invalidate_webhooks_cache
 from ....webhook.const import MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT
 from ....webhook.error_codes import WebhookErrorCode
 from ....webhook.validators import (
@@ -204,3 +205,4 @@ class WebhookCreate(DeprecatedModelMutation, NotifyUserEventValidationMixin):
                 for event in events
             ]
         )
+        invalidate_webhooks_cache()
@@ -1,6 +1,8 @@
 import datetime
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
@@ -9,6 +11,7 @@ from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from graphql import get_default_backend, parse
 from graphql.error import GraphQLError
+from graphql.language.printer import print_ast
 from promise import Promise
 
 from ...account.models import User
@@ -22,6 +25,8 @@ from ..utils import format_error
 
 logger = logging.getLogger(__name__)
 
+NORMALIZED_SUBSCRIPTION_QUERIES_CACHE_SIZE = 1024
+
 
 def initialize_request(
     app: App | None,
@@ -256,6 +261,40 @@ def generate_payload_from_subscription(
     return event_payload
 
 
+@lru_cache(maxsize=NORMALIZED_SUBSCRIPTION_QUERIES_CACHE_SIZE)
+def normalize_subscription_query(subscription_query: str) -> str:
+    """Return the subscription query without insignificant whitespaces and comments."""
+    try:
+        return print_ast(parse(subscription_query))
+    except GraphQLError:
+        return subscription_query
+
+
+def group_webhooks_by_payload(
+    webhooks: Iterable[Webhook],
+) -> list[tuple[str, list[Webhook]]]:
+    """Group subscription webhooks which generate identical payloads.
+
+    The payload is generated in the context of the webhook's app, which determines
+    the permissions and the resolved recipient, so only webhooks of the same app with
+    equivalent subscription queries are grouped together. Each group is returned with
+    the subscription query of its first webhook; webhooks without a subscription
+    query are skipped.
+    """
+    queries_per_key: dict[tuple[int, str], str] = {}
+    webhooks_per_key: dict[tuple[int, str], list[Webhook]] = defaultdict(list)
+    for webhook in webhooks:
+        if not webhook.subscription_query:
+            continue
+        key = (webhook.app_id, normalize_subscription_query(webhook.subscription_query))
+        queries_per_key.setdefault(key, webhook.subscription_query)
+        webhooks_per_key[key].append(webhook)
+    return [
+        (queries_per_key[key], grouped_webhooks)
+        for key, grouped_webhooks in webhooks_per_key.items()
+    ]
+
+
 def get_pre_save_payload_key(webhook, instance):
     return f"{webhook.pk}_{instance.pk}"
 
@@ -279,7 +318,8 @@ def generate_pre_save_payloads(
 
     request_map: dict[int, SaleorContext] = {}
 
-    for webhook in webhooks:
+    for subscription_query, grouped_webhooks in group_webhooks_by_payload(webhooks):
+        webhook = grouped_webhooks[0]
         request = request_map.get(webhook.app_id)
         if not request:
             request = initialize_request(
@@ -293,17 +333,15 @@ def generate_pre_save_payloads(
             )
             request_map[webhook.app_id] = request
 
-        if not webhook.subscription_query:
-            continue
-
         for instance in instances:
             instance_payload = generate_payload_from_subscription(
                 event_type=event_type,
                 subscribable_object=instance,
-                subscription_query=webhook.subscription_query,
+                subscription_query=subscription_query,
                 request=request,
             )
-            key = get_pre_save_payload_key(webhook, instance)
-            pre_save_payloads[key] = instance_payload
+            for grouped_webhook in grouped_webhooks:
+                key = get_pre_save_payload_key(grouped_webhook, instance)
+                pre_save_payloads[key] = instance_payload
 
     return pre_save_payloads
@@ -9,6 +9,7 @@ from ..subscription_payload import (
     generate_payload_promise_from_subscription,
     generate_pre_save_payloads,
     get_pre_save_payload_key,
+    group_webhooks_by_payload,
     initialize_request,
 )
 
@@ -124,6 +125,64 @@ def test_generate_pre_save_payloads(webhook_app, variant):
     assert pre_save_payloads[key]
 
 
+@override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
+def test_generate_pre_save_payloads_for_webhooks_with_identical_queries(
+    webhook_app, variant
+):
+    # given
+    webhook_1, webhook_2 = Webhook.objects.bulk_create(
+        [
+            Webhook(name="Webhook 1", app=webhook_app, subscription_query=query)
+            for query in [SUBSCRIPTION_QUERY, " ".join(SUBSCRIPTION_QUERY.split())]
+        ]
+    )
+
+    # when
+    pre_save_payloads = generate_pre_save_payloads(
+        [webhook_1, webhook_2],
+        [variant],
+        WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+        None,
+        timezone.now(),
+    )
+
+    # then
+    payload_1 = pre_save_payloads[get_pre_save_payload_key(webhook_1, variant)]
+    payload_2 = pre_save_payloads[get_pre_save_payload_key(webhook_2, variant)]
+    assert payload_1
+    assert payload_1 is payload_2
+
+
+def test_group_webhooks_by_payload(webhook_app, app):
+    # given
+    other_query = SUBSCRIPTION_QUERY.replace("name", "sku")
+    webhook, same_query_webhook, other_query_webhook, other_app_webhook = (
+        Webhook.objects.bulk_create(
+            [
+                Webhook(app=webhook_app, subscription_query=SUBSCRIPTION_QUERY),
+                Webhook(
+                    app=webhook_app,
+                    subscription_query=f"# comment{SUBSCRIPTION_QUERY}",
+                ),
+                Webhook(app=webhook_app, subscription_query=other_query),
+                Webhook(app=app, subscription_query=SUBSCRIPTION_QUERY),
+            ]
+        )
+    )
+
+    # when
+    groups = group_webhooks_by_payload(
+        [webhook, same_query_webhook, other_query_webhook, other_app_webhook]
+    )
+
+    # then
+    assert groups == [
+        (SUBSCRIPTION_QUERY, [webhook, same_query_webhook]),
+        (other_query, [other_query_webhook]),
+        (SUBSCRIPTION_QUERY, [other_app_webhook]),
+    ]
+
+
 def test_generate_payload_from_subscription(checkout, subscription_webhook, app):
     # given
     query = """
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -19,6 +20,26 @@ class PluginConfig(AppConfig):
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        self.connect_cache_invalidation_signals()
+
+    def connect_cache_invalidation_signals(self):
+        from ..channel.models import Channel
+        from .models import PluginConfiguration
+        from .signals import invalidate_plugins_cache_on_change
+
+        # preventing duplicate signals
+        for model in (Channel, PluginConfiguration):
+            post_save.connect(
+                invalidate_plugins_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_plugins_cache_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_plugins_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_plugins_cache_on_{model.__name__}_delete",
+            )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
@@ -0,0 +1,73 @@
+import functools
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ..core.utils.model_generation import (
+    GenerationLocalCache,
+    LocalCacheKey,
+    get_generation,
+    invalidate_generation,
+)
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGINS_GENERATION_CACHE_KEY = "plugins_configuration_generation"
+PLUGINS_LOCAL_CACHE_SIZE = 1024
+
+_local_cache = GenerationLocalCache(PLUGINS_LOCAL_CACHE_SIZE)
+
+
+def invalidate_plugins_cache():
+    """Invalidate the plugin configurations cached by all processes.
+
+    Model signals of plugin configurations and channels call it automatically; code
+    using bulk operations, which don't send signals, has to call it explicitly.
+    """
+    invalidate_generation([PLUGINS_GENERATION_CACHE_KEY])
+
+
+def get_or_load_plugin_configurations[T](
+    key: LocalCacheKey, load: Callable[[], T]
+) -> T:
+    """Return plugin configurations cached in the process memory or load them."""
+    timeout = settings.PLUGINS_CONFIGURATION_CACHE_TIMEOUT
+    if not timeout:
+        return load()
+    generation = get_generation([PLUGINS_GENERATION_CACHE_KEY])
+    return _local_cache.get_or_load(key, generation, timeout, load)
+
+
+def clear_local_plugins_cache():
+    _local_cache.clear()
+
+
+@functools.cache
+def import_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
+
+
+@functools.cache
+def plugin_implements_hook(plugin_path: str, method_name: str) -> bool:
+    """Return whether the plugin class provides its own implementation of the hook.
+
+    `BasePlugin` only annotates the hooks, so the plugins which don't override a hook
+    have no attribute with its name.
+    """
+    PluginClass = import_plugin_class(plugin_path)
+    return getattr(PluginClass, method_name, NotImplemented) is not NotImplemented
+
+
+@functools.cache
+def get_hook_implementers(
+    plugin_paths: tuple[str, ...], method_name: str
+) -> frozenset[type["BasePlugin"]]:
+    """Return the classes of the configured plugins implementing the hook."""
+    return frozenset(
+        import_plugin_class(path)
+        for path in plugin_paths
+        if plugin_implements_hook(path, method_name)
+    )
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from prices import TaxedMoney
 
 from ..channel.models import Channel
@@ -50,6 +49,11 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExternalAccessTokens
+from .cache import (
+    get_hook_implementers,
+    get_or_load_plugin_configurations,
+    import_plugin_class,
+)
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -131,6 +135,7 @@ class PluginsManager(PaymentInterface):
     def __init__(self, plugins: list[str], requestor_getter=None, allow_replica=True):
         with tracer.start_as_current_span("PluginsManager.__init__"):
             self.plugins = plugins
+            self._plugin_paths = tuple(plugins)
             self._allow_replica = allow_replica
             self.all_plugins = []
             self.global_plugins = []
@@ -152,11 +157,13 @@ class PluginsManager(PaymentInterface):
         self, channel_slug: str | None, channel: Channel | None = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
+            global_db_config = get_or_load_plugin_configurations(
+                (self.database, None), lambda: self._get_db_plugin_configs(None)
+            )
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -169,20 +176,18 @@ class PluginsManager(PaymentInterface):
             self.loaded_global = True
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
+            cached_channel, channel_db_config = get_or_load_plugin_configurations(
+                (self.database, channel_slug),
+                lambda: self._get_channel_db_plugin_configs(channel_slug, channel),
+            )
             if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
+                channel = cached_channel
                 if not channel:
                     return
 
-            channel_db_config = self._get_db_plugin_configs(channel)
-
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -198,6 +203,23 @@ class PluginsManager(PaymentInterface):
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
 
+    def _get_channel_db_plugin_configs(
+        self, channel_slug: str, channel: Channel | None = None
+    ) -> tuple[Channel | None, dict]:
+        if channel is None:
+            channel = (
+                Channel.objects.using(self.database).filter(slug=channel_slug).first()
+            )
+            if not channel:
+                return None, {}
+        configs = self._get_db_plugin_configs(channel)
+        if settings.PLUGINS_CONFIGURATION_CACHE_TIMEOUT:
+            # cache the configurations with their channel, so accessing it after
+            # unpickling doesn't query the database
+            for db_plugin_config in configs.values():
+                db_plugin_config.channel = channel
+        return channel, configs
+
     def _get_db_plugin_configs(self, channel: Channel | None):
         with tracer.start_as_current_span("_get_db_plugin_configs"):
             plugin_manager_configs = PluginConfiguration.objects.using(
@@ -219,12 +241,21 @@ class PluginsManager(PaymentInterface):
     ):
         """Try to run a method with the given name on each declared active plugin."""
         value = default_value
+        implementers = get_hook_implementers(self._plugin_paths, method_name)
+        if not implementers:
+            # No configured plugin overrides the hook, skip building the list of
+            # active plugins and dispatching the call to each of them. The plugins
+            # are loaded regardless, their configurations are cached per process.
+            self._ensure_channel_plugins_loaded(channel_slug)
+            return value
         plugins = self.get_plugins(
             channel_slug=channel_slug,
             active_only=True,
             plugin_ids=plugin_ids,
         )
         for plugin in plugins:
+            if type(plugin) not in implementers:
+                continue
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
             )
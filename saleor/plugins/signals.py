@@ -0,0 +1,5 @@
+from .cache import invalidate_plugins_cache
+
+
+def invalidate_plugins_cache_on_change(sender, **kwargs):
+    invalidate_plugins_cache()
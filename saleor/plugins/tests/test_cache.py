@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+
+from ..cache import clear_local_plugins_cache, get_hook_implementers
+from ..manager import PluginsManager
+from ..models import PluginConfiguration
+from .sample_plugins import ActivePlugin, ChannelPluginSample, PluginSample
+
+CHANNEL_PLUGIN_PATH = "saleor.plugins.tests.sample_plugins.ChannelPluginSample"
+
+
+@pytest.fixture(autouse=True)
+def _enable_plugins_cache(settings):
+    settings.PLUGINS_CONFIGURATION_CACHE_TIMEOUT = 60
+    clear_local_plugins_cache()
+    yield
+    clear_local_plugins_cache()
+
+
+@pytest.fixture
+def channel_plugin_configuration(channel_USD):
+    return PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID,
+        channel=channel_USD,
+        active=False,
+        configuration=[{"name": "input-per-channel", "value": "cached"}],
+    )
+
+
+def test_get_hook_implementers():
+    # given
+    plugin_paths = (
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.ActivePlugin",
+    )
+
+    # when
+    implementers = get_hook_implementers(plugin_paths, "promotion_created")
+
+    # then
+    assert implementers == {PluginSample}
+    assert ActivePlugin not in implementers
+    assert not get_hook_implementers(plugin_paths, "order_created")
+
+
+def test_run_method_on_plugins_without_implementers_returns_default_value(
+    product_type,
+):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    # when
+    result = manager.get_tax_code_from_object_meta(product_type, channel_slug=None)
+
+    # then
+    assert result.code == ""
+    assert manager.loaded_global
+
+
+@patch.object(PluginSample, "promotion_created")
+def test_run_method_on_plugins_calls_only_implementers(
+    promotion_created_mock, catalogue_promotion
+):
+    # given
+    manager = PluginsManager(
+        plugins=[
+            "saleor.plugins.tests.sample_plugins.PluginSample",
+            "saleor.plugins.tests.sample_plugins.ActivePlugin",
+        ]
+    )
+
+    # when
+    manager.promotion_created(catalogue_promotion)
+
+    # then
+    promotion_created_mock.assert_called_once_with(
+        catalogue_promotion, previous_value=None
+    )
+
+
+def test_plugin_configurations_are_cached_between_managers(
+    channel_plugin_configuration, channel_USD, django_assert_num_queries
+):
+    # given
+    PluginsManager(plugins=[CHANNEL_PLUGIN_PATH]).get_plugins(channel_USD.slug)
+    manager = PluginsManager(plugins=[CHANNEL_PLUGIN_PATH])
+
+    # when
+    with django_assert_num_queries(0):
+        plugins = manager.get_plugins(channel_USD.slug)
+        channel = plugins[0].channel
+
+    # then
+    assert len(plugins) == 1
+    assert plugins[0].active is False
+    assert plugins[0].configuration[0]["value"] == "cached"
+    assert channel == channel_USD
+
+
+def test_plugin_configurations_cache_invalidated_on_configuration_change(
+    channel_plugin_configuration, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    PluginsManager(plugins=[CHANNEL_PLUGIN_PATH]).get_plugins(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_plugin_configuration.active = True
+        channel_plugin_configuration.save(update_fields=["active"])
+    manager = PluginsManager(plugins=[CHANNEL_PLUGIN_PATH])
+    plugins = manager.get_plugins(channel_USD.slug)
+
+    # then
+    assert len(plugins) == 1
+    assert plugins[0].active is True
@@ -2791,9 +2791,10 @@ class WebhookPlugin(BasePlugin):
             return previous_value
 
         event_type = WebhookEventSyncType.STORED_PAYMENT_METHOD_DELETE_REQUESTED
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[app_data.app_identifier]
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -2916,9 +2917,10 @@ class WebhookPlugin(BasePlugin):
         event_type = (
             WebhookEventSyncType.PAYMENT_GATEWAY_INITIALIZE_TOKENIZATION_SESSION
         )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[request_data.app_identifier]
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -2936,9 +2938,8 @@ class WebhookPlugin(BasePlugin):
         previous_value: "PaymentMethodTokenizationResponseData",
         additional_legacy_payload_data: dict | None = None,
     ):
-        webhook = get_webhooks_for_event(
-            event_type, apps_identifier=[app_identifier]
-        ).first()
+        webhooks = get_webhooks_for_event(event_type, apps_identifier=[app_identifier])
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -3123,7 +3124,8 @@ class WebhookPlugin(BasePlugin):
             )
 
         for app in apps:
-            webhook = get_webhooks_for_event(event_type, app.webhooks.all()).first()
+            webhooks = get_webhooks_for_event(event_type, app.webhooks.all())
+            webhook = webhooks[0] if webhooks else None
             if not webhook:
                 raise PaymentError(f"No payment webhook found for event: {event_type}.")
             response_data = trigger_webhook_sync_promise(
@@ -3274,12 +3276,13 @@ class WebhookPlugin(BasePlugin):
                 app_identifier=transaction_session_data.payment_gateway_data.app_identifier,
                 error=error,
             )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             webhook_event,
             apps_identifier=[
                 transaction_session_data.payment_gateway_data.app_identifier
             ],
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
         if not webhook:
             error = (
                 f"Unable to find an active webhook for `{webhook_event.upper()}` event."
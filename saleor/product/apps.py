@@ -6,11 +6,13 @@ class ProductAppConfig(AppConfig):
     name = "saleor.product"
 
     def ready(self):
+        from ..core.utils.model_generation import watch_model_changes
         from .models import Category, Collection, ProductMedia
         from .signals import (
             delete_background_image,
             delete_product_media_image,
         )
+        from .utils.pricing import PRICING_TAX_MODELS
 
         # preventing duplicate signals
         post_delete.connect(
@@ -28,3 +30,6 @@ class ProductAppConfig(AppConfig):
             sender=ProductMedia,
             dispatch_uid="delete_product_media_image",
         )
+        # changes of taxes make the precomputed product pricing outdated
+        for model in PRICING_TAX_MODELS:
+            watch_model_changes(model)
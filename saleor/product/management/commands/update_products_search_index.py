@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...search import update_dirty_products_search_vector
+
+DEFAULT_BATCH_SIZE = 300
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Updates the search index of products marked as dirty. With `--continuous` "
+        "it runs as a dedicated indexer, processing batches as long as there are "
+        "dirty products and polling for new ones otherwise."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--continuous",
+            action="store_true",
+            help="Keep running and index products as soon as they are marked dirty.",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=DEFAULT_POLL_INTERVAL,
+            help="Seconds to wait before checking for dirty products again.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        while True:
+            product_ids = update_dirty_products_search_vector(batch_size)
+            if product_ids:
+                self.stdout.write(
+                    f"Updated search index of {len(product_ids)} products."
+                )
+            if len(product_ids) == batch_size:
+                continue
+            if not options["continuous"]:
+                break
+            time.sleep(options["poll_interval"])
+            # the connection may be dropped by the database while waiting
+            close_old_connections()
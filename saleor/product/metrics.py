@@ -0,0 +1,70 @@
+import datetime
+
+from django.utils import timezone
+
+from ..core.telemetry import (
+    DEFAULT_DURATION_BUCKETS,
+    MetricType,
+    Scope,
+    Unit,
+    meter,
+)
+
+# Initialize metrics
+METRIC_DISCOUNTED_PRICE_LISTINGS_PROCESSED = meter.create_metric(
+    "saleor.product.discounted_price.listings_processed",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of variant listings with recalculated discounted price.",
+)
+METRIC_DISCOUNTED_PRICE_LISTINGS_CHANGED = meter.create_metric(
+    "saleor.product.discounted_price.listings_changed",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of variant listings with changed discounted price.",
+)
+METRIC_DISCOUNTED_PRICE_BATCH_DURATION = meter.create_metric(
+    "saleor.product.discounted_price.batch_duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of discounted prices recalculation for a batch of products.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+METRIC_SEARCH_INDEX_UPDATED_PRODUCTS = meter.create_metric(
+    "saleor.product.search_index.updated_products",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.COUNT,
+    description="Number of products with updated search index.",
+)
+METRIC_SEARCH_INDEX_LAG = meter.create_metric(
+    "saleor.product.search_index.lag",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time between the last product update and updating its search index.",
+    bucket_boundaries=[0, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600],
+)
+
+
+def record_discounted_prices_recalculation(
+    *, processed_count: int, changed_count: int, duration: float
+) -> None:
+    meter.record(
+        METRIC_DISCOUNTED_PRICE_LISTINGS_PROCESSED, processed_count, Unit.COUNT
+    )
+    meter.record(METRIC_DISCOUNTED_PRICE_LISTINGS_CHANGED, changed_count, Unit.COUNT)
+    meter.record(METRIC_DISCOUNTED_PRICE_BATCH_DURATION, duration, Unit.SECOND)
+
+
+def record_search_index_update(updated_at_list: list[datetime.datetime]) -> None:
+    meter.record(METRIC_SEARCH_INDEX_UPDATED_PRODUCTS, len(updated_at_list), Unit.COUNT)
+    now = timezone.now()
+    for updated_at in updated_at_list:
+        meter.record(
+            METRIC_SEARCH_INDEX_LAG, (now - updated_at).total_seconds(), Unit.SECOND
+        )
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0027_channel_allow_legacy_gift_card_use"),
+        ("product", "0207_remove_producttype_is_digital_from_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductPricing",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country_code", models.CharField(max_length=2)),
+                ("currency", models.CharField(max_length=3)),
+                ("tax_class_id", models.IntegerField(blank=True, null=True)),
+                ("tax_version", models.CharField(max_length=255)),
+                ("display_gross_prices", models.BooleanField(default=True)),
+                ("pricing", models.JSONField(blank=True, default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_pricings",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pricings",
+                        to="product.product",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("product", "channel", "country_code")},
+            },
+        ),
+    ]
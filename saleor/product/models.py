@@ -347,6 +347,40 @@ class ProductChannelListing(PublishableModel):
         )
 
 
+class ProductPricing(models.Model):
+    """Pricing of the product in the channel, precomputed for the country.
+
+    Rows are maintained in the background for the default country of the channel
+    and are valid only for the `tax_version` and the tax class of the product, or
+    of its product type, they were calculated with, see
+    `saleor.product.utils.pricing`.
+    """
+
+    product = models.ForeignKey(
+        Product,
+        null=False,
+        on_delete=models.CASCADE,
+        related_name="pricings",
+    )
+    channel = models.ForeignKey(
+        Channel,
+        null=False,
+        on_delete=models.CASCADE,
+        related_name="product_pricings",
+    )
+    country_code = models.CharField(max_length=2)
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    tax_class_id = models.IntegerField(blank=True, null=True)
+    tax_version = models.CharField(max_length=255)
+    display_gross_prices = models.BooleanField(default=True)
+    pricing = JSONField(blank=True, default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [["product", "channel", "country_code"]]
+        ordering = ("pk",)
+
+
 class ProductVariant(SortableModel, ModelWithMetadata, ModelWithExternalReference):
     sku = models.CharField(max_length=255, unique=True, null=True, blank=True)
     name = models.CharField(max_length=255, blank=True)
@@ -3,14 +3,17 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import Value, prefetch_related_objects
 
 from ..attribute.models import AssignedProductAttributeValue, AttributeValue
 from ..attribute.search import get_search_vectors_for_attribute_values
-from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
-from ..core.utils.batches import queryset_in_batches
+from ..core.db.connection import allow_writer
+from ..core.postgres import NoValidationSearchVector, get_weighted_search_documents
+from ..core.utils.batches import BatchProgress, queryset_rows_in_batches
 from ..page.models import Page
 from ..product.models import Product
+from .metrics import record_search_index_update
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -29,31 +32,76 @@ PRODUCTS_BATCH_SIZE = 100
 # and product variants.
 
 
+SEARCH_VECTOR_WEIGHTS = ["A", "B", "C", "D"]
+
+
 def _prep_product_search_vector_index(
     products, page_id_to_title_map: dict[int, str] | None = None
 ):
     prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
 
+    documents_per_weight: dict[str, list[str]] = {
+        weight: [] for weight in SEARCH_VECTOR_WEIGHTS
+    }
     for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(
+        documents = get_weighted_search_documents(
+            prepare_product_search_vector_value(
                 product,
                 already_prefetched=True,
                 page_id_to_title_map=page_id_to_title_map,
             )
         )
-        product.search_index_dirty = False
+        for weight in SEARCH_VECTOR_WEIGHTS:
+            documents_per_weight[weight].append(documents.get(weight, ""))
+
+    _update_products_search_vectors(
+        [product.id for product in products], documents_per_weight
+    )
+    record_search_index_update(
+        [product.updated_at for product in products if product.updated_at]
+    )
+
+
+def _update_products_search_vectors(
+    product_ids: list[int], documents_per_weight: dict[str, list[str]]
+):
+    """Compute search vectors of the whole batch in a single query.
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
+    The weighted documents are passed as arrays and turned into `tsvector` values
+    on the database side, which is much cheaper than a `CASE` expression with
+    a separate search vector expression for every product.
+    """
+    search_vector_sql = " || ".join(
+        f"setweight(to_tsvector('simple', documents.weight_{weight.lower()}), "
+        f"'{weight}')"
+        for weight in SEARCH_VECTOR_WEIGHTS
     )
+    columns = ", ".join(f"weight_{weight.lower()}" for weight in SEARCH_VECTOR_WEIGHTS)
+    arrays = ", ".join("%s::text[]" for _ in SEARCH_VECTOR_WEIGHTS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {Product._meta.db_table} AS product
+            SET search_vector = {search_vector_sql}, search_index_dirty = false
+            FROM unnest(%s::integer[], {arrays}) AS documents(id, {columns})
+            WHERE product.id = documents.id
+            """,
+            [
+                product_ids,
+                *[documents_per_weight[weight] for weight in SEARCH_VECTOR_WEIGHTS],
+            ],
+        )
 
 
 def update_products_search_vector(product_ids: Iterable[int]):
     db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
     product_ids = list(product_ids)
-    products = Product.objects.using(db_conn).filter(pk__in=product_ids).order_by("pk")
-    for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
+    products = Product.objects.using(db_conn).filter(pk__in=product_ids)
+    progress = BatchProgress("product.search_index", total=len(product_ids))
+    for products_batch in queryset_rows_in_batches(
+        products, PRODUCTS_BATCH_SIZE, progress=progress
+    ):
+        product_pks = [product.pk for product in products_batch]
         value_ids = (
             AssignedProductAttributeValue.objects.using(db_conn)
             .filter(product_id__in=product_pks)
@@ -70,10 +118,31 @@ def update_products_search_vector(product_ids: Iterable[int]):
             .values_list("id", "title")
         )
 
-        products_batch = list(Product.objects.using(db_conn).filter(id__in=product_pks))
         _prep_product_search_vector_index(products_batch, page_id_to_title_map)
 
 
+def update_dirty_products_search_vector(
+    batch_size: int,
+) -> list[int]:
+    """Update the search index of the least recently updated dirty products.
+
+    The batch is selected and locked on the writer, so a run started right after
+    the previous one doesn't pick its products again because of the replica lag,
+    and concurrent runs skip products that are being indexed.
+
+    Return IDs of the updated products.
+    """
+    with allow_writer(), transaction.atomic():
+        product_ids = list(
+            Product.objects.filter(search_index_dirty=True)
+            .order_by("updated_at")
+            .select_for_update(of=("self",), skip_locked=True)[:batch_size]
+            .values_list("id", flat=True)
+        )
+        update_products_search_vector(product_ids)
+    return product_ids
+
+
 def prepare_product_search_vector_value(
     product: "Product",
     *,
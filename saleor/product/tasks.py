@@ -21,6 +21,7 @@ from ..discount import PromotionType
 from ..discount.models import Promotion, PromotionRule
 from ..plugins.manager import get_plugins_manager
 from ..product import ProductMediaTypes
+from ..thumbnail.tasks import schedule_product_media_thumbnails
 from ..warehouse.management import deactivate_preorder_for_variant
 from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
@@ -33,7 +34,12 @@ from .models import (
     ProductType,
     ProductVariant,
 )
-from .search import update_products_search_vector
+from .search import update_dirty_products_search_vector
+from .utils.pricing import (
+    get_product_ids_with_outdated_pricing,
+    is_product_pricing_enabled,
+    update_products_pricing,
+)
 from .utils.product import mark_products_in_channels_as_dirty
 from .utils.tasks_utils import (
     create_image,
@@ -59,6 +65,7 @@ VARIANTS_UPDATE_BATCH = 500
 DISCOUNTED_PRODUCT_BATCH = 2000
 # Results in update time ~2s when 600 channels exist
 PROMOTION_RULE_BATCH_SIZE = 50
+PRODUCT_PRICING_BATCH_SIZE = 500
 
 
 def _variants_in_batches(variants_qs):
@@ -301,9 +308,28 @@ def recalculate_discounted_price_for_products_task():
             ProductChannelListing.objects.filter(id__in=channel_listings_ids).update(
                 discounted_price_dirty=False
             )
+        update_products_pricing(products_ids)
         recalculate_discounted_price_for_products_task.delay()
 
 
+@app.task
+@allow_writer()
+def update_products_pricing_task(product_id_gt: int = 0):
+    """Recalculate the precomputed pricing of products with an outdated one.
+
+    The listed products are checked in batches, each batch scheduling the next one.
+    """
+    if not is_product_pricing_enabled():
+        return
+    product_ids, last_product_id = get_product_ids_with_outdated_pricing(
+        product_id_gt, PRODUCT_PRICING_BATCH_SIZE
+    )
+    if product_ids:
+        update_products_pricing(product_ids)
+    if last_product_id is not None:
+        update_products_pricing_task.delay(last_product_id)
+
+
 @app.task
 @allow_writer()
 def update_discounted_prices_task(product_ids: Iterable[int]):
@@ -350,14 +376,11 @@ def mark_products_search_vector_as_dirty(product_ids: list[int]):
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = (
-        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(search_index_dirty=True)
-        .order_by("updated_at")[:PRODUCTS_BATCH_SIZE]
-        .values_list("id", flat=True)
-    )
-    with allow_writer():
-        update_products_search_vector(products)
+    product_ids = update_dirty_products_search_vector(PRODUCTS_BATCH_SIZE)
+    # Continue without waiting for the next beat when there are more dirty products,
+    # so the index catches up quickly after bulk imports.
+    if len(product_ids) == PRODUCTS_BATCH_SIZE:
+        update_products_search_vector_task.delay()
 
 
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
@@ -452,3 +475,4 @@ def fetch_product_media_image_task(product_media_id: int):
     validate_image_mime_type(image)
     validate_image_exif(image)
     update_product_media(product_media, image)
+    schedule_product_media_thumbnails(product_media.pk)
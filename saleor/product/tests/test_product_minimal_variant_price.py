@@ -804,3 +804,92 @@ def test_update_discounted_prices_returns_changed_prices_for_multiple_channels(
     assert cp_pln.currency == channel_PLN.currency_code
     assert cp_pln.previous_price_amount == variant_price_pln
     assert cp_pln.new_price_amount == variant_price_pln - reward_value
+
+
+def test_update_discounted_prices_for_promotion_applies_best_rule_for_batch(
+    product_list, channel_USD
+):
+    # given
+    variants = [product.variants.first() for product in product_list]
+    variant_listings = [
+        variant.channel_listings.get(channel_id=channel_USD.id) for variant in variants
+    ]
+    promotion = Promotion.objects.create(name="Promotion")
+    fixed_rule = promotion.rules.create(
+        name="Fixed promotion rule",
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal(1),
+    )
+    percentage_rule = promotion.rules.create(
+        name="Percentage promotion rule",
+        reward_value_type=RewardValueType.PERCENTAGE,
+        reward_value=Decimal(50),
+    )
+    outdated_rule = promotion.rules.create(
+        name="Outdated promotion rule",
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal(5),
+    )
+    for rule in [fixed_rule, percentage_rule]:
+        rule.channels.add(channel_USD)
+        rule.variants.add(*variants)
+
+    outdated_listing_rules = VariantChannelListingPromotionRule.objects.bulk_create(
+        [
+            VariantChannelListingPromotionRule(
+                variant_channel_listing=listing,
+                promotion_rule=outdated_rule,
+                discount_amount=Decimal(5),
+                currency=channel_USD.currency_code,
+            )
+            for listing in variant_listings
+        ]
+    )
+
+    # when
+    update_discounted_prices_for_promotion(
+        Product.objects.filter(id__in=[product.id for product in product_list])
+    )
+
+    # then
+    for listing in variant_listings:
+        listing.refresh_from_db()
+        assert listing.discounted_price_amount == listing.price_amount / 2
+        listing_rule = listing.variantlistingpromotionrule.get()
+        assert listing_rule.promotion_rule_id == percentage_rule.id
+        assert listing_rule.discount_amount == listing.price_amount / 2
+    assert not VariantChannelListingPromotionRule.objects.filter(
+        id__in=[listing_rule.id for listing_rule in outdated_listing_rules]
+    ).exists()
+
+
+def test_update_discounted_prices_for_promotion_skips_not_dirty_listings(
+    product, channel_USD
+):
+    # given
+    variant = product.variants.first()
+    variant_channel_listing = variant.channel_listings.get(channel_id=channel_USD.id)
+    product_channel_listing = product.channel_listings.get(channel_id=channel_USD.id)
+    product_channel_listing.discounted_price_dirty = False
+    product_channel_listing.save(update_fields=["discounted_price_dirty"])
+    discounted_price_amount = variant_channel_listing.discounted_price_amount
+
+    promotion = Promotion.objects.create(name="Promotion")
+    rule = promotion.rules.create(
+        name="Fixed promotion rule",
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal(2),
+    )
+    rule.channels.add(channel_USD)
+    rule.variants.add(variant)
+
+    # when
+    changed_prices = update_discounted_prices_for_promotion(
+        Product.objects.filter(id__in=[product.id]), only_dirty_products=True
+    )
+
+    # then
+    assert changed_prices == []
+    variant_channel_listing.refresh_from_db()
+    assert variant_channel_listing.discounted_price_amount == discounted_price_amount
+    assert not variant_channel_listing.variantlistingpromotionrule.exists()
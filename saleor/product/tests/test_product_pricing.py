@@ -0,0 +1,186 @@
+from decimal import Decimal
+
+import pytest
+
+from ...core.utils.model_generation import invalidate_model_generation
+from ...tax import TaxCalculationStrategy
+from ...tax.models import TaxClassCountryRate
+from ..models import ProductChannelListing, ProductPricing, ProductVariantChannelListing
+from ..tasks import update_products_pricing_task
+from ..utils.availability import get_product_availability
+from ..utils.pricing import (
+    get_product_availability_from_pricing,
+    get_product_ids_with_outdated_pricing,
+    update_products_pricing,
+)
+
+
+@pytest.fixture(autouse=True)
+def _enable_product_pricing(settings):
+    settings.PRODUCT_PRICING_PROJECTION_ENABLED = True
+
+
+@pytest.fixture
+def flat_rates_channel_USD(channel_USD):
+    tax_configuration = channel_USD.tax_configuration
+    tax_configuration.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tax_configuration.charge_taxes = True
+    tax_configuration.prices_entered_with_tax = False
+    tax_configuration.save()
+    TaxClassCountryRate.objects.create(
+        country=channel_USD.default_country, rate=Decimal(23)
+    )
+    return channel_USD
+
+
+def test_update_products_pricing(product, flat_rates_channel_USD):
+    # given
+    channel = flat_rates_channel_USD
+    product_channel_listing = ProductChannelListing.objects.get(
+        product=product, channel=channel
+    )
+    expected_availability = get_product_availability(
+        product_channel_listing=product_channel_listing,
+        variants_channel_listing=list(
+            ProductVariantChannelListing.objects.filter(
+                variant__product=product, channel=channel
+            )
+        ),
+        prices_entered_with_tax=False,
+        tax_calculation_strategy=TaxCalculationStrategy.FLAT_RATES,
+        tax_rate=Decimal(23),
+    )
+
+    # when
+    update_products_pricing([product.pk])
+
+    # then
+    pricing = ProductPricing.objects.get(product=product, channel=channel)
+    assert pricing.country_code == channel.default_country.code
+    assert pricing.currency == channel.currency_code
+    assert (
+        get_product_availability_from_pricing(pricing, product_channel_listing)
+        == expected_availability
+    )
+
+
+def test_update_products_pricing_without_variant_listings(product, channel_USD):
+    # given
+    ProductVariantChannelListing.objects.filter(variant__product=product).delete()
+
+    # when
+    update_products_pricing([product.pk])
+
+    # then
+    pricing = ProductPricing.objects.get(product=product, channel=channel_USD)
+    assert get_product_availability_from_pricing(pricing, None) is None
+
+
+def test_update_products_pricing_removes_rows_of_other_countries(product, channel_USD):
+    # given
+    update_products_pricing([product.pk])
+    channel_USD.default_country = "PL"
+    channel_USD.save(update_fields=["default_country"])
+
+    # when
+    update_products_pricing([product.pk])
+
+    # then
+    assert list(
+        ProductPricing.objects.filter(product=product, channel=channel_USD).values_list(
+            "country_code", flat=True
+        )
+    ) == ["PL"]
+
+
+def test_update_products_pricing_disabled(product, settings):
+    # given
+    settings.PRODUCT_PRICING_PROJECTION_ENABLED = False
+
+    # when
+    update_products_pricing([product.pk])
+
+    # then
+    assert not ProductPricing.objects.exists()
+
+
+def test_get_product_ids_with_outdated_pricing(
+    product, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    missing_product_ids = get_product_ids_with_outdated_pricing(0, limit=10)[0]
+    update_products_pricing([product.pk])
+    up_to_date_product_ids = get_product_ids_with_outdated_pricing(0, limit=10)[0]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_model_generation(TaxClassCountryRate)
+
+    # then
+    assert missing_product_ids == [product.pk]
+    assert up_to_date_product_ids == []
+    assert get_product_ids_with_outdated_pricing(0, limit=10)[0] == [product.pk]
+
+
+def test_get_product_ids_with_outdated_pricing_after_product_type_tax_class_change(
+    product, channel_USD, tax_classes, django_capture_on_commit_callbacks
+):
+    # given
+    product.tax_class = None
+    product.save(update_fields=["tax_class"])
+    product_type = product.product_type
+    update_products_pricing([product.pk])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        product_type.name = "New name"
+        product_type.save(update_fields=["name"])
+    renamed_type_product_ids = get_product_ids_with_outdated_pricing(0, limit=10)[0]
+    with django_capture_on_commit_callbacks(execute=True):
+        product_type.tax_class = tax_classes[0]
+        product_type.save(update_fields=["tax_class"])
+
+    # then
+    assert renamed_type_product_ids == []
+    assert get_product_ids_with_outdated_pricing(0, limit=10)[0] == [product.pk]
+
+
+def test_get_product_ids_with_outdated_pricing_skips_dirty_listings(
+    product, channel_USD
+):
+    # given
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_dirty=True
+    )
+
+    # when
+    product_ids = get_product_ids_with_outdated_pricing(0, limit=10)[0]
+
+    # then
+    assert product_ids == []
+
+
+def test_get_product_ids_with_outdated_pricing_in_batches(product_list, channel_USD):
+    # given
+    product_ids = sorted(product.pk for product in product_list)
+
+    # when
+    first_batch, last_product_id = get_product_ids_with_outdated_pricing(0, limit=2)
+    assert last_product_id is not None
+    second_batch, next_product_id = get_product_ids_with_outdated_pricing(
+        last_product_id, limit=2
+    )
+
+    # then
+    assert first_batch == product_ids[:2]
+    assert last_product_id == product_ids[1]
+    assert second_batch == product_ids[2:]
+    assert next_product_id is None
+
+
+def test_update_products_pricing_task(product, channel_USD):
+    # when
+    update_products_pricing_task()
+
+    # then
+    assert ProductPricing.objects.filter(product=product, channel=channel_USD).exists()
@@ -1,5 +1,8 @@
+from django.contrib.postgres.search import SearchQuery
+from django.core.management import call_command
+
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import update_dirty_products_search_vector, update_products_search_vector
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +18,55 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_update_products_search_vector_indexes_weighted_documents(product):
+    # given
+    product.name = "Café koszulka"
+    product.search_vector = None
+    product.search_index_dirty = True
+    product.save(update_fields=["name", "search_vector", "search_index_dirty"])
+    variant = product.variants.first()
+
+    # when
+    update_products_search_vector([product.id])
+
+    # then
+    product.refresh_from_db()
+    assert product.search_index_dirty is False
+    assert "'cafe':1A" in product.search_vector
+    for term in ["koszulka", variant.sku]:
+        assert Product.objects.filter(
+            search_vector=SearchQuery(term, config="simple")
+        ).exists()
+
+
+def test_update_dirty_products_search_vector(product_list):
+    # given
+    Product.objects.update(search_index_dirty=False)
+    dirty_products = product_list[:2]
+    Product.objects.filter(id__in=[product.id for product in dirty_products]).update(
+        search_index_dirty=True
+    )
+
+    # when
+    product_ids = update_dirty_products_search_vector(batch_size=1)
+
+    # then
+    dirty_product_ids = {product.id for product in dirty_products}
+    assert len(product_ids) == 1
+    assert product_ids[0] in dirty_product_ids
+    assert set(
+        Product.objects.filter(search_index_dirty=True).values_list("id", flat=True)
+    ) == dirty_product_ids - set(product_ids)
+
+
+def test_update_products_search_index_command(product_list):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    call_command("update_products_search_index", batch_size=2)
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=True).exists()
@@ -325,6 +325,35 @@ def test_update_products_search_vector_task(product):
     assert product.search_index_dirty is False
 
 
+@patch("saleor.product.tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_schedules_next_batch(
+    mocked_delay, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    mocked_delay.assert_called_once_with()
+    assert Product.objects.filter(search_index_dirty=True).count() == 2
+
+
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_last_batch(mocked_delay, product):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    mocked_delay.assert_not_called()
+
+
 @pytest.mark.parametrize("dirty_products_number", [0, 1, 2, 3])
 def test_update_products_search_vector_task_with_static_number_of_queries(
     product, product_list, dirty_products_number, django_assert_num_queries
@@ -337,7 +366,7 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         product_list[i].save(update_fields=["search_index_dirty"])
 
     # when & # then
-    with django_assert_num_queries(16):
+    with django_assert_num_queries(17):
         update_products_search_vector_task()
 
 
@@ -0,0 +1,328 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.db.models.functions import Coalesce
+from prices import Money, TaxedMoney, TaxedMoneyRange
+
+from ...core.utils.model_generation import get_models_generation
+from ...tax.models import (
+    TaxClass,
+    TaxClassCountryRate,
+    TaxConfiguration,
+    TaxConfigurationPerCountry,
+)
+from ...tax.utils import (
+    get_display_gross_prices,
+    get_tax_calculation_strategy,
+    get_tax_rate_for_country,
+)
+from ..models import (
+    ProductChannelListing,
+    ProductPricing,
+    ProductVariantChannelListing,
+)
+from .availability import ProductAvailability, get_product_availability
+
+# Changes of these models can change the prices with taxes of any product, so their
+# generation is the version of taxes the pricing was calculated with. The tax class
+# of the product type is stored in the pricing rows instead, so editing product
+# types doesn't outdate the pricing of all products.
+PRICING_TAX_MODELS = (
+    TaxConfiguration,
+    TaxConfigurationPerCountry,
+    TaxClass,
+    TaxClassCountryRate,
+)
+
+
+def is_product_pricing_enabled() -> bool:
+    return settings.PRODUCT_PRICING_PROJECTION_ENABLED
+
+
+def get_tax_version() -> str:
+    generation = get_models_generation(PRICING_TAX_MODELS)
+    return ":".join(str(value) for value in generation)
+
+
+def _serialize_taxed_money(price: TaxedMoney | None) -> dict | None:
+    if price is None:
+        return None
+    return {"net": str(price.net.amount), "gross": str(price.gross.amount)}
+
+
+def _serialize_taxed_money_range(price_range: TaxedMoneyRange | None) -> dict | None:
+    if price_range is None:
+        return None
+    return {
+        "start": _serialize_taxed_money(price_range.start),
+        "stop": _serialize_taxed_money(price_range.stop),
+    }
+
+
+def _deserialize_taxed_money(data: dict | None, currency: str) -> TaxedMoney | None:
+    if data is None:
+        return None
+    return TaxedMoney(
+        net=Money(Decimal(data["net"]), currency),
+        gross=Money(Decimal(data["gross"]), currency),
+    )
+
+
+def _deserialize_taxed_money_range(
+    data: dict | None, currency: str
+) -> TaxedMoneyRange | None:
+    if data is None:
+        return None
+    return TaxedMoneyRange(
+        start=_deserialize_taxed_money(data["start"], currency),
+        stop=_deserialize_taxed_money(data["stop"], currency),
+    )
+
+
+def serialize_product_availability(availability: ProductAvailability) -> dict:
+    return {
+        "price_range": _serialize_taxed_money_range(availability.price_range),
+        "price_range_undiscounted": _serialize_taxed_money_range(
+            availability.price_range_undiscounted
+        ),
+        "price_range_prior": _serialize_taxed_money_range(
+            availability.price_range_prior
+        ),
+        "discount": _serialize_taxed_money(availability.discount),
+        "discount_prior": _serialize_taxed_money(availability.discount_prior),
+    }
+
+
+def get_product_availability_from_pricing(
+    pricing: ProductPricing, product_channel_listing: ProductChannelListing | None
+) -> ProductAvailability | None:
+    """Return the availability of the product stored in the precomputed pricing.
+
+    `None` is returned when the product has no priced variants in the channel.
+    """
+    if not pricing.pricing:
+        return None
+    data = pricing.pricing
+    currency = pricing.currency
+    discount = _deserialize_taxed_money(data["discount"], currency)
+    is_visible = (
+        product_channel_listing is not None and product_channel_listing.is_visible
+    )
+    return ProductAvailability(
+        on_sale=is_visible and discount is not None,
+        price_range=_deserialize_taxed_money_range(data["price_range"], currency),
+        price_range_undiscounted=_deserialize_taxed_money_range(
+            data["price_range_undiscounted"], currency
+        ),
+        price_range_prior=_deserialize_taxed_money_range(
+            data["price_range_prior"], currency
+        ),
+        discount=discount,
+        discount_prior=_deserialize_taxed_money(data["discount_prior"], currency),
+    )
+
+
+def _get_tax_class_rates(
+    tax_class_ids: Iterable[int],
+) -> dict[int | None, list[TaxClassCountryRate]]:
+    rates: defaultdict[int | None, list[TaxClassCountryRate]] = defaultdict(list)
+    for rate in TaxClassCountryRate.objects.filter(tax_class_id__in=tax_class_ids):
+        rates[rate.tax_class_id].append(rate)
+    return rates
+
+
+def _get_default_tax_rates(country_codes: Iterable[str]) -> dict[str, Decimal]:
+    return {
+        rate.country.code: rate.rate
+        for rate in TaxClassCountryRate.objects.filter(
+            tax_class=None, country__in=country_codes
+        )
+    }
+
+
+def _get_tax_class_id(product) -> int | None:
+    return product.tax_class_id or product.product_type.tax_class_id
+
+
+def calculate_products_pricing(
+    product_ids: Iterable[int], tax_version: str
+) -> dict[tuple[int, int, str], ProductPricing]:
+    """Calculate the pricing of the products for default countries of their channels.
+
+    The calculation matches the `Product.pricing` GraphQL field resolved without
+    an address.
+    """
+    listings = list(
+        ProductChannelListing.objects.filter(product_id__in=product_ids)
+        .select_related("channel", "product__product_type")
+        .order_by("pk")
+    )
+    channel_ids = {listing.channel_id for listing in listings}
+    variant_listings: dict[tuple[int, int], list[ProductVariantChannelListing]] = (
+        defaultdict(list)
+    )
+    for variant_listing in (
+        ProductVariantChannelListing.objects.filter(
+            variant__product_id__in=product_ids,
+            channel_id__in=channel_ids,
+            price_amount__isnull=False,
+        )
+        .annotate(product_id=F("variant__product_id"))
+        .order_by("pk")
+    ):
+        key = (getattr(variant_listing, "product_id"), variant_listing.channel_id)
+        variant_listings[key].append(variant_listing)
+
+    tax_configurations = {
+        tax_configuration.channel_id: tax_configuration
+        for tax_configuration in TaxConfiguration.objects.filter(
+            channel_id__in=channel_ids
+        ).prefetch_related("country_exceptions")
+    }
+    tax_class_ids = {_get_tax_class_id(listing.product) for listing in listings}
+    tax_class_rates = _get_tax_class_rates(filter(None, tax_class_ids))
+    default_tax_rates = _get_default_tax_rates(
+        {listing.channel.default_country.code for listing in listings}
+    )
+
+    pricings = {}
+    for listing in listings:
+        tax_configuration = tax_configurations.get(listing.channel_id)
+        if tax_configuration is None:
+            continue
+        product = listing.product
+        country_code = listing.channel.default_country.code
+        pricing = ProductPricing(
+            product_id=product.pk,
+            channel_id=listing.channel_id,
+            country_code=country_code,
+            currency=listing.channel.currency_code,
+            tax_class_id=_get_tax_class_id(product),
+            tax_version=tax_version,
+        )
+        pricings[(product.pk, listing.channel_id, country_code)] = pricing
+
+        variants_channel_listing = variant_listings[(product.pk, listing.channel_id)]
+        if not variants_channel_listing:
+            # The product has no pricing in the channel.
+            continue
+        tax_configuration_country = next(
+            (
+                country_exception
+                for country_exception in tax_configuration.country_exceptions.all()
+                if country_exception.country.code == country_code
+            ),
+            None,
+        )
+        tax_class_id = pricing.tax_class_id
+        tax_rate = get_tax_rate_for_country(
+            tax_class_rates.get(tax_class_id, []) if tax_class_id else [],
+            default_tax_rates.get(country_code, Decimal(0)),
+            country_code,
+        )
+        availability = get_product_availability(
+            product_channel_listing=listing,
+            variants_channel_listing=variants_channel_listing,
+            prices_entered_with_tax=tax_configuration.prices_entered_with_tax,
+            tax_calculation_strategy=get_tax_calculation_strategy(
+                tax_configuration, tax_configuration_country
+            ),
+            tax_rate=tax_rate,
+        )
+        pricing.display_gross_prices = get_display_gross_prices(
+            tax_configuration, tax_configuration_country
+        )
+        pricing.pricing = serialize_product_availability(availability)
+    return pricings
+
+
+def update_products_pricing(product_ids: Iterable[int]):
+    """Recalculate the precomputed pricing of the products in all their channels.
+
+    Rows of channels the products are no longer listed in, and of countries that
+    are no longer the default ones, are removed.
+    """
+    if not is_product_pricing_enabled():
+        return
+    product_ids = sorted(set(product_ids))
+    if not product_ids:
+        return
+
+    # Read the version before the taxes, so taxes changed in the meantime leave the
+    # rows outdated instead of storing prices with old taxes under the new version.
+    tax_version = get_tax_version()
+    pricings = calculate_products_pricing(product_ids, tax_version)
+    with transaction.atomic():
+        stale_ids = [
+            pk
+            for pk, *key in ProductPricing.objects.filter(
+                product_id__in=product_ids
+            ).values_list("pk", "product_id", "channel_id", "country_code")
+            if tuple(key) not in pricings
+        ]
+        if stale_ids:
+            ProductPricing.objects.filter(pk__in=stale_ids).delete()
+        ProductPricing.objects.bulk_create(
+            pricings.values(),
+            update_conflicts=True,
+            unique_fields=["product", "channel", "country_code"],
+            update_fields=[
+                "currency",
+                "tax_class_id",
+                "tax_version",
+                "display_gross_prices",
+                "pricing",
+                "updated_at",
+            ],
+        )
+
+
+def get_product_ids_with_outdated_pricing(
+    product_id_gt: int, limit: int
+) -> tuple[list[int], int | None]:
+    """Return IDs of products listed in channels without the up-to-date pricing.
+
+    Only the next `limit` listed products with IDs greater than `product_id_gt` are
+    checked, so a single call doesn't scan all listings. The last checked product
+    ID is returned to continue from, or `None` when no products are left.
+
+    Listings waiting for the recalculation of discounted prices are skipped, their
+    pricing is recalculated once their discounted prices are.
+    """
+    product_ids = list(
+        ProductChannelListing.objects.filter(product_id__gt=product_id_gt)
+        .order_by("product_id")
+        .values_list("product_id", flat=True)
+        .distinct()[:limit]
+    )
+    if not product_ids:
+        return [], None
+    last_product_id = product_ids[-1] if len(product_ids) == limit else None
+
+    # The tax class of the product, or of its product type when not set.
+    up_to_date_pricing = ProductPricing.objects.annotate(
+        product_tax_class_id=Coalesce(
+            "product__tax_class_id", "product__product_type__tax_class_id"
+        )
+    ).filter(
+        Q(tax_class_id=F("product_tax_class_id"))
+        | Q(tax_class_id__isnull=True, product_tax_class_id__isnull=True),
+        product_id=OuterRef("product_id"),
+        channel_id=OuterRef("channel_id"),
+        country_code=OuterRef("channel__default_country"),
+        tax_version=get_tax_version(),
+    )
+    outdated_product_ids = list(
+        ProductChannelListing.objects.filter(
+            product_id__in=product_ids, discounted_price_dirty=False
+        )
+        .filter(~Exists(up_to_date_pricing))
+        .order_by("product_id")
+        .values_list("product_id", flat=True)
+        .distinct()
+    )
+    return outdated_product_ids, last_product_id
@@ -4,6 +4,7 @@ from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef, QuerySet
 
+from ...checkout.cache import invalidate_checkout_catalogue_cache
 from ...discount.models import PromotionRule
 from ...product.models import ProductChannelListing
 from ..models import ProductVariant
@@ -100,6 +101,9 @@ def mark_products_in_channels_as_dirty(
     if not channel_to_product_ids:
         return
     channels = list(channel_to_product_ids.keys())
+    # catalogue changes always mark the products as dirty, also when they're done
+    # with bulk operations that don't send model signals
+    invalidate_checkout_catalogue_cache(channels)
     product_ids = {
         product_id
         for product_ids in channel_to_product_ids.values()
@@ -1,23 +1,24 @@
+import time
 from collections import defaultdict
+from collections.abc import Callable
 from decimal import Decimal
+from itertools import chain
 from typing import cast
 from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, OuterRef, Q
 from prices import Money
 
 from ...channel.models import Channel
-from ...core.taxes import zero_money
+from ...checkout.cache import invalidate_checkout_catalogue_cache
 from ...discount import PromotionRuleInfo
 from ...discount.models import PromotionRule
-from ...discount.utils.promotion import (
-    calculate_discounted_price_for_promotions,
-    get_variants_to_promotion_rules_map,
-)
+from ...discount.utils.promotion import get_variants_to_promotion_rules_map
 from ..interface import VariantDiscountedPriceChange
 from ..managers import ProductsQueryset, ProductVariantQueryset
+from ..metrics import record_discounted_prices_recalculation
 from ..models import (
     ProductChannelListing,
     ProductVariant,
@@ -43,6 +44,7 @@ def update_discounted_prices_for_promotion(
     Returns a list of VariantDiscountedPriceChange for variants whose discounted price
     changed.
     """
+    start = time.monotonic()
     variant_qs = ProductVariant.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(Exists(products.filter(id=OuterRef("product_id"))))
@@ -59,6 +61,7 @@ def update_discounted_prices_for_promotion(
 
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
+    applied_rule_id_per_changed_variant_listing: dict[int, UUID | None] = {}
 
     changed_variant_prices: list[VariantDiscountedPriceChange] = []
 
@@ -68,9 +71,29 @@ def update_discounted_prices_for_promotion(
         .prefetch_related("channel")
     )
     if only_dirty_products:
-        product_channel_listings.filter(discounted_price_dirty=True)
+        product_channel_listings = product_channel_listings.filter(
+            discounted_price_dirty=True
+        )
+    product_channel_listings_list = list(product_channel_listings)
+
+    rule_ids_per_variant = {
+        variant_id: [rule_info.rule.id for rule_info in rules_info]
+        for variant_id, rules_info in rules_info_per_variant.items()
+    }
+    channels = {
+        listing.channel_id: listing.channel for listing in product_channel_listings_list
+    }
+    rule_discounts_per_channel = _get_rule_discounts_per_channel(
+        rules_info_per_variant, channels
+    )
+    # discounted amounts are computed once per rule and price in the given channel
+    # and shared by all listings from the batch
+    discounted_amounts_per_channel: dict[int, dict[tuple[UUID, Decimal], Decimal]] = (
+        defaultdict(dict)
+    )
 
-    for product_channel_listing in product_channel_listings:
+    processed_listings_count = 0
+    for product_channel_listing in product_channel_listings_list:
         product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
         variant_listings = product_to_variant_listings_per_channel_map[product_id][
@@ -78,6 +101,7 @@ def update_discounted_prices_for_promotion(
         ]
         if not variant_listings:
             continue
+        processed_listings_count += len(variant_listings)
         (
             discounted_variants_price,
             variant_listings_to_update,
@@ -86,9 +110,12 @@ def update_discounted_prices_for_promotion(
             variant_price_changes,
         ) = _get_discounted_variants_prices_for_promotions(
             variant_listings,
-            rules_info_per_variant,
+            rule_ids_per_variant,
             product_channel_listing.channel,
+            rule_discounts_per_channel[channel_id],
+            discounted_amounts_per_channel[channel_id],
             variant_listing_to_listing_rule_per_rule_map,
+            applied_rule_id_per_changed_variant_listing,
         )
 
         product_discounted_price = min(discounted_variants_price)
@@ -114,11 +141,45 @@ def update_discounted_prices_for_promotion(
         changed_variants_listings_to_update,
         changed_variant_listing_promotion_rule_to_create,
         changed_variant_listing_promotion_rule_to_update,
+        applied_rule_id_per_changed_variant_listing,
     )
 
+    record_discounted_prices_recalculation(
+        processed_count=processed_listings_count,
+        changed_count=len(changed_variants_listings_to_update),
+        duration=time.monotonic() - start,
+    )
     return changed_variant_prices
 
 
+def _get_rule_discounts_per_channel(
+    rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
+    channels: dict[int, Channel],
+) -> dict[int, dict[UUID, Callable[[Money], Money]]]:
+    """Return discount functions of the promotion rules applicable in each channel.
+
+    The data is returned in the following shape:
+    {
+        channel_id: {
+            rule_id: discount
+        }
+    }
+    """
+    rule_discounts_per_channel: dict[int, dict[UUID, Callable[[Money], Money]]] = (
+        defaultdict(dict)
+    )
+    for rules_info in rules_info_per_variant.values():
+        for rule_info in rules_info:
+            rule = rule_info.rule
+            for channel_id in rule_info.channel_ids:
+                channel = channels.get(channel_id)
+                discounts = rule_discounts_per_channel[channel_id]
+                if channel is None or rule.id in discounts:
+                    continue
+                discounts[rule.id] = rule.get_discount(channel.currency_code)
+    return rule_discounts_per_channel
+
+
 def _update_or_create_listings(
     changed_products_listings_to_update: list[ProductChannelListing],
     changed_variants_listings_to_update: list[ProductVariantChannelListing],
@@ -128,7 +189,31 @@ def _update_or_create_listings(
     changed_variant_listing_promotion_rule_to_update: list[
         VariantChannelListingPromotionRule
     ],
+    applied_rule_id_per_changed_variant_listing: dict[int, UUID | None],
 ):
+    if changed_variant_listing_promotion_rule_to_update:
+        # listings of the updated relations are not fetched, so their channels are
+        # unknown
+        invalidate_checkout_catalogue_cache()
+    else:
+        variant_listings: list[ProductVariantChannelListing] = [
+            *changed_variants_listings_to_update,
+            *(
+                listing_rule.variant_channel_listing
+                for listing_rule in changed_variant_listing_promotion_rule_to_create
+            ),
+        ]
+        invalidate_checkout_catalogue_cache(
+            chain(
+                (listing.channel_id for listing in changed_products_listings_to_update),
+                (listing.channel_id for listing in variant_listings),
+            )
+        )
+
+    if applied_rule_id_per_changed_variant_listing:
+        _delete_outdated_variant_listing_promotion_rules(
+            applied_rule_id_per_changed_variant_listing
+        )
     if changed_products_listings_to_update:
         ProductChannelListing.objects.bulk_update(
             sorted(changed_products_listings_to_update, key=lambda listing: listing.id),
@@ -153,6 +238,28 @@ def _update_or_create_listings(
         )
 
 
+def _delete_outdated_variant_listing_promotion_rules(
+    applied_rule_id_per_variant_listing: dict[int, UUID | None],
+):
+    """Delete variant listing - promotion rule relations that are not valid anymore.
+
+    All relations of the given listings are deleted, except the ones with the rule
+    currently applied to the listing. The relations of the whole batch are deleted
+    with a single query.
+    """
+    listing_ids_per_rule_id: dict[UUID | None, list[int]] = defaultdict(list)
+    for listing_id, rule_id in applied_rule_id_per_variant_listing.items():
+        listing_ids_per_rule_id[rule_id].append(listing_id)
+
+    lookup = Q()
+    for rule_id, listing_ids in listing_ids_per_rule_id.items():
+        rule_lookup = Q(variant_channel_listing_id__in=listing_ids)
+        if rule_id is not None:
+            rule_lookup &= ~Q(promotion_rule_id=rule_id)
+        lookup |= rule_lookup
+    VariantChannelListingPromotionRule.objects.filter(lookup).delete()
+
+
 def _create_variant_listing_promotion_rule(variant_listing_promotion_rule_to_create):
     with transaction.atomic():
         rule_ids = [
@@ -253,9 +360,12 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
 
 def _get_discounted_variants_prices_for_promotions(
     variant_listings: list[ProductVariantChannelListing],
-    rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
+    rule_ids_per_variant: dict[int, list[UUID]],
     channel: Channel,
+    rule_discounts: dict[UUID, Callable[[Money], Money]],
+    discounted_amounts: dict[tuple[UUID, Decimal], Decimal],
     variant_listing_to_listing_rule_per_rule_map: dict,
+    applied_rule_id_per_changed_variant_listing: dict[int, UUID | None],
 ) -> tuple[
     list[Money],
     list[ProductVariantChannelListing],
@@ -274,33 +384,35 @@ def _get_discounted_variants_prices_for_promotions(
     variant_price_changes: list[VariantDiscountedPriceChange] = []
 
     for variant_listing in variant_listings:
-        applied_discount = calculate_discounted_price_for_promotions(
-            price=variant_listing.price,
-            rules_info_per_variant=rules_info_per_variant,
-            channel=channel,
-            variant_id=variant_listing.variant_id,
+        price_amount = variant_listing.price_amount
+        if price_amount is None:
+            # listings without a price are not fetched; skipped only to narrow the type
+            continue
+        applied_discount = _get_best_discount_amount(
+            price_amount,
+            variant_listing.currency,
+            rule_ids_per_variant.get(variant_listing.variant_id, []),
+            rule_discounts,
+            discounted_amounts,
         )
-        discounted_variant_price = variant_listing.price
+        discounted_price_amount = price_amount
 
         rule_id = None
         if applied_discount:
-            rule_id, discount = applied_discount
-            discounted_variant_price -= discount
-            discounted_variant_price = max(
-                discounted_variant_price, zero_money(discounted_variant_price.currency)
-            )
+            rule_id, discount_amount = applied_discount
+            discounted_price_amount = max(price_amount - discount_amount, Decimal(0))
 
             _handle_discount_rule_id(
                 variant_listing,
                 rule_id,
                 variant_listing_to_listing_rule_per_rule_map,
-                discount.amount,
+                discount_amount,
                 channel.currency_code,
                 variant_listing_promotion_rule_to_update,
                 variant_listing_promotion_rule_to_create,
             )
 
-        if variant_listing.discounted_price != discounted_variant_price:
+        if variant_listing.discounted_price_amount != discounted_price_amount:
             previous_price_amount = cast(
                 Decimal,
                 variant_listing.discounted_price_amount
@@ -312,21 +424,21 @@ def _get_discounted_variants_prices_for_promotions(
                     variant_id=variant_listing.variant_id,
                     channel_slug=channel.slug,
                     previous_price_amount=previous_price_amount,
-                    new_price_amount=discounted_variant_price.amount,
+                    new_price_amount=discounted_price_amount,
                     currency=channel.currency_code,
                 )
             )
 
-            variant_listing.discounted_price_amount = discounted_variant_price.amount
+            variant_listing.discounted_price_amount = discounted_price_amount
             variants_listings_to_update.append(variant_listing)
 
-            # delete variant listing - promotion rules relations that are not valid
-            # anymore
-            VariantChannelListingPromotionRule.objects.filter(
-                variant_channel_listing_id=variant_listing.id
-            ).exclude(promotion_rule_id=rule_id).delete()
+            # variant listing - promotion rules relations that are not valid anymore
+            # are deleted for the whole batch at once
+            applied_rule_id_per_changed_variant_listing[variant_listing.id] = rule_id
 
-        discounted_variants_price.append(discounted_variant_price)
+        discounted_variants_price.append(
+            Money(discounted_price_amount, variant_listing.currency)
+        )
 
     return (
         discounted_variants_price,
@@ -337,6 +449,35 @@ def _get_discounted_variants_prices_for_promotions(
     )
 
 
+def _get_best_discount_amount(
+    price_amount: Decimal,
+    currency: str,
+    rule_ids: list[UUID],
+    rule_discounts: dict[UUID, Callable[[Money], Money]],
+    discounted_amounts: dict[tuple[UUID, Decimal], Decimal],
+) -> tuple[UUID, Decimal] | None:
+    """Return the rule id with the discount amount of the rule giving the best saving.
+
+    The discount amounts are memoized in `discounted_amounts` per rule and price, so
+    the same discount is calculated only once for all variants from the batch.
+    When several rules give the same saving, the first one is returned.
+    """
+    best_discount = None
+    for rule_id in rule_ids:
+        discount = rule_discounts.get(rule_id)
+        if discount is None:
+            continue
+        key = (rule_id, price_amount)
+        discount_amount = discounted_amounts.get(key)
+        if discount_amount is None:
+            price = Money(price_amount, currency)
+            discount_amount = (price - discount(price)).amount
+            discounted_amounts[key] = discount_amount
+        if best_discount is None or discount_amount > best_discount[1]:
+            best_discount = (rule_id, discount_amount)
+    return best_discount
+
+
 def _handle_discount_rule_id(
     variant_listing: ProductVariantChannelListing,
     rule_id: UUID,
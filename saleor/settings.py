@@ -598,6 +598,15 @@ PLACEHOLDER_IMAGES = {
     4096: "images/placeholder4096.png",
 }
 
+# Thumbnails created in the background for new product media images, e.g.
+# "256,512,1024" and "webp,original". Other thumbnails are created on the first request.
+THUMBNAIL_PREGENERATED_SIZES = [
+    int(size) for size in get_list(os.environ.get("THUMBNAIL_PREGENERATED_SIZES", ""))
+]
+THUMBNAIL_PREGENERATED_FORMATS = get_list(
+    os.environ.get("THUMBNAIL_PREGENERATED_FORMATS", "original")
+)
+
 
 AUTHENTICATION_BACKENDS = [
     "saleor.core.auth_backend.JSONWebTokenBackend",
@@ -619,6 +628,8 @@ EMPTY_CHECKOUTS_TIMEDELTA = datetime.timedelta(
 EXPORT_FILES_TIMEDELTA = datetime.timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
+# Compress exported CSV files with gzip
+EXPORT_FILES_GZIP_ENABLED = get_bool_from_env("EXPORT_FILES_GZIP_ENABLED", False)
 
 # CELERY SETTINGS
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -753,6 +764,11 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": datetime.timedelta(seconds=BEAT_PRICE_RECALCULATION_SCHEDULE),
         "options": {"expires": BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC},
     },
+    "update-products-pricing": {
+        "task": "saleor.product.tasks.update_products_pricing_task",
+        "schedule": datetime.timedelta(seconds=BEAT_PRICE_RECALCULATION_SCHEDULE),
+        "options": {"expires": BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC},
+    },
     "checkout-automatic-completion": {
         # Scheduled task that runs every 60 seconds to check for checkout
         # readiness for automatic completion.
@@ -772,6 +788,10 @@ EVENT_PAYLOAD_DELETE_PERIOD = datetime.timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+# zlib compression level of the event payload files, 0 stores them uncompressed.
+EVENT_PAYLOAD_COMPRESSION_LEVEL = int(
+    os.environ.get("EVENT_PAYLOAD_COMPRESSION_LEVEL", 6)
+)
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
@@ -805,6 +825,11 @@ OBSERVABILITY_REPORT_PERIOD = datetime.timedelta(
 OBSERVABILITY_BUFFER_TIMEOUT = datetime.timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_TIMEOUT", "5 minutes"))
 )
+# Events are collected in the process memory and stored in the buffer in batches
+# by a background thread. Set to 0 to store every event when it is reported.
+OBSERVABILITY_BUFFER_FLUSH_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_FLUSH_PERIOD", "1 second"))
+)
 if OBSERVABILITY_ACTIVE:
     CELERY_BEAT_SCHEDULE["observability-reporter"] = {
         "task": "saleor.webhook.transport.asynchronous.transport.observability_reporter_task",
@@ -894,6 +919,22 @@ GRAPHQL_MUTATION_COUNT_LIMIT: int = int(
     os.environ.get("GRAPHQL_MUTATION_COUNT_LIMIT", 4)
 )
 
+# Counting strategy of `totalCount` for the largest lists (products, orders and
+# customers). Lists of all rows of a table with at least that many rows return the
+# estimate from the table statistics. Only the products list of staff users is
+# estimated, as orders and customers lists always exclude drafts and staff users.
+# Set to 0 to always count rows.
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD: int = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 0)
+)
+# Number of seconds the counts are cached for the same filters. Set to 0 to disable.
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT: int = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", 0)
+)
+# Stop counting rows at that number, which then means "at least that many".
+# Set to 0 to count all rows.
+GRAPHQL_TOTAL_COUNT_LIMIT: int = int(os.environ.get("GRAPHQL_TOTAL_COUNT_LIMIT", 0))
+
 # Maximum number of IDs accepted by a single bulk delete mutation call
 BULK_DELETE_LIMIT: int = int(os.environ.get("BULK_DELETE_LIMIT", 100))
 
@@ -902,6 +943,19 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Allow clients to send only the SHA-256 hash of a previously sent query, following
+# the Automatic Persisted Queries protocol. Queries sent by clients are stored in
+# the cache.
+GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_AUTOMATIC_PERSISTED_QUERIES_ENABLED", False
+)
+# Execute only the queries registered with the `register_persisted_queries` command.
+# Any other query is rejected, including the ones sent by the dashboard, so enable
+# it only for deployments serving a known set of storefront queries.
+GRAPHQL_PERSISTED_QUERIES_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ONLY", False
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -956,6 +1010,13 @@ for entry_point in installed_plugins:
 
 PLUGINS: list[str] = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Number of seconds the plugin configurations are cached in the process memory. The
+# cache is also invalidated whenever plugin configurations or channels change. Set to
+# 0 to disable.
+PLUGINS_CONFIGURATION_CACHE_TIMEOUT = int(
+    os.environ.get("PLUGINS_CONFIGURATION_CACHE_TIMEOUT", 60)
+)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -1005,6 +1066,35 @@ CHECKOUT_DELIVERY_OPTIONS_TTL = datetime.timedelta(
     seconds=parse(os.environ.get("CHECKOUT_DELIVERY_OPTIONS_TTL", "24 hours"))
 )
 
+# Number of seconds the catalogue data used to price checkout lines (variants,
+# listings, tax classes and promotion rules) is cached in the process memory. The
+# cache is also invalidated whenever the catalogue changes. Set to 0 to disable.
+CHECKOUT_CATALOGUE_CACHE_TIMEOUT = int(
+    os.environ.get("CHECKOUT_CATALOGUE_CACHE_TIMEOUT", 30)
+)
+
+# Number of seconds the reference data (channels, tax configurations, product
+# types, attributes and categories) loaded by GraphQL queries is cached in the
+# process memory. The cache is also invalidated whenever the data changes. Set to 0
+# to disable.
+DATALOADER_PROCESS_CACHE_TIMEOUT = int(
+    os.environ.get("DATALOADER_PROCESS_CACHE_TIMEOUT", 30)
+)
+
+# Read available quantities of variants from the table maintained together with
+# stocks and allocations, instead of aggregating stocks on every read. Run the
+# `update_stock_availability` management command after enabling it.
+STOCK_AVAILABILITY_TABLE_ENABLED = get_bool_from_env(
+    "STOCK_AVAILABILITY_TABLE_ENABLED", False
+)
+
+# Resolve product pricing for the default country of the channel from the pricing
+# precomputed in the background, instead of calculating it with taxes on every
+# read. Outdated pricing is recalculated by the `update-products-pricing` task.
+PRODUCT_PRICING_PROJECTION_ENABLED = get_bool_from_env(
+    "PRODUCT_PRICING_PROJECTION_ENABLED", False
+)
+
 CHECKOUT_TTL_BEFORE_RELEASING_FUNDS = datetime.timedelta(
     seconds=parse(os.environ.get("CHECKOUT_TTL_BEFORE_RELEASING_FUNDS", "6 hours"))
 )
@@ -1156,6 +1246,33 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# Number of threads used to send a batch of asynchronous webhooks of a single app
+# and the limit of requests sent at the same time to a single host.
+WEBHOOK_ASYNC_MAX_WORKERS = int(os.environ.get("WEBHOOK_ASYNC_MAX_WORKERS", 8))
+WEBHOOK_ASYNC_MAX_CONNECTIONS_PER_HOST = int(
+    os.environ.get("WEBHOOK_ASYNC_MAX_CONNECTIONS_PER_HOST", 4)
+)
+
+# Number of seconds the webhooks subscribed to an event are cached in the process
+# memory. The cache is also invalidated whenever webhooks, apps or app permissions
+# change. Set to 0 to disable.
+WEBHOOK_SUBSCRIBERS_CACHE_TIMEOUT = int(
+    os.environ.get("WEBHOOK_SUBSCRIBERS_CACHE_TIMEOUT", 60)
+)
+
+# Reuse keep-alive HTTP sessions per webhook target host within a worker process.
+WEBHOOK_HTTP_SESSION_POOL_ENABLED = get_bool_from_env(
+    "WEBHOOK_HTTP_SESSION_POOL_ENABLED", True
+)
+# Max number of target hosts with open sessions and max number of connections kept
+# open per host.
+WEBHOOK_HTTP_SESSION_POOL_MAX_HOSTS = int(
+    os.environ.get("WEBHOOK_HTTP_SESSION_POOL_MAX_HOSTS", 100)
+)
+WEBHOOK_HTTP_SESSION_POOL_MAXSIZE = int(
+    os.environ.get("WEBHOOK_HTTP_SESSION_POOL_MAXSIZE", 10)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -3,7 +3,6 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Union
 
 from django.conf import settings
-from django.db.models import QuerySet
 from promise import Promise
 from pydantic import ValidationError
 
@@ -13,6 +12,7 @@ from ...webhook.response_schemas.shipping import (
     FilterShippingMethodsSchema,
 )
 from ...webhook.transport.synchronous.transport import (
+    prefetch_circuit_breaker_states,
     trigger_webhook_sync_promise,
     trigger_webhook_sync_promise_if_not_cached,
 )
@@ -80,7 +80,7 @@ def _parse_excluded_shipping_methods(
 
 
 def _get_excluded_shipping_methods_or_fetch(
-    webhooks: QuerySet,
+    webhooks: list[Webhook],
     event_type: str,
     static_payload: str,
     subscribable_object: "tuple[Order | Checkout, list[ShippingMethodData]]",
@@ -95,6 +95,8 @@ def _get_excluded_shipping_methods_or_fetch(
     each of them one by one.
     """
     promised_responses = []
+    if cache_data is None:
+        prefetch_circuit_breaker_states(event_type, webhooks)
     for webhook in webhooks:
         # The approach for Order and Checkout is the same, except that
         # Checkout does not need a cache anymore as all deliveries and their
@@ -141,7 +143,7 @@ def _get_excluded_shipping_methods_or_fetch(
 
 
 def get_excluded_shipping_data(
-    webhooks: QuerySet[Webhook],
+    webhooks: list[Webhook],
     event_type: str,
     static_payload: str,
     subscribable_object: "tuple[Order | Checkout, list[ShippingMethodData]]",
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Optional
 from django.conf import settings
 from prices import TaxedMoney
 
+from ..checkout.recalculation import memoize_in_recalculation_context
 from ..core.utils.country import get_active_country
 from ..tax.models import TaxClass, TaxClassCountryRate
 from . import TaxCalculationStrategy
@@ -157,15 +158,19 @@ def get_tax_configuration_for_checkout(
 ) -> tuple["TaxConfiguration", Optional["TaxConfigurationPerCountry"]]:
     tax_configuration = checkout_info.tax_configuration
     country_code = get_checkout_active_country(checkout_info)
-    country_tax_configuration = next(
-        (
-            tc
-            for tc in tax_configuration.country_exceptions.using(
-                database_connection_name
-            ).all()
-            if tc.country.code == country_code
+    country_tax_configuration = memoize_in_recalculation_context(
+        "country_tax_configuration",
+        (tax_configuration.pk, country_code, database_connection_name),
+        lambda: next(
+            (
+                tc
+                for tc in tax_configuration.country_exceptions.using(
+                    database_connection_name
+                ).all()
+                if tc.country.code == country_code
+            ),
+            None,
         ),
-        None,
     )
     return tax_configuration, country_tax_configuration
 
@@ -7,6 +7,7 @@ from promise import Promise
 from ...app.models import App
 from ...core.taxes import TaxData, TaxDataError
 from ...webhook.transport.synchronous.transport import (
+    prefetch_circuit_breaker_states,
     trigger_webhook_sync_promise,
 )
 from ...webhook.utils import get_webhooks_for_event
@@ -70,7 +71,8 @@ def get_taxes_for_app_identifier(
         logger.warning(msg)
         return Promise.reject(TaxDataError(msg))
 
-    webhook = get_webhooks_for_event(event_type, apps_ids=[app.id]).first()
+    webhooks = get_webhooks_for_event(event_type, apps_ids=[app.id])
+    webhook = webhooks[0] if webhooks else None
     if webhook is None:
         msg = "Configured tax app's webhook for taxes calculation doesn't exists."
         logger.warning(msg)
@@ -112,6 +114,7 @@ def get_taxes_from_all_webhooks(
     )
 
     tax_webhook_promises = []
+    prefetch_circuit_breaker_states(event_type, webhooks)
     for webhook in webhooks:
         tax_webhook_promises.append(
             trigger_webhook_sync_promise(
@@ -1,3 +1,4 @@
+import datetime
 import re
 from re import Pattern
 
@@ -46,6 +47,7 @@ PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
 
 OBSERVABILITY_ACTIVE = False
 OBSERVABILITY_REPORT_ALL_API_CALLS = False
+OBSERVABILITY_BUFFER_FLUSH_PERIOD = datetime.timedelta(0)
 
 PLUGINS = []
 
@@ -102,6 +104,13 @@ PRIVATE_MEDIA_ROOT: str = os.path.join(PROJECT_ROOT, "private-media")  # noqa: F
 
 BREAKER_BOARD_ENABLED = False
 
+# Cached webhooks, plugin configurations, catalogue and reference data would outlive
+# the test transactions.
+WEBHOOK_SUBSCRIBERS_CACHE_TIMEOUT = 0
+PLUGINS_CONFIGURATION_CACHE_TIMEOUT = 0
+CHECKOUT_CATALOGUE_CACHE_TIMEOUT = 0
+DATALOADER_PROCESS_CACHE_TIMEOUT = 0
+
 # Enable exception raising for telemetry unit conversion errors
 # This helps identify unit conversion issues during development and testing
 TELEMETRY_RAISE_UNIT_CONVERSION_ERRORS = True
@@ -5,6 +5,11 @@ DEFAULT_THUMBNAIL_SIZE = 4096
 
 FILE_NAME_MAX_LENGTH = 55
 
+# Only one request or task creates a given thumbnail at a time, others wait for it.
+THUMBNAIL_LOCK_TIMEOUT = 60
+THUMBNAIL_LOCK_WAIT_TIMEOUT = 10
+THUMBNAIL_LOCK_POLL_INTERVAL = 0.1
+
 
 class ThumbnailFormat:
     ORIGINAL = "original"
@@ -0,0 +1,64 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....core.utils.batches import BatchProgress, queryset_in_batches
+from ....product import ProductMediaTypes
+from ....product.models import ProductMedia
+from ...tasks import (
+    create_product_media_thumbnails,
+    create_product_media_thumbnails_task,
+    get_pregenerated_thumbnails,
+)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the missing pre-generated thumbnails (THUMBNAIL_PREGENERATED_SIZES "
+        "and THUMBNAIL_PREGENERATED_FORMATS) of existing product media images. "
+        "Tasks are scheduled in batches, unless `--sync` is used."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Create the thumbnails in this process instead of Celery tasks.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="Number of processes encoding the thumbnails, used with `--sync`.",
+        )
+
+    def handle(self, *args, **options):
+        if not get_pregenerated_thumbnails():
+            raise CommandError("THUMBNAIL_PREGENERATED_SIZES setting is empty.")
+
+        if options["sync"] and options["workers"]:
+            with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+                self.create_thumbnails(options["batch_size"], True, executor)
+        else:
+            self.create_thumbnails(options["batch_size"], options["sync"])
+
+    def create_thumbnails(
+        self, batch_size: int, sync: bool, executor: Executor | None = None
+    ):
+        queryset = ProductMedia.objects.filter(
+            type=ProductMediaTypes.IMAGE, image__isnull=False
+        ).exclude(image="")
+        progress = BatchProgress("thumbnail.product_media_backfill", queryset.count())
+        for product_media_ids in queryset_in_batches(queryset, batch_size, progress):
+            for product_media_id in product_media_ids:
+                if sync:
+                    create_product_media_thumbnails(product_media_id, executor)
+                else:
+                    create_product_media_thumbnails_task.delay(product_media_id)
+            self.stdout.write(
+                f"Processed {progress.processed + len(product_media_ids)} of "
+                f"{progress.total} product media."
+            )
@@ -0,0 +1,134 @@
+import logging
+from concurrent.futures import Executor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from ..product import ProductMediaTypes
+from ..product.models import ProductMedia
+from .models import Thumbnail
+from .utils import (
+    ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_format,
+    get_thumbnail_lock_key,
+    get_thumbnail_size,
+    prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_pregenerated_thumbnails() -> list[tuple[int, str | None]]:
+    """Return the sizes and formats of thumbnails created for new product media."""
+    sizes = {get_thumbnail_size(size) for size in settings.THUMBNAIL_PREGENERATED_SIZES}
+    formats = dict.fromkeys(
+        get_thumbnail_format(format)
+        for format in settings.THUMBNAIL_PREGENERATED_FORMATS
+    )
+    return [
+        (size, format)
+        for size in sorted(sizes, reverse=True)
+        for format in formats or [None]
+    ]
+
+
+def schedule_product_media_thumbnails(product_media_id: int):
+    if settings.THUMBNAIL_PREGENERATED_SIZES:
+        transaction.on_commit(
+            lambda: create_product_media_thumbnails_task.delay(product_media_id)
+        )
+
+
+@app.task
+@allow_writer()
+def create_product_media_thumbnails_task(product_media_id: int):
+    create_product_media_thumbnails(product_media_id)
+
+
+def create_product_media_thumbnails(
+    product_media_id: int, executor: Executor | None = None
+):
+    """Create the pre-generated thumbnails missing for the product media image.
+
+    All thumbnails are rendered from a single decode of the original image.
+    Thumbnails that are being created by the thumbnail view at the same time are
+    skipped.
+    """
+    product_media = ProductMedia.objects.filter(
+        pk=product_media_id, type=ProductMediaTypes.IMAGE
+    ).first()
+    if not product_media or not product_media.image:
+        return
+
+    existing_thumbnails = set(
+        Thumbnail.objects.filter(product_media=product_media).values_list(
+            "size", "format"
+        )
+    )
+    locks = {}
+    for size, format in get_pregenerated_thumbnails():
+        if (size, format) in existing_thumbnails:
+            continue
+        lock_key = get_thumbnail_lock_key(
+            "ProductMedia", product_media.pk, size, format
+        )
+        if lock_token := acquire_thumbnail_lock(lock_key):
+            locks[(size, format)] = (lock_key, lock_token)
+    if not locks:
+        return
+
+    # the thumbnails could be created by the view before the locks were acquired
+    created_thumbnails = set(
+        Thumbnail.objects.filter(product_media=product_media).values_list(
+            "size", "format"
+        )
+    )
+    for thumbnail_key in created_thumbnails & locks.keys():
+        release_thumbnail_lock(*locks.pop(thumbnail_key))
+    if not locks:
+        return
+
+    image_name = product_media.image.name
+    thumbnails = []
+    try:
+        with product_media.image.open("rb") as image_file:
+            original_image = File(BytesIO(image_file.read()), name=image_name)
+        try:
+            thumbnail_files = ProcessedImage(original_image).create_thumbnails(
+                locks.keys(), executor
+            )
+        except ValueError as error:
+            logger.warning(
+                "Cannot create thumbnails of product media %s: %s",
+                product_media.pk,
+                error,
+            )
+            return
+
+        for (size, format), (thumbnail_file, _) in thumbnail_files.items():
+            thumbnail = Thumbnail(size=size, format=format, product_media=product_media)
+            thumbnail.image.save(
+                prepare_thumbnail_file_name(image_name, size, format),
+                thumbnail_file,
+                save=False,
+            )
+            thumbnail.save()
+            thumbnails.append(thumbnail)
+    finally:
+        for lock_key, lock_token in locks.values():
+            release_thumbnail_lock(lock_key, lock_token)
+
+    manager = get_plugins_manager(allow_replica=False)
+    for thumbnail in thumbnails:
+        # set additional `instance` attribute, to easily get instance data
+        # for ThumbnailCreated subscription type
+        setattr(thumbnail, "instance", product_media)
+        call_event(manager.thumbnail_created, thumbnail)
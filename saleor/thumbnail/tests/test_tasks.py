@@ -0,0 +1,205 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from .. import ThumbnailFormat
+from ..models import Thumbnail
+from ..tasks import (
+    create_product_media_thumbnails_task,
+    get_pregenerated_thumbnails,
+    schedule_product_media_thumbnails,
+)
+from ..utils import (
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
+    release_thumbnail_lock,
+)
+
+
+def test_get_pregenerated_thumbnails(settings):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [100, 4096, 128]
+    settings.THUMBNAIL_PREGENERATED_FORMATS = ["original", "webp"]
+
+    # when
+    thumbnails = get_pregenerated_thumbnails()
+
+    # then
+    assert thumbnails == [
+        (4096, None),
+        (4096, ThumbnailFormat.WEBP),
+        (128, None),
+        (128, ThumbnailFormat.WEBP),
+    ]
+
+
+@patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_schedule_product_media_thumbnails_disabled(
+    task_mock, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = []
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_product_media_thumbnails(1)
+
+    # then
+    task_mock.assert_not_called()
+
+
+@patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_schedule_product_media_thumbnails(
+    task_mock, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [128]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_product_media_thumbnails(1)
+
+    # then
+    task_mock.assert_called_once_with(1)
+
+
+@patch("saleor.plugins.manager.PluginsManager.thumbnail_created")
+def test_create_product_media_thumbnails_task(
+    thumbnail_created_mock,
+    product_with_image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATED_FORMATS = ["original", "webp"]
+    product_media = product_with_image.media.first()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product_media_thumbnails_task(product_media.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert set(thumbnails.values_list("size", "format")) == {
+        (64, None),
+        (64, ThumbnailFormat.WEBP),
+        (128, None),
+        (128, ThumbnailFormat.WEBP),
+    }
+    assert thumbnail_created_mock.call_count == 4
+
+
+def test_create_product_media_thumbnails_task_skips_existing_thumbnails(
+    product_with_image, image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATED_FORMATS = ["original"]
+    product_media = product_with_image.media.first()
+    thumbnail = Thumbnail.objects.create(
+        product_media=product_media, size=128, image=image
+    )
+
+    # when
+    create_product_media_thumbnails_task(product_media.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert thumbnails.count() == 2
+    assert thumbnails.get(size=128) == thumbnail
+
+
+def test_create_product_media_thumbnails_task_skips_locked_thumbnails(
+    product_with_image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATED_FORMATS = ["original"]
+    product_media = product_with_image.media.first()
+    lock_key = get_thumbnail_lock_key("ProductMedia", product_media.pk, 128, None)
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+
+    # when
+    create_product_media_thumbnails_task(product_media.pk)
+
+    # then
+    release_thumbnail_lock(lock_key, lock_token)
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert list(thumbnails.values_list("size", flat=True)) == [64]
+
+
+def test_create_product_media_thumbnails_task_skips_thumbnails_created_before_lock(
+    product_with_image, image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATED_FORMATS = ["original"]
+    product_media = product_with_image.media.first()
+
+    def create_thumbnail_and_acquire_lock(lock_key):
+        if lock_key.endswith(":128:original"):
+            Thumbnail.objects.get_or_create(
+                product_media=product_media, size=128, defaults={"image": image}
+            )
+        return acquire_thumbnail_lock(lock_key)
+
+    # when
+    with patch(
+        "saleor.thumbnail.tasks.acquire_thumbnail_lock",
+        side_effect=create_thumbnail_and_acquire_lock,
+    ):
+        create_product_media_thumbnails_task(product_media.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert sorted(thumbnails.values_list("size", flat=True)) == [64, 128]
+    lock_key = get_thumbnail_lock_key("ProductMedia", product_media.pk, 128, None)
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+    release_thumbnail_lock(lock_key, lock_token)
+
+
+def test_release_thumbnail_lock_held_by_another_holder():
+    # given
+    lock_key = get_thumbnail_lock_key("ProductMedia", 1, 128, None)
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+
+    # when
+    release_thumbnail_lock(lock_key, "other-token")
+
+    # then
+    assert acquire_thumbnail_lock(lock_key) is None
+    release_thumbnail_lock(lock_key, lock_token)
+
+
+@patch(
+    "saleor.thumbnail.management.commands.create_product_media_thumbnails"
+    ".create_product_media_thumbnails_task"
+)
+def test_create_product_media_thumbnails_command(
+    task_mock, product_with_image_list, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = [128]
+    media_ids = list(product_with_image_list.media.values_list("pk", flat=True))
+
+    # when
+    call_command("create_product_media_thumbnails", batch_size=1)
+
+    # then
+    assert sorted(call.args[0] for call in task_mock.delay.call_args_list) == sorted(
+        media_ids
+    )
+
+
+def test_create_product_media_thumbnails_command_no_sizes(settings):
+    # given
+    settings.THUMBNAIL_PREGENERATED_SIZES = []
+
+    # when & then
+    with pytest.raises(CommandError):
+        call_command("create_product_media_thumbnails")
@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import graphene
 import pytest
 from django.core.files import File
+from PIL import Image
 from PIL.JpegImagePlugin import JpegImageFile
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
@@ -226,3 +229,65 @@ def test_get_filename_from_url_with_query_params_path(mock_token_hex):
 )
 def test_get_filename_from_url_without_extension(url, mimetype, expected_extension):
     assert get_filename_from_url(url, mimetype).endswith(expected_extension)
+
+
+def _create_jpeg_file(size):
+    image_data = BytesIO()
+    Image.new("RGB", size=size).save(image_data, format="JPEG")
+    image_data.seek(0)
+    return File(image_data, name="product.jpg")
+
+
+def test_processed_image_create_thumbnails():
+    # given
+    processed_image = ProcessedImage(_create_jpeg_file((2000, 1000)))
+
+    # when
+    thumbnails = processed_image.create_thumbnails(
+        [(512, None), (64, ThumbnailFormat.WEBP), (512, ThumbnailFormat.AVIF)]
+    )
+
+    # then
+    assert thumbnails.keys() == {
+        (512, None),
+        (64, ThumbnailFormat.WEBP),
+        (512, ThumbnailFormat.AVIF),
+    }
+    for (size, _), (thumbnail_file, thumbnail_format) in thumbnails.items():
+        thumbnail = Image.open(thumbnail_file)
+        assert thumbnail.format == thumbnail_format
+        assert thumbnail.size == (size, size // 2)
+    assert thumbnails[(512, None)][1] == "JPEG"
+    assert thumbnails[(64, ThumbnailFormat.WEBP)][1] == "WEBP"
+
+
+def test_processed_image_create_thumbnails_decodes_image_once():
+    # given
+    processed_image = ProcessedImage(_create_jpeg_file((1000, 1000)))
+
+    # when
+    with patch.object(
+        processed_image, "retrieve_image", wraps=processed_image.retrieve_image
+    ) as retrieve_image_mock:
+        thumbnails = processed_image.create_thumbnails(
+            [(size, ThumbnailFormat.WEBP) for size in [32, 128, 256, 512]]
+        )
+
+    # then
+    retrieve_image_mock.assert_called_once()
+    assert len(thumbnails) == 4
+
+
+def test_processed_image_create_thumbnails_with_executor():
+    # given
+    processed_image = ProcessedImage(_create_jpeg_file((600, 600)))
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        thumbnails = processed_image.create_thumbnails(
+            [(256, None), (128, ThumbnailFormat.WEBP)], executor
+        )
+
+    # then
+    assert Image.open(thumbnails[(256, None)][0]).size == (256, 256)
+    assert Image.open(thumbnails[(128, ThumbnailFormat.WEBP)][0]).size == (128, 128)
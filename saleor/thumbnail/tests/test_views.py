@@ -3,9 +3,16 @@ from unittest.mock import patch
 import graphene
 from PIL import Image
 
+from ...core.db.connection import allow_writer
 from ...product import ProductMediaTypes
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..utils import (
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
+    release_thumbnail_lock,
+)
+from ..views import THUMBNAIL_RETRY_AFTER
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -600,3 +607,78 @@ def test_handle_original_image_for_product_media_image_type_with_external_url_bu
     # then
     assert response.status_code == 503
     assert response["Retry-After"] == "60"
+
+
+@patch("saleor.thumbnail.views.wait_for_thumbnail_lock_release")
+def test_handle_thumbnail_view_waits_for_thumbnail_created_concurrently(
+    wait_for_lock_release_mock, client, product_with_image, image, media_root
+):
+    # given
+    product_media = product_with_image.media.first()
+    size = 128
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("ProductMedia", product_media.pk, size, None)
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+
+    def create_thumbnail_and_release_lock(key):
+        with allow_writer():
+            Thumbnail.objects.create(
+                product_media=product_media, size=size, image=image
+            )
+        release_thumbnail_lock(key, lock_token)
+        return True
+
+    wait_for_lock_release_mock.side_effect = create_thumbnail_and_release_lock
+    thumbnail_count = Thumbnail.objects.count()
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    thumbnail = Thumbnail.objects.get(product_media=product_media, size=size)
+    assert response.url == thumbnail.image.url
+    assert Thumbnail.objects.count() == thumbnail_count
+    wait_for_lock_release_mock.assert_called_once_with(lock_key)
+
+
+@patch("saleor.thumbnail.views.wait_for_thumbnail_lock_release")
+def test_handle_thumbnail_view_lock_wait_timeout(
+    wait_for_lock_release_mock, client, product_with_image
+):
+    # given
+    product_media = product_with_image.media.first()
+    size = 128
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("ProductMedia", product_media.pk, size, None)
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+    wait_for_lock_release_mock.return_value = False
+    thumbnail_count = Thumbnail.objects.count()
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/{size}/")
+
+    # then
+    release_thumbnail_lock(lock_key, lock_token)
+    assert response.status_code == 503
+    assert response["Retry-After"] == THUMBNAIL_RETRY_AFTER
+    assert Thumbnail.objects.count() == thumbnail_count
+
+
+def test_handle_thumbnail_view_releases_lock(client, product_with_image):
+    # given
+    product_media = product_with_image.media.first()
+    size = 128
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("ProductMedia", product_media.pk, size, None)
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    lock_token = acquire_thumbnail_lock(lock_key)
+    assert lock_token
+    release_thumbnail_lock(lock_key, lock_token)
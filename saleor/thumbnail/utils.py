@@ -1,12 +1,17 @@
 import mimetypes
 import os
 import secrets
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future
 from io import BytesIO
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
 import graphene
 import magic
+from django.core.cache import cache
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.urls import reverse
@@ -17,6 +22,9 @@ from . import (
     DEFAULT_THUMBNAIL_SIZE,
     FILE_NAME_MAX_LENGTH,
     MIME_TYPE_TO_PIL_IDENTIFIER,
+    THUMBNAIL_LOCK_POLL_INTERVAL,
+    THUMBNAIL_LOCK_TIMEOUT,
+    THUMBNAIL_LOCK_WAIT_TIMEOUT,
     THUMBNAIL_SIZES,
     IconThumbnailFormat,
     ThumbnailFormat,
@@ -98,6 +106,42 @@ def prepare_thumbnail_file_name(file_name: str, size: int, format: str | None) -
     return file_path + f"_thumbnail_{size}." + file_ext
 
 
+def get_thumbnail_lock_key(
+    object_type: str, instance_pk, size: int, format: str | None
+) -> str:
+    format = format or ThumbnailFormat.ORIGINAL
+    return f"thumbnail_lock:{object_type}:{instance_pk}:{size}:{format}"
+
+
+def acquire_thumbnail_lock(lock_key: str) -> str | None:
+    """Acquire the lock for creating a thumbnail; return None if it's already held.
+
+    The lock expires after `THUMBNAIL_LOCK_TIMEOUT` seconds, so a crashed holder
+    doesn't block creating the thumbnail forever. The returned token identifies
+    the holder and is required to release the lock.
+    """
+    token = secrets.token_hex(16)
+    if cache.add(lock_key, token, timeout=THUMBNAIL_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def release_thumbnail_lock(lock_key: str, token: str):
+    """Release the lock unless it expired and was acquired by another holder."""
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def wait_for_thumbnail_lock_release(lock_key: str) -> bool:
+    """Wait until the thumbnail lock is released; return False on timeout."""
+    deadline = time.monotonic() + THUMBNAIL_LOCK_WAIT_TIMEOUT
+    while cache.get(lock_key) is not None:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(THUMBNAIL_LOCK_POLL_INTERVAL)
+    return True
+
+
 class ProcessedImage:
     EXIF_ORIENTATION_KEY = 274
     # Whether to create progressive JPEGs. Read more about progressive JPEGs
@@ -114,11 +158,15 @@ class ProcessedImage:
     # https://pillow.readthedocs.io/en/latest/handbook/image-file-formats.html#webp
     WEBP_QUAL = 70
     AVIF_QUAL = 70
+    # Images are downscaled with `Image.reduce` (or decoded in draft mode for
+    # JPEG) to at least `REDUCING_GAP` times the thumbnail size before resampling.
+    # https://pillow.readthedocs.io/en/stable/reference/Image.html
+    REDUCING_GAP = 2.0
 
     def __init__(
         self,
         image_source: str | File,
-        size: int,
+        size: int = DEFAULT_THUMBNAIL_SIZE,
         format: str | None = None,
         storage=default_storage,
     ):
@@ -179,30 +227,12 @@ class ProcessedImage:
                     arguments, return an empty dict ({}).
 
         """
-        format = self.format or image_format
-        save_kwargs = {"format": format}
+        image = self.apply_exif_orientation(image, self.get_exif_orientation(image))
+        return self.prepare_image(image, self.format or image_format)
 
-        # Ensuring image is properly rotated
-        if hasattr(image, "_getexif"):
-            try:
-                # validation of the exif data was added in separate PR:
-                # https://github.com/saleor/saleor/pull/11224, it means that there is a
-                # possibility that we could have the file with corrupted exif data.
-                # exif data is only used to apply some optional action on the image,
-                # but without it, we are still able to create a thumbnail.
-                exif_datadict = image._getexif()  # returns None if no EXIF data
-            except SyntaxError:
-                exif_datadict = None
-
-            if exif_datadict is not None:
-                exif = dict(exif_datadict.items())
-                orientation = exif.get(self.EXIF_ORIENTATION_KEY, None)
-                if orientation == 3:
-                    image = image.transpose(Image.Transpose.ROTATE_180)
-                elif orientation == 6:
-                    image = image.transpose(Image.Transpose.ROTATE_270)
-                elif orientation == 8:
-                    image = image.transpose(Image.Transpose.ROTATE_90)
+    def prepare_image(self, image, format):
+        """Return the image and the save kwargs for the given thumbnail format."""
+        save_kwargs = {"format": format}
 
         # Ensure any embedded ICC profile is preserved
         save_kwargs["icc_profile"] = image.info.get("icc_profile")
@@ -213,6 +243,34 @@ class ProcessedImage:
 
         return image, save_kwargs
 
+    def get_exif_orientation(self, image) -> int | None:
+        if not hasattr(image, "_getexif"):
+            return None
+        try:
+            # validation of the exif data was added in separate PR:
+            # https://github.com/saleor/saleor/pull/11224, it means that there is a
+            # possibility that we could have the file with corrupted exif data.
+            # exif data is only used to apply some optional action on the image,
+            # but without it, we are still able to create a thumbnail.
+            exif_datadict = image._getexif()  # returns None if no EXIF data
+        except SyntaxError:
+            exif_datadict = None
+
+        if exif_datadict is None:
+            return None
+        return exif_datadict.get(self.EXIF_ORIENTATION_KEY)
+
+    @staticmethod
+    def apply_exif_orientation(image, orientation: int | None):
+        """Ensure the image is properly rotated."""
+        if orientation == 3:
+            image = image.transpose(Image.Transpose.ROTATE_180)
+        elif orientation == 6:
+            image = image.transpose(Image.Transpose.ROTATE_270)
+        elif orientation == 8:
+            image = image.transpose(Image.Transpose.ROTATE_90)
+        return image
+
     def preprocess_AVIF(self, image):
         """Receive a PIL Image instance of an AVIF and return 2-tuple."""
         save_kwargs = {
@@ -252,13 +310,74 @@ class ProcessedImage:
 
         Bounding box dimensions are `width`x`height`.
         """
-        image_file = BytesIO()
         image.thumbnail(
             (self.size, self.size),
+            reducing_gap=self.REDUCING_GAP,
         )
-        image.save(image_file, **save_kwargs)
-        image_file.seek(0)
-        return image_file, save_kwargs["format"]
+        return BytesIO(encode_image(image, save_kwargs)), save_kwargs["format"]
+
+    def create_thumbnails(
+        self,
+        thumbnails: Iterable[tuple[int, str | None]],
+        executor: Executor | None = None,
+    ) -> dict[tuple[int, str | None], tuple[BytesIO, str]]:
+        """Create thumbnails in multiple sizes and formats from a single decode.
+
+        The image is decoded once, downscaled to the largest requested size, and
+        every smaller size is resized from the previous, already downscaled, one.
+        `size` and `format` of the instance are not used. Encoding of the thumbnails
+        can be distributed with `executor`, e.g. `ProcessPoolExecutor`.
+
+        Return a dict of (image file, thumbnail format) 2-tuples keyed by the
+        requested (size, format).
+        """
+        formats_by_size: dict[int, list[str | None]] = defaultdict(list)
+        for size, format in thumbnails:
+            formats_by_size[size].append(format)
+
+        image, image_format = self.retrieve_image()
+        # read before resizing, the resized image doesn't keep the EXIF data
+        orientation = self.get_exif_orientation(image)
+
+        encoded_images: dict[tuple[int, str | None], tuple[bytes, str]] = {}
+        pending_images: dict[tuple[int, str | None], tuple[Future[bytes], str]] = {}
+        resized_image = None
+        for size in sorted(formats_by_size, reverse=True):
+            if resized_image is None:
+                # resizing in place lets JPEG images be decoded in draft mode and
+                # other ones be reduced before resampling
+                image.thumbnail((size, size), reducing_gap=self.REDUCING_GAP)
+                # copy to a plain image that can be sent to the executor processes
+                resized_image = self.apply_exif_orientation(image.copy(), orientation)
+            else:
+                resized_image = resized_image.copy()
+                resized_image.thumbnail((size, size), reducing_gap=self.REDUCING_GAP)
+
+            for format in formats_by_size[size]:
+                thumbnail_format = format.upper() if format else image_format
+                thumbnail_image, save_kwargs = self.prepare_image(
+                    resized_image, thumbnail_format
+                )
+                if executor:
+                    future = executor.submit(encode_image, thumbnail_image, save_kwargs)
+                    pending_images[(size, format)] = (future, save_kwargs["format"])
+                else:
+                    encoded = encode_image(thumbnail_image, save_kwargs)
+                    encoded_images[(size, format)] = (encoded, save_kwargs["format"])
+
+        for key, (future, thumbnail_format) in pending_images.items():
+            encoded_images[key] = (future.result(), thumbnail_format)
+        return {
+            key: (BytesIO(encoded), thumbnail_format)
+            for key, (encoded, thumbnail_format) in encoded_images.items()
+        }
+
+
+def encode_image(image, save_kwargs: dict) -> bytes:
+    """Return `image` saved with `save_kwargs`; can be run in a process pool."""
+    image_file = BytesIO()
+    image.save(image_file, **save_kwargs)
+    return image_file.getvalue()
 
 
 class ProcessedIconImage(ProcessedImage):
@@ -23,14 +23,19 @@ from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
 from .utils import (
     ProcessedIconImage,
     ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
     get_thumbnail_size,
     is_product_media_image_pending,
     prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+    wait_for_thumbnail_lock_release,
 )
 
 logger = logging.getLogger(__name__)
 
 PENDING_IMAGE_RETRY_AFTER = "60"
+THUMBNAIL_RETRY_AFTER = "5"
 
 
 class ModelData(NamedTuple):
@@ -115,6 +120,42 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
             )
         return HttpResponseNotFound("There is no image for provided instance.")
 
+    # only one request creates the thumbnail, the concurrent ones wait for it
+    lock_key = get_thumbnail_lock_key(object_type, pk, size_px, format)
+    thumbnail_lookup = {"format": format, "size": size_px, instance_id_lookup: pk}
+    while not (lock_token := acquire_thumbnail_lock(lock_key)):
+        if not wait_for_thumbnail_lock_release(lock_key):
+            return HttpResponse(
+                "Thumbnail is being created, try later.",
+                status=503,
+                headers={"Retry-After": THUMBNAIL_RETRY_AFTER},
+            )
+        with allow_writer():
+            thumbnail = Thumbnail.objects.filter(**thumbnail_lookup).first()
+        if thumbnail:
+            return HttpResponseRedirect(thumbnail.image.url)
+
+    try:
+        # the thumbnail could be created before the lock was acquired
+        with allow_writer():
+            thumbnail = Thumbnail.objects.filter(**thumbnail_lookup).first()
+        if thumbnail:
+            return HttpResponseRedirect(thumbnail.image.url)
+        return create_thumbnail(
+            object_type, instance, model_data, image, size_px, format
+        )
+    finally:
+        release_thumbnail_lock(lock_key, lock_token)
+
+
+def create_thumbnail(
+    object_type: str,
+    instance,
+    model_data: ModelData,
+    image,
+    size_px: int,
+    format: str | None,
+):
     # prepare thumbnail
     if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
         processed_image: ProcessedImage = ProcessedIconImage(
@@ -0,0 +1,46 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from ..shipping.models import ShippingZone
+        from .models import Warehouse
+        from .signals import (
+            update_stock_availability_on_shipping_zone_channels_change,
+            update_stock_availability_on_shipping_zone_save,
+            update_stock_availability_on_warehouse_channels_change,
+            update_stock_availability_on_warehouse_delete,
+            update_stock_availability_on_warehouse_shipping_zones_change,
+        )
+
+        # dispatch_uid prevents duplicate signals
+        m2m_changed.connect(
+            update_stock_availability_on_warehouse_channels_change,
+            sender=Warehouse.channels.through,
+            dispatch_uid="update_stock_availability_on_warehouse_channels_change",
+        )
+        m2m_changed.connect(
+            update_stock_availability_on_warehouse_shipping_zones_change,
+            sender=Warehouse.shipping_zones.through,
+            dispatch_uid=(
+                "update_stock_availability_on_warehouse_shipping_zones_change"
+            ),
+        )
+        m2m_changed.connect(
+            update_stock_availability_on_shipping_zone_channels_change,
+            sender=ShippingZone.channels.through,
+            dispatch_uid="update_stock_availability_on_shipping_zone_channels_change",
+        )
+        post_save.connect(
+            update_stock_availability_on_shipping_zone_save,
+            sender=ShippingZone,
+            dispatch_uid="update_stock_availability_on_shipping_zone_save",
+        )
+        pre_delete.connect(
+            update_stock_availability_on_warehouse_delete,
+            sender=Warehouse,
+            dispatch_uid="update_stock_availability_on_warehouse_delete",
+        )
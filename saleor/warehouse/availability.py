@@ -18,13 +18,15 @@ from ..checkout.fetch import DeliveryMethodBase
 from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..product.models import ProductVariantChannelListing
 from .models import Reservation, Stock, StockQuerySet
-from .reservations import get_listings_reservations
+from .reservations import get_listings_reservations, is_reservation_enabled
+from .stock_availability import is_stock_availability_table_enabled
 
 if TYPE_CHECKING:
     from ..checkout.fetch import CheckoutLineInfo
     from ..checkout.models import CheckoutLine
     from ..order.models import OrderLine
     from ..product.models import Product, ProductVariant
+    from ..site.models import SiteSettings
 
 
 class ChannelListingPreorderAvailbilityInfo(NamedTuple):
@@ -577,6 +579,25 @@ def is_product_in_stock(
     return any(stocks.values_list("available_quantity", flat=True))
 
 
+def can_use_stock_availability_table(
+    site_settings: "SiteSettings",
+    *,
+    include_shipping_zones: bool,
+    country_code: str | None = None,
+) -> bool:
+    """Check if the available quantity can be read from the availability table.
+
+    The table doesn't include reservations, as they expire without any write,
+    so it can't be used when reservations are enabled. Quantities per country are
+    stored only when stocks are calculated with shipping zones.
+    """
+    if not is_stock_availability_table_enabled():
+        return False
+    if is_reservation_enabled(site_settings):
+        return False
+    return not include_shipping_zones or bool(country_code)
+
+
 def get_reserved_stock_quantity(
     stocks: StockQuerySet, lines: list["CheckoutLine"] | None = None
 ) -> int:
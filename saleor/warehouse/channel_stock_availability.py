@@ -16,8 +16,6 @@ from .webhooks.channel_stock_events import (
 )
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
-
     from ..account.models import User
     from ..app.models import App
     from ..site.models import SiteSettings
@@ -49,7 +47,7 @@ def trigger_out_of_stock_in_channel_events_for_stocks(
     stocks: list[Stock],
     site_settings: "SiteSettings",
     requestor: "User | App | None" = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
     source_warehouses_data: dict[UUID, SourceWarehouseData] | None = None,
 ) -> None:
     """Fire channel-scoped OUT_OF_STOCK events for each `stock`'s variant.
@@ -110,7 +108,7 @@ def trigger_back_in_stock_in_channel_events_for_stocks(
     stocks: list[Stock],
     site_settings: "SiteSettings",
     requestor: "User | App | None" = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     """Fire channel-scoped BACK_IN_STOCK events for each `stock`'s variant.
 
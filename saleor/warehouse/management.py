@@ -39,6 +39,11 @@ from .models import (
     Stock,
     Warehouse,
 )
+from .stock_availability import (
+    is_stock_availability_table_enabled,
+    update_stock_availability,
+    update_stock_availability_for_stocks,
+)
 from .webhooks.stock_events import (
     trigger_product_variant_back_in_stock,
     trigger_product_variant_out_of_stock,
@@ -59,12 +64,21 @@ class StockData(NamedTuple):
 
 def delete_stocks(stock_pks_to_delete: list[int]):
     with transaction.atomic():
-        return Stock.objects.filter(
-            id__in=Stock.objects.order_by("pk")
+        locked_stocks = (
+            Stock.objects.order_by("pk")
             .select_for_update(of=["self"])
-            .values_list("pk", flat=True)
             .filter(id__in=stock_pks_to_delete)
+        )
+        variant_ids = []
+        if is_stock_availability_table_enabled():
+            variant_ids = list(
+                locked_stocks.values_list("product_variant_id", flat=True)
+            )
+        result = Stock.objects.filter(
+            id__in=locked_stocks.values_list("pk", flat=True)
         ).delete()
+        update_stock_availability(variant_ids)
+        return result
 
 
 def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
@@ -75,6 +89,7 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
             .values_list("id", flat=True)
         )
         Stock.objects.bulk_update(stocks, fields_to_update)
+        update_stock_availability_for_stocks(stocks)
 
 
 def delete_allocations(allocation_pks_to_delete: list[int]):
@@ -200,36 +215,41 @@ def allocate_stocks(
     if allocations:
         Allocation.objects.bulk_create(allocations)
 
-        stocks_to_update_map = {alloc.stock_id: alloc.stock for alloc in allocations}
         quantity_from_allocations: dict[int, int] = defaultdict(int)
-
         for alloc in allocations:
             quantity_from_allocations[alloc.stock_id] += alloc.quantity_allocated
 
+        stocks_to_update_map = Stock.objects.in_bulk(quantity_from_allocations.keys())
         for stock_id, quantity in quantity_from_allocations.items():
             stock = stocks_to_update_map[stock_id]
             stock.quantity_allocated = F("quantity_allocated") + quantity
 
         Stock.objects.bulk_update(stocks_to_update_map.values(), ["quantity_allocated"])
+        update_stock_availability_for_stocks(stocks_to_update_map.values())
 
         legacy_stock_availability = (
             site_settings.use_legacy_shipping_zone_stock_availability
         )
+        # Stocks are locked for update, so allocated quantities can be fetched with
+        # a single grouped query instead of a query per allocation.
+        allocated_quantity_for_stocks = dict(
+            Allocation.objects.filter(stock_id__in=stocks_to_update_map.keys())
+            .values("stock")
+            .annotate(quantity_allocated_sum=Sum("quantity_allocated"))
+            .values_list("stock", "quantity_allocated_sum")
+        )
         out_of_stock_stocks: list[Stock] = []
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
+        for stock_id, stock in stocks_to_update_map.items():
+            allocated_stock = allocated_quantity_for_stocks.get(stock_id) or 0
+            if not max(stock.quantity - allocated_stock, 0):
                 transaction.on_commit(
-                    lambda: trigger_product_variant_out_of_stock(
-                        allocation.stock, requestor=requestor
+                    partial(
+                        trigger_product_variant_out_of_stock,
+                        stock,
+                        requestor=requestor,
                     )
                 )
-                out_of_stock_stocks.append(allocation.stock)
+                out_of_stock_stocks.append(stock)
         if out_of_stock_stocks and not legacy_stock_availability:
             transaction.on_commit(
                 partial(
@@ -447,6 +467,7 @@ def deallocate_stock(
         )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_stock_availability_for_stocks(stocks_to_update)
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -492,6 +513,7 @@ def increase_stock(
             )
         stock.quantity_allocated = F("quantity_allocated") + quantity
         stock.save(update_fields=["quantity_allocated"])
+    update_stock_availability([stock.product_variant_id])
 
 
 def _reduce_quantity_allocated_for_stocks(
@@ -550,6 +572,7 @@ def increase_allocations(
 
     Allocation.objects.filter(pk__in=allocation_pks_to_delete).delete()
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_stock_availability_for_stocks(stocks_to_update)
 
     order = lines_info[0].line.order
     country_code = get_active_country(
@@ -580,6 +603,9 @@ def decrease_allocations(
         Allocation.objects.order_by("stock_id").filter(
             order_line__in=exc.order_lines
         ).update(quantity_allocated=0)
+        update_stock_availability(
+            line.variant_id for line in exc.order_lines if line.variant_id
+        )
 
 
 @traced_atomic_transaction()
@@ -700,6 +726,7 @@ def _decrease_stocks_quantity(
         raise InsufficientStock(insufficient_stocks)
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    update_stock_availability_for_stocks(stocks_to_update)
 
 
 def _get_variant_for_order_line_info(
@@ -805,6 +832,7 @@ def deallocate_stock_for_orders(
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_stock_availability_for_stocks(stocks_to_update)
 
 
 @traced_atomic_transaction()
@@ -1020,6 +1048,8 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
     if preorder_allocations:
         preorder_allocations.delete()
 
+    update_stock_availability([product_variant.pk])
+
     product_variant.preorder_global_threshold = None
     product_variant.preorder_end_date = None
     product_variant.is_preorder = False
@@ -0,0 +1,52 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0027_channel_allow_legacy_gift_card_use"),
+        ("product", "0207_remove_producttype_is_digital_from_state"),
+        ("warehouse", "0035_alter_warehouse_metadata_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VariantStockAvailability",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "country_code",
+                    models.CharField(blank=True, default="", max_length=2),
+                ),
+                ("quantity", models.IntegerField(default=0)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_availabilities",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_availabilities",
+                        to="product.productvariant",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("product_variant", "channel", "country_code")},
+            },
+        ),
+    ]
@@ -550,6 +550,35 @@ class Stock(models.Model):
             self.save(update_fields=["quantity"])
 
 
+class VariantStockAvailability(models.Model):
+    """Available quantity of the variant in the channel, summed from its stocks.
+
+    The quantity is the sum of stock quantities reduced by allocated quantities in
+    all warehouses of the channel, for the empty `country_code`, or in warehouses
+    shipping to the country in the channel, when the stock availability is
+    calculated with shipping zones. Reservations are not included.
+    """
+
+    product_variant = models.ForeignKey(
+        ProductVariant,
+        null=False,
+        on_delete=models.CASCADE,
+        related_name="stock_availabilities",
+    )
+    channel = models.ForeignKey(
+        Channel,
+        null=False,
+        on_delete=models.CASCADE,
+        related_name="stock_availabilities",
+    )
+    country_code = models.CharField(max_length=2, blank=True, default="")
+    quantity = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [["product_variant", "channel", "country_code"]]
+        ordering = ("pk",)
+
+
 class AllocationQueryset(models.QuerySet["Allocation"]):
     def annotate_stock_available_quantity(self):
         return self.annotate(
@@ -0,0 +1,101 @@
+from uuid import UUID
+
+from django.contrib.sites.models import Site
+from django.db import transaction
+
+from .models import Warehouse
+from .stock_availability import is_stock_availability_table_enabled
+from .tasks import update_stock_availability_task
+
+M2M_CHANGE_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _schedule_stock_availability_update(
+    warehouse_ids=(), channel_ids=(), *, shipping_zones_change=False
+):
+    if not is_stock_availability_table_enabled():
+        return
+    if shipping_zones_change:
+        # Shipping zones affect only the quantities stored per country.
+        site_settings = Site.objects.get_current().settings
+        if not site_settings.use_legacy_shipping_zone_stock_availability:
+            return
+    warehouse_ids = sorted({str(pk) for pk in warehouse_ids})
+    channel_ids = sorted(set(channel_ids))
+    if not warehouse_ids and not channel_ids:
+        return
+    transaction.on_commit(
+        lambda: update_stock_availability_task.delay(
+            warehouse_ids=warehouse_ids, channel_ids=channel_ids
+        )
+    )
+
+
+def _get_shipping_zones_warehouse_ids(shipping_zone_ids) -> list[UUID]:
+    return list(
+        Warehouse.shipping_zones.through.objects.filter(
+            shippingzone_id__in=shipping_zone_ids
+        ).values_list("warehouse_id", flat=True)
+    )
+
+
+def update_stock_availability_on_warehouse_channels_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        _schedule_stock_availability_update(warehouse_ids=[instance.pk])
+    elif pk_set is None:
+        _schedule_stock_availability_update(channel_ids=[instance.pk])
+    else:
+        _schedule_stock_availability_update(warehouse_ids=pk_set)
+
+
+def update_stock_availability_on_warehouse_shipping_zones_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        warehouse_ids = [instance.pk]
+    elif pk_set is None:
+        warehouse_ids = _get_shipping_zones_warehouse_ids([instance.pk])
+    else:
+        warehouse_ids = list(pk_set)
+    _schedule_stock_availability_update(warehouse_ids, shipping_zones_change=True)
+
+
+def update_stock_availability_on_shipping_zone_channels_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        shipping_zone_ids = [instance.pk]
+    elif pk_set is None:
+        shipping_zone_ids = list(instance.shipping_zones.values_list("pk", flat=True))
+    else:
+        shipping_zone_ids = list(pk_set)
+    _schedule_stock_availability_update(
+        _get_shipping_zones_warehouse_ids(shipping_zone_ids),
+        shipping_zones_change=True,
+    )
+
+
+def update_stock_availability_on_shipping_zone_save(
+    sender, instance, update_fields=None, **kwargs
+):
+    if update_fields is not None and "countries" not in update_fields:
+        return
+    _schedule_stock_availability_update(
+        _get_shipping_zones_warehouse_ids([instance.pk]), shipping_zones_change=True
+    )
+
+
+def update_stock_availability_on_warehouse_delete(sender, instance, **kwargs):
+    # Stocks of the warehouse are deleted with it, so variants are found by the
+    # quantities stored for the channels of the warehouse.
+    _schedule_stock_availability_update(
+        channel_ids=instance.channels.values_list("pk", flat=True)
+    )
@@ -0,0 +1,219 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from ..channel.models import Channel
+from ..shipping.models import ShippingZone
+from .models import ChannelWarehouse, Stock, VariantStockAvailability, Warehouse
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+# Country code of the availability summed from all warehouses of the channel.
+ALL_COUNTRIES = ""
+
+VariantChannelCountry = tuple[int, int, str]
+
+
+def is_stock_availability_table_enabled() -> bool:
+    return settings.STOCK_AVAILABILITY_TABLE_ENABLED
+
+
+def _get_warehouse_channels(
+    warehouse_ids: Iterable, database_connection_name: str
+) -> dict:
+    warehouse_channels: dict = defaultdict(set)
+    for warehouse_id, channel_id in (
+        ChannelWarehouse.objects.using(database_connection_name)
+        .filter(warehouse_id__in=warehouse_ids)
+        .values_list("warehouse_id", "channel_id")
+    ):
+        warehouse_channels[warehouse_id].add(channel_id)
+    return warehouse_channels
+
+
+def _get_warehouse_channel_countries(
+    warehouse_channels: dict, database_connection_name: str
+) -> dict:
+    """Return countries each warehouse ships to in its channels.
+
+    The warehouse ships to the country in the channel when it is assigned to a
+    shipping zone of the channel which contains the country.
+    """
+    WarehouseShippingZone = Warehouse.shipping_zones.through
+    ShippingZoneChannel = Channel.shipping_zones.through
+
+    zone_warehouses = defaultdict(set)
+    for warehouse_id, zone_id in (
+        WarehouseShippingZone.objects.using(database_connection_name)
+        .filter(warehouse_id__in=warehouse_channels.keys())
+        .values_list("warehouse_id", "shippingzone_id")
+    ):
+        zone_warehouses[zone_id].add(warehouse_id)
+
+    zone_channels = defaultdict(set)
+    for zone_id, channel_id in (
+        ShippingZoneChannel.objects.using(database_connection_name)
+        .filter(shippingzone_id__in=zone_warehouses.keys())
+        .values_list("shippingzone_id", "channel_id")
+    ):
+        zone_channels[zone_id].add(channel_id)
+
+    countries: dict = defaultdict(set)
+    for zone in (
+        ShippingZone.objects.using(database_connection_name)
+        .filter(pk__in=zone_warehouses.keys())
+        .only("pk", "countries")
+    ):
+        zone_countries = {country.code for country in zone.countries}
+        for warehouse_id in zone_warehouses[zone.pk]:
+            channel_ids = zone_channels[zone.pk] & warehouse_channels[warehouse_id]
+            for channel_id in channel_ids:
+                countries[(warehouse_id, channel_id)] |= zone_countries
+    return countries
+
+
+def calculate_stock_availability(
+    variant_ids: Iterable[int],
+    *,
+    include_countries: bool,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[VariantChannelCountry, int]:
+    """Calculate the available quantity of variants per channel and country.
+
+    Country specific quantities are calculated only with `include_countries`.
+    """
+    stocks = list(
+        Stock.objects.using(database_connection_name)
+        .filter(product_variant_id__in=variant_ids)
+        .annotate_available_quantity()
+        .values_list("product_variant_id", "warehouse_id", "available_quantity")
+    )
+    warehouse_ids = {warehouse_id for _, warehouse_id, _ in stocks}
+    warehouse_channels = _get_warehouse_channels(
+        warehouse_ids, database_connection_name
+    )
+    warehouse_channel_countries = (
+        _get_warehouse_channel_countries(warehouse_channels, database_connection_name)
+        if include_countries
+        else {}
+    )
+
+    quantities: dict[VariantChannelCountry, int] = defaultdict(int)
+    for variant_id, warehouse_id, available_quantity in stocks:
+        for channel_id in warehouse_channels[warehouse_id]:
+            quantities[(variant_id, channel_id, ALL_COUNTRIES)] += available_quantity
+            for country_code in warehouse_channel_countries.get(
+                (warehouse_id, channel_id), ()
+            ):
+                quantities[(variant_id, channel_id, country_code)] += available_quantity
+    return quantities
+
+
+def update_stock_availability(variant_ids: Iterable[int]):
+    """Recalculate the available quantities of variants stored in the table.
+
+    Call it in the transaction changing stocks or allocations of the variants, so
+    the table is updated together with the stocks. Rows of the variants are
+    locked first, so concurrent updates of the same variant can't overwrite each
+    other with quantities calculated before the other transaction committed.
+    """
+    if not is_stock_availability_table_enabled():
+        return
+    variant_ids = sorted(set(variant_ids))
+    if not variant_ids:
+        return
+
+    site_settings = Site.objects.get_current().settings
+    with transaction.atomic():
+        existing_rows = {
+            (row.product_variant_id, row.channel_id, row.country_code): row
+            for row in VariantStockAvailability.objects.select_for_update(of=("self",))
+            .filter(product_variant_id__in=variant_ids)
+            .order_by("pk")
+        }
+        quantities = calculate_stock_availability(
+            variant_ids,
+            include_countries=(
+                site_settings.use_legacy_shipping_zone_stock_availability
+            ),
+        )
+
+        rows_to_update = []
+        rows_to_create = []
+        for key, quantity in quantities.items():
+            if row := existing_rows.pop(key, None):
+                if row.quantity != quantity:
+                    row.quantity = quantity
+                    rows_to_update.append(row)
+                continue
+            variant_id, channel_id, country_code = key
+            rows_to_create.append(
+                VariantStockAvailability(
+                    product_variant_id=variant_id,
+                    channel_id=channel_id,
+                    country_code=country_code,
+                    quantity=quantity,
+                )
+            )
+
+        if existing_rows:
+            VariantStockAvailability.objects.filter(
+                pk__in=[row.pk for row in existing_rows.values()]
+            ).delete()
+        if rows_to_update:
+            VariantStockAvailability.objects.bulk_update(rows_to_update, ["quantity"])
+        if rows_to_create:
+            VariantStockAvailability.objects.bulk_create(
+                rows_to_create,
+                update_conflicts=True,
+                unique_fields=["product_variant", "channel", "country_code"],
+                update_fields=["quantity"],
+            )
+
+
+def update_stock_availability_for_stocks(stocks: Iterable[Stock]):
+    update_stock_availability({stock.product_variant_id for stock in stocks})
+
+
+def get_stock_availability(
+    variant_ids: Iterable[int],
+    channel_slug: str,
+    country_code: str | None = None,
+    *,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[int, int]:
+    """Return the available quantity of variants in the channel from the table.
+
+    Variants without any stock in the channel are missing in the returned dict.
+    """
+    channels = Channel.objects.using(database_connection_name).filter(slug=channel_slug)
+    return dict(
+        VariantStockAvailability.objects.using(database_connection_name)
+        .filter(
+            Exists(channels.filter(pk=OuterRef("channel_id"))),
+            product_variant_id__in=variant_ids,
+            country_code=country_code or ALL_COUNTRIES,
+        )
+        .values_list("product_variant_id", "quantity")
+    )
+
+
+def get_in_stock_availability(
+    channel_slug: str,
+    country_code: str | None = None,
+    *,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> "QuerySet[VariantStockAvailability]":
+    """Return the table rows of variants available in the channel."""
+    channels = Channel.objects.using(database_connection_name).filter(slug=channel_slug)
+    return VariantStockAvailability.objects.using(database_connection_name).filter(
+        Exists(channels.filter(pk=OuterRef("channel_id"))),
+        country_code=country_code or ALL_COUNTRIES,
+        quantity__gt=0,
+    )
@@ -1,15 +1,29 @@
+from functools import reduce
+from operator import or_
+
 from celery.utils.log import get_task_logger
-from django.db.models import F, Sum
+from django.db.models import Exists, F, OuterRef, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..core.utils.batches import PkRange, filter_by_pk_range, queryset_in_batches
+from ..product.models import ProductVariant
 from .management import delete_allocations, stock_bulk_update
-from .models import Allocation, PreorderReservation, Reservation, Stock
+from .models import (
+    Allocation,
+    PreorderReservation,
+    Reservation,
+    Stock,
+    VariantStockAvailability,
+)
+from .stock_availability import update_stock_availability
 
 task_logger = get_task_logger(__name__)
 
+STOCK_AVAILABILITY_UPDATE_BATCH_SIZE = 500
+
 
 @app.task
 @allow_writer()
@@ -66,3 +80,70 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+@allow_writer()
+def update_stock_availability_task(
+    warehouse_ids: list[str] | None = None,
+    channel_ids: list[int] | None = None,
+    last_variant_id: int = 0,
+):
+    """Recalculate the stock availability table after warehouse assignment changes.
+
+    Variants with stocks in the given warehouses and variants with available
+    quantities stored for the given channels are recalculated in batches.
+    """
+    lookups = []
+    if warehouse_ids:
+        lookups.append(
+            Exists(
+                Stock.objects.filter(
+                    product_variant_id=OuterRef("pk"), warehouse_id__in=warehouse_ids
+                )
+            )
+        )
+    if channel_ids:
+        lookups.append(
+            Exists(
+                VariantStockAvailability.objects.filter(
+                    product_variant_id=OuterRef("pk"), channel_id__in=channel_ids
+                )
+            )
+        )
+    if not lookups:
+        return
+
+    variant_ids = list(
+        ProductVariant.objects.filter(reduce(or_, lookups), pk__gt=last_variant_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:STOCK_AVAILABILITY_UPDATE_BATCH_SIZE]
+    )
+    if not variant_ids:
+        return
+
+    update_stock_availability(variant_ids)
+    task_logger.debug("Updated stock availability of %s variants", len(variant_ids))
+
+    if len(variant_ids) == STOCK_AVAILABILITY_UPDATE_BATCH_SIZE:
+        update_stock_availability_task.delay(
+            warehouse_ids=warehouse_ids,
+            channel_ids=channel_ids,
+            last_variant_id=variant_ids[-1],
+        )
+
+
+@app.task
+@allow_writer()
+def update_stock_availability_in_pk_range_task(start_pk: int, end_pk: int):
+    """Recalculate the stock availability table of variants in the range of IDs.
+
+    Used to recalculate the whole table in parallel, one task per range.
+    """
+    variants = filter_by_pk_range(
+        ProductVariant.objects.all(), PkRange(start_pk, end_pk)
+    )
+    for variant_ids in queryset_in_batches(
+        variants, STOCK_AVAILABILITY_UPDATE_BATCH_SIZE
+    ):
+        update_stock_availability(variant_ids)
@@ -0,0 +1,234 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from ...order.fetch import OrderLineInfo
+from ..availability import can_use_stock_availability_table
+from ..management import allocate_stocks, decrease_stock
+from ..models import Stock, VariantStockAvailability
+from ..stock_availability import (
+    ALL_COUNTRIES,
+    get_in_stock_availability,
+    get_stock_availability,
+    update_stock_availability,
+)
+from ..tasks import (
+    update_stock_availability_in_pk_range_task,
+    update_stock_availability_task,
+)
+
+COUNTRY_CODE = "US"
+
+
+@pytest.fixture(autouse=True)
+def _enable_stock_availability_table(settings):
+    settings.STOCK_AVAILABILITY_TABLE_ENABLED = True
+
+
+def test_update_stock_availability(stock, channel_USD, site_settings):
+    # given
+    variant = stock.product_variant
+
+    # when
+    update_stock_availability([variant.pk])
+
+    # then
+    availability = VariantStockAvailability.objects.get(
+        product_variant=variant, channel=channel_USD, country_code=ALL_COUNTRIES
+    )
+    assert availability.quantity == stock.quantity
+
+
+def test_update_stock_availability_with_legacy_shipping_zones(
+    stock, channel_USD, site_settings
+):
+    # given
+    site_settings.use_legacy_shipping_zone_stock_availability = True
+    site_settings.save(update_fields=["use_legacy_shipping_zone_stock_availability"])
+    variant = stock.product_variant
+
+    # when
+    update_stock_availability([variant.pk])
+
+    # then
+    assert get_stock_availability([variant.pk], channel_USD.slug) == {
+        variant.pk: stock.quantity
+    }
+    assert get_stock_availability([variant.pk], channel_USD.slug, "PL") == {
+        variant.pk: stock.quantity
+    }
+
+
+def test_update_stock_availability_table_disabled(stock, settings):
+    # given
+    settings.STOCK_AVAILABILITY_TABLE_ENABLED = False
+
+    # when
+    update_stock_availability([stock.product_variant_id])
+
+    # then
+    assert not VariantStockAvailability.objects.exists()
+
+
+def test_update_stock_availability_deletes_stale_rows(
+    stock, channel_USD, site_settings
+):
+    # given
+    variant = stock.product_variant
+    update_stock_availability([variant.pk])
+    stock.warehouse.channels.remove(channel_USD)
+
+    # when
+    update_stock_availability([variant.pk])
+
+    # then
+    assert not VariantStockAvailability.objects.filter(product_variant=variant).exists()
+
+
+def test_allocate_stocks_updates_stock_availability(
+    order_line, stock, channel_USD, site_settings
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    update_stock_availability([stock.product_variant_id])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        site_settings=site_settings,
+        requestor=None,
+        calculate_stocks_with_shipping_zones=False,
+    )
+
+    # then
+    assert get_stock_availability([stock.product_variant_id], channel_USD.slug) == {
+        stock.product_variant_id: 50
+    }
+
+
+def test_decrease_stock_updates_stock_availability(
+    allocation, channel_USD, site_settings
+):
+    # given
+    stock = allocation.stock
+    variant_id = stock.product_variant_id
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    allocation.quantity_allocated = 80
+    allocation.save(update_fields=["quantity_allocated"])
+    update_stock_availability([variant_id])
+    warehouse_pk = stock.warehouse.pk
+    line_info = OrderLineInfo(
+        line=allocation.order_line,
+        quantity=80,
+        variant=stock.product_variant,
+        warehouse_pk=warehouse_pk,
+    )
+
+    # when
+    decrease_stock([line_info], site_settings=site_settings, requestor=None)
+
+    # then
+    assert get_stock_availability([variant_id], channel_USD.slug) == {variant_id: 20}
+    assert list(
+        get_in_stock_availability(channel_USD.slug).values_list(
+            "product_variant_id", flat=True
+        )
+    ) == [variant_id]
+
+
+def test_can_use_stock_availability_table_with_reservations(site_settings):
+    # given
+    site_settings.reserve_stock_duration_anonymous_user = 5
+
+    # when
+    result = can_use_stock_availability_table(
+        site_settings, include_shipping_zones=False
+    )
+
+    # then
+    assert result is False
+
+
+def test_can_use_stock_availability_table_with_shipping_zones(site_settings):
+    # when
+    with_country = can_use_stock_availability_table(
+        site_settings, include_shipping_zones=True, country_code="PL"
+    )
+    without_country = can_use_stock_availability_table(
+        site_settings, include_shipping_zones=True
+    )
+
+    # then
+    assert with_country is True
+    assert without_country is False
+
+
+@patch("saleor.warehouse.tasks.update_stock_availability")
+def test_update_stock_availability_task(
+    update_stock_availability_mock, stock, warehouse
+):
+    # given
+    variant_ids = sorted(
+        Stock.objects.filter(warehouse=warehouse).values_list(
+            "product_variant_id", flat=True
+        )
+    )
+    assert stock.product_variant_id in variant_ids
+
+    # when
+    update_stock_availability_task(warehouse_ids=[str(warehouse.pk)])
+
+    # then
+    update_stock_availability_mock.assert_called_once_with(variant_ids)
+
+
+@patch("saleor.warehouse.tasks.update_stock_availability")
+def test_update_stock_availability_in_pk_range_task(
+    update_stock_availability_mock, product_with_two_variants
+):
+    # given
+    first_variant, second_variant = product_with_two_variants.variants.order_by("pk")
+
+    # when
+    update_stock_availability_in_pk_range_task(first_variant.pk, first_variant.pk)
+
+    # then
+    update_stock_availability_mock.assert_called_once_with([first_variant.pk])
+
+
+@patch(
+    "saleor.core.management.commands.update_stock_availability."
+    "update_stock_availability_in_pk_range_task.delay"
+)
+def test_update_stock_availability_command_with_shards(
+    task_mock, product_with_two_variants
+):
+    # given
+    first_variant, second_variant = product_with_two_variants.variants.order_by("pk")
+
+    # when
+    call_command("update_stock_availability", shards=2)
+
+    # then
+    task_mock.assert_any_call(first_variant.pk, first_variant.pk)
+    task_mock.assert_any_call(second_variant.pk, second_variant.pk)
+
+
+def test_warehouse_channels_change_schedules_stock_availability_update(
+    warehouse, channel_PLN, django_capture_on_commit_callbacks
+):
+    # when
+    with patch(
+        "saleor.warehouse.signals.update_stock_availability_task.delay"
+    ) as task_mock:
+        with django_capture_on_commit_callbacks(execute=True):
+            warehouse.channels.add(channel_PLN)
+
+    # then
+    task_mock.assert_called_once_with(warehouse_ids=[str(warehouse.pk)], channel_ids=[])
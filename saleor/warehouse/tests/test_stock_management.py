@@ -1506,6 +1506,47 @@ def test_allocate_stocks_triggers_channel_out_of_stock_event_when_stock_runs_out
     assert fired_settings is site_settings
 
 
+@mock.patch("saleor.warehouse.management.trigger_product_variant_out_of_stock")
+def test_allocate_stocks_triggers_out_of_stock_once_per_stock(
+    mocked_trigger,
+    order_line,
+    stock,
+    channel_USD,
+    site_settings,
+    django_capture_on_commit_callbacks,
+):
+    # given - two lines of the same variant drain the stock together
+    stock.quantity = 10
+    stock.quantity_allocated = 0
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    order_line_2 = OrderLine.objects.get(pk=order_line.pk)
+    order_line_2.pk = None
+    order_line_2.save()
+
+    line_data_1 = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=4)
+    line_data_2 = OrderLineInfo(
+        line=order_line_2, variant=order_line.variant, quantity=6
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data_1, line_data_2],
+            COUNTRY_CODE,
+            channel_USD,
+            site_settings=site_settings,
+            requestor=None,
+            calculate_stocks_with_shipping_zones=True,
+        )
+
+    # then
+    mocked_trigger.assert_called_once()
+    assert mocked_trigger.call_args.args[0].pk == stock.pk
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 10
+
+
 @mock.patch(
     "saleor.warehouse.channel_stock_availability.trigger_out_of_stock_in_channel_events_for_stocks"
 )
@@ -16,8 +16,6 @@ from ...webhook.utils import filter_webhooks_for_channel, get_webhooks_for_event
 from ..interface import VariantChannelStockInfo
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
-
     from ...site.models import SiteSettings
     from ...webhook.models import Webhook
 
@@ -41,7 +39,7 @@ def _trigger(
     stock_infos: list[VariantChannelStockInfo],
     site_settings: "SiteSettings",
     requestor: T_REQUESTOR,
-    webhooks: "QuerySet[Webhook] | None",
+    webhooks: "list[Webhook] | None",
 ) -> None:
     # channel stock availability events are only triggered when legacy shipping
     # zone stock availability is disabled
@@ -78,7 +76,7 @@ def trigger_product_variant_out_of_stock_in_channel(
     stock_infos: list[VariantChannelStockInfo],
     site_settings: "SiteSettings",
     requestor: T_REQUESTOR = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     _trigger(
         WebhookEventAsyncType.PRODUCT_VARIANT_OUT_OF_STOCK_IN_CHANNEL,
@@ -93,7 +91,7 @@ def trigger_product_variant_back_in_stock_in_channel(
     stock_infos: list[VariantChannelStockInfo],
     site_settings: "SiteSettings",
     requestor: T_REQUESTOR = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     _trigger(
         WebhookEventAsyncType.PRODUCT_VARIANT_BACK_IN_STOCK_IN_CHANNEL,
@@ -108,7 +106,7 @@ def trigger_product_variant_out_of_stock_for_click_and_collect(
     stock_infos: list[VariantChannelStockInfo],
     site_settings: "SiteSettings",
     requestor: T_REQUESTOR = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     _trigger(
         WebhookEventAsyncType.PRODUCT_VARIANT_OUT_OF_STOCK_FOR_CLICK_AND_COLLECT,
@@ -123,7 +121,7 @@ def trigger_product_variant_back_in_stock_for_click_and_collect(
     stock_infos: list[VariantChannelStockInfo],
     site_settings: "SiteSettings",
     requestor: T_REQUESTOR = None,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     _trigger(
         WebhookEventAsyncType.PRODUCT_VARIANT_BACK_IN_STOCK_FOR_CLICK_AND_COLLECT,
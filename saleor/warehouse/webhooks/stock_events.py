@@ -14,8 +14,6 @@ from ...webhook.utils import get_webhooks_for_event
 from .payloads import generate_product_variant_with_stock_payload
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
-
     from ...webhook.models import Webhook
     from ..models import Stock
 
@@ -26,7 +24,7 @@ T_REQUESTOR = User | App | None
 def trigger_product_variant_out_of_stock(
     stock: "Stock",
     requestor: T_REQUESTOR,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_OUT_OF_STOCK
     if webhooks is None:
@@ -49,7 +47,7 @@ def trigger_product_variant_out_of_stock(
 def trigger_product_variant_back_in_stock(
     stock: "Stock",
     requestor: T_REQUESTOR,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_BACK_IN_STOCK
     if webhooks is None:
@@ -72,7 +70,7 @@ def trigger_product_variant_back_in_stock(
 def trigger_product_variant_stocks_updated(
     stocks: Iterable["Stock"],
     requestor: T_REQUESTOR,
-    webhooks: "QuerySet[Webhook] | None" = None,
+    webhooks: "list[Webhook] | None" = None,
 ) -> None:
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_STOCK_UPDATED
     if webhooks is None:
@@ -0,0 +1,32 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .signals import (
+            invalidate_webhooks_cache_on_app_permissions_change,
+            invalidate_webhooks_cache_on_change,
+        )
+
+        # preventing duplicate signals
+        for model in (App, Webhook, WebhookEvent):
+            post_save.connect(
+                invalidate_webhooks_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_cache_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_webhooks_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_cache_on_{model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhooks_cache_on_app_permissions_change,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhooks_cache_on_app_permissions_change",
+        )
@@ -0,0 +1,38 @@
+from collections.abc import Callable
+
+from django.conf import settings
+
+from ..core.utils.model_generation import (
+    GenerationLocalCache,
+    LocalCacheKey,
+    get_generation,
+    invalidate_generation,
+)
+
+WEBHOOKS_GENERATION_CACHE_KEY = "webhooks_generation"
+WEBHOOKS_LOCAL_CACHE_SIZE = 1024
+
+_local_cache = GenerationLocalCache(WEBHOOKS_LOCAL_CACHE_SIZE)
+
+
+def invalidate_webhooks_cache():
+    """Invalidate the webhooks cached by all processes.
+
+    Must be called whenever webhooks, their events, apps or app permissions change.
+    Model signals call it automatically; code using bulk operations, which don't send
+    signals, has to call it explicitly.
+    """
+    invalidate_generation([WEBHOOKS_GENERATION_CACHE_KEY])
+
+
+def get_or_load_webhooks[T](key: LocalCacheKey, load: Callable[[], T]) -> T:
+    """Return the value cached in the process memory or load and cache it."""
+    timeout = settings.WEBHOOK_SUBSCRIBERS_CACHE_TIMEOUT
+    if not timeout:
+        return load()
+    generation = get_generation([WEBHOOKS_GENERATION_CACHE_KEY])
+    return _local_cache.get_or_load(key, generation, timeout, load)
+
+
+def clear_local_webhooks_cache():
+    _local_cache.clear()
@@ -1,5 +1,7 @@
 import logging
+import threading
 import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from django.conf import settings
@@ -16,6 +18,7 @@ from ...core.telemetry import (
 )
 from ...graphql.app.enums import CircuitBreakerState
 from ...webhook.event_types import WebhookEventSyncType
+from .storage import AppBreakerData
 
 if TYPE_CHECKING:
     from ...app.models import App
@@ -46,6 +49,10 @@ BREAKER_BOARD_SUCCESS_COUNT_RECOVERY: int = 50
 # Time to keep circuit breaker in opened state before starting recovery (half-open state).
 BREAKER_BOARD_COOLDOWN_SECONDS: int = 2 * 60
 
+# Time to keep circuit breaker state in the process memory before reading it from the
+# storage again. Failed webhook calls of the app drop the cached state immediately.
+BREAKER_BOARD_STATE_CACHE_TTL_SECONDS: float = 2
+
 METRIC_CIRCUIT_BREAKER_EVENT_COUNT = meter.create_metric(
     "saleor.external_request.sync.circuit_breaker.event_count",
     scope=Scope.SERVICE,
@@ -83,6 +90,7 @@ class BreakerBoard:
         success_count_recovery: int,
         cooldown_seconds: int,
         ttl_seconds: int,
+        state_cache_ttl_seconds: float = 0,
     ):
         self.validate_sync_events()
         self.storage = storage
@@ -93,6 +101,9 @@ class BreakerBoard:
         self.failure_threshold_recovery = failure_threshold_recovery
         self.cooldown_seconds = cooldown_seconds
         self.ttl_seconds = ttl_seconds
+        self.state_cache_ttl_seconds = state_cache_ttl_seconds
+        self._state_cache: dict[int, tuple[float, str]] = {}
+        self._state_cache_lock = threading.Lock()
 
     def validate_sync_events(self):
         if not settings.BREAKER_BOARD_SYNC_EVENTS:
@@ -133,6 +144,7 @@ class BreakerBoard:
         return total - errors >= self.success_count_recovery
 
     def set_breaker_state(self, app: "App", state: str, total: int, errors: int) -> str:
+        self.clear_cached_breaker_state(app.id)
         self.storage.clear_state_for_app(app.id)
 
         changed_at = int(time.time())
@@ -153,11 +165,31 @@ class BreakerBoard:
         )
         return state
 
-    def update_breaker_state(self, app: "App") -> str:
-        state, changed_at = self.storage.get_app_state(app.id)
+    def get_cached_breaker_state(self, app_id: int) -> str | None:
+        with self._state_cache_lock:
+            expires_at, state = self._state_cache.get(app_id, (0, None))
+        if expires_at > time.monotonic():
+            return state
+        return None
 
-        total = self.storage.get_event_count(app.id, "total") or 1
-        errors = self.storage.get_event_count(app.id, "error")
+    def cache_breaker_state(self, app_id: int, state: str):
+        if not self.state_cache_ttl_seconds:
+            return
+        expires_at = time.monotonic() + self.state_cache_ttl_seconds
+        with self._state_cache_lock:
+            self._state_cache[app_id] = (expires_at, state)
+
+    def clear_cached_breaker_state(self, app_id: int | None = None):
+        with self._state_cache_lock:
+            if app_id is None:
+                self._state_cache.clear()
+            else:
+                self._state_cache.pop(app_id, None)
+
+    def evaluate_breaker_state(self, app: "App", data: AppBreakerData) -> str:
+        state, changed_at = data.state, data.changed_at
+        total = data.total or 1
+        errors = data.errors
         # CLOSED to OPEN
         if state == CircuitBreakerState.CLOSED and self.exceeded_error_threshold(
             state, total, errors
@@ -182,12 +214,51 @@ class BreakerBoard:
                 )
         return state
 
+    def update_breaker_states(self, apps: Iterable["App"]) -> dict[int, str]:
+        """Return the current breaker states of the apps, keyed by app ID.
+
+        States cached in the process memory are reused; the states of the remaining
+        apps are read from the storage in a single round trip.
+        """
+        states: dict[int, str] = {}
+        apps_to_fetch: dict[int, App] = {}
+        for app in apps:
+            if (state := self.get_cached_breaker_state(app.id)) is not None:
+                states[app.id] = state
+            else:
+                apps_to_fetch[app.id] = app
+
+        if apps_to_fetch:
+            app_states = self.storage.get_app_states(list(apps_to_fetch))
+            for app_id, app in apps_to_fetch.items():
+                state = self.evaluate_breaker_state(app, app_states[app_id])
+                self.cache_breaker_state(app_id, state)
+                states[app_id] = state
+        return states
+
+    def update_breaker_state(self, app: "App") -> str:
+        return self.update_breaker_states([app])[app.id]
+
+    def prefetch_breaker_states(self, event_type: str, webhooks: Iterable["Webhook"]):
+        """Cache the breaker states of the webhooks' apps in a single round trip.
+
+        Call it before triggering the event for several webhooks, so the wrapped
+        function reuses the cached states instead of reading them one by one.
+        """
+        if (
+            not self.state_cache_ttl_seconds
+            or event_type not in settings.BREAKER_BOARD_SYNC_EVENTS
+        ):
+            return
+        self.update_breaker_states(webhook.app for webhook in webhooks)
+
     def register_error(self, app_id: int):
-        self.storage.register_event(app_id, "error", self.ttl_seconds)
-        self.storage.register_event(app_id, "total", self.ttl_seconds)
+        self.storage.register_events(app_id, ["error", "total"], self.ttl_seconds)
+        # Errors may trip the breaker, don't wait for the cached state to expire.
+        self.clear_cached_breaker_state(app_id)
 
     def register_success(self, app_id: int):
-        self.storage.register_event(app_id, "total", self.ttl_seconds)
+        self.storage.register_events(app_id, ["total"], self.ttl_seconds)
 
     def wrap_promise_func(self, promise_func):
         """Wrap a Promise-returning webhook function with circuit breaker logic.
@@ -243,4 +314,5 @@ def initialize_breaker_board() -> BreakerBoard | None:
         success_count_recovery=BREAKER_BOARD_SUCCESS_COUNT_RECOVERY,
         cooldown_seconds=BREAKER_BOARD_COOLDOWN_SECONDS,
         ttl_seconds=BREAKER_BOARD_TTL_SECONDS,
+        state_cache_ttl_seconds=BREAKER_BOARD_STATE_CACHE_TTL_SECONDS,
     )
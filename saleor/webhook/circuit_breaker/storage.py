@@ -1,6 +1,7 @@
 import logging
 import time
 import uuid
+from typing import NamedTuple
 
 from django.core.cache import cache
 from redis import RedisError
@@ -10,6 +11,13 @@ from ...graphql.app.enums import CircuitBreakerState
 logger = logging.getLogger(__name__)
 
 
+class AppBreakerData(NamedTuple):
+    state: str
+    changed_at: int
+    total: int
+    errors: int
+
+
 class Storage:
     def set_app_state(self, app_id: int, state: CircuitBreakerState, changed_at: int):
         pass
@@ -23,6 +31,23 @@ class Storage:
     def register_event(self, app_id: int, name: str, ttl_seconds: int):
         pass
 
+    def register_events(self, app_id: int, names: list[str], ttl_seconds: int):
+        for name in names:
+            self.register_event(app_id, name, ttl_seconds)
+
+    def get_app_states(self, app_ids: list[int]) -> dict[int, AppBreakerData]:
+        """Return the state, state change time, total and error count of the apps."""
+        app_states = {}
+        for app_id in app_ids:
+            state, changed_at = self.get_app_state(app_id)
+            app_states[app_id] = AppBreakerData(
+                state=state,
+                changed_at=changed_at,
+                total=self.get_event_count(app_id, "total"),
+                errors=self.get_event_count(app_id, "error"),
+            )
+        return app_states
+
     def clear_state_for_app(self, app_id: int):
         pass
 
@@ -87,29 +112,62 @@ class RedisStorage(Storage):
             return 0
 
     def register_event(self, app_id: int, name: str, ttl_seconds: int):
+        self.register_events(app_id, [name], ttl_seconds)
+
+    def register_events(self, app_id: int, names: list[str], ttl_seconds: int):
         base_key = self.get_base_storage_key()
-        key = f"{base_key}-{app_id}-{name}"
         now = int(time.time())
 
         try:
-            # Use Redis pipeline for network optimization.
+            # Use Redis pipeline for network optimization, all events are registered
+            # in a single round trip.
             p = self._client.pipeline()
 
-            # Remove all no longer relevant events.
-            # The command removes all events from `key` set where score (event's registration
-            # time) already reached end of life (TTL).
-            p.zremrangebyscore(key, "-inf", now - ttl_seconds)
+            for name in names:
+                key = f"{base_key}-{app_id}-{name}"
+
+                # Remove all no longer relevant events.
+                # The command removes all events from `key` set where score (event's
+                # registration time) already reached end of life (TTL).
+                p.zremrangebyscore(key, "-inf", now - ttl_seconds)
 
-            # Add event to `key` set where event is random identifier and event's score is
-            # event's registration time.
-            # Event is random identifier because underlying structure to contain items
-            # within Redis is a set.
-            p.zadd(key, {uuid.uuid4().bytes: now})
+                # Add event to `key` set where event is random identifier and event's
+                # score is event's registration time.
+                # Event is random identifier because underlying structure to contain
+                # items within Redis is a set.
+                p.zadd(key, {uuid.uuid4().bytes: now})
 
             p.execute()
         except RedisError:
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
 
+    def get_app_states(self, app_ids: list[int]) -> dict[int, AppBreakerData]:
+        base_key = self.get_base_storage_key()
+        try:
+            # Read states and event counts of all apps in a single round trip.
+            p = self._client.pipeline(transaction=False)
+            for app_id in app_ids:
+                p.get(f"{base_key}-{app_id}-{self.STATE_KEY}")
+                p.zcard(f"{base_key}-{app_id}-total")
+                p.zcard(f"{base_key}-{app_id}-error")
+            results = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            results = [None, 0, 0] * len(app_ids)
+
+        app_states = {}
+        for index, app_id in enumerate(app_ids):
+            data, total, errors = results[index * 3 : index * 3 + 3]
+            state, changed_at = (
+                deserialize_breaker_state(data)
+                if data
+                else (CircuitBreakerState.CLOSED, 0)
+            )
+            app_states[app_id] = AppBreakerData(
+                state=state, changed_at=changed_at, total=total, errors=errors
+            )
+        return app_states
+
     def clear_state_for_app(self, app_id: int):
         base_key = self.get_base_storage_key()
         keys = [f"{base_key}-{app_id}-{name}" for name in self.EVENT_KEYS]
@@ -1,5 +1,10 @@
+import atexit
+import logging
 import math
+import os
+import threading
 import zlib
+from collections.abc import Callable
 
 from asgiref.local import Local
 from django.conf import settings
@@ -7,8 +12,16 @@ from redis import ConnectionPool, Redis
 
 from .exceptions import ConnectionNotConfigured
 
+logger = logging.getLogger(__name__)
+
 KEY_TYPE = str
 DEFAULT_CONNECTION_TIMEOUT = 0.5
+# Marks buffer items holding a batch of events. Items holding a single event are
+# plain zlib streams, which never start with a null byte.
+BATCH_MARKER = b"\x00"
+BATCH_LENGTH_BYTES = 4
+# Batch items start with the number of events, readable without decompression.
+BATCH_HEADER_BYTES = len(BATCH_MARKER) + BATCH_LENGTH_BYTES
 _local = Local()
 
 
@@ -37,6 +50,34 @@ class BaseBuffer:
     def encode(self, value: bytes) -> bytes:
         return zlib.compress(value, self._compressor_preset)
 
+    def encode_batch(self, events: list[bytes]) -> bytes:
+        """Compress events at once, sharing the compression window between them."""
+        data = b"".join(
+            len(event).to_bytes(BATCH_LENGTH_BYTES, "big") + event for event in events
+        )
+        return (
+            BATCH_MARKER
+            + len(events).to_bytes(BATCH_LENGTH_BYTES, "big")
+            + zlib.compress(data, self._compressor_preset)
+        )
+
+    def count_events(self, value: bytes) -> int:
+        if not value.startswith(BATCH_MARKER):
+            return 1
+        return int.from_bytes(value[len(BATCH_MARKER) : BATCH_HEADER_BYTES], "big")
+
+    def decode_events(self, value: bytes) -> list[bytes]:
+        if not value.startswith(BATCH_MARKER):
+            return [self.decode(value)]
+        data = zlib.decompress(value[BATCH_HEADER_BYTES:])
+        events, position = [], 0
+        while position < len(data):
+            length_end = position + BATCH_LENGTH_BYTES
+            event_end = length_end + int.from_bytes(data[position:length_end], "big")
+            events.append(data[length_end:event_end])
+            position = event_end
+        return events
+
     def put_event(self, event: bytes) -> int:
         raise NotImplementedError(
             "subclasses of BaseBuffer must provide a put_event() method"
@@ -47,6 +88,11 @@ class BaseBuffer:
             "subclasses of BaseBuffer must provide a put_events() method"
         )
 
+    def put_batch(self, events: list[bytes]) -> int:
+        raise NotImplementedError(
+            "subclasses of BaseBuffer must provide a put_batch() method"
+        )
+
     def put_multi_key_events(
         self, events_dict: dict[KEY_TYPE, list[bytes]]
     ) -> dict[KEY_TYPE, int]:
@@ -115,6 +161,51 @@ class RedisBuffer(BaseBuffer):
             self._client = self.connect()
         return self._client
 
+    def _size_key(self, key: KEY_TYPE) -> str:
+        return f"{key}:size"
+
+    def _put_items(self, key: KEY_TYPE, items: list[bytes], client: Redis):
+        # Items hold a varying number of events, so the number of events in the
+        # buffer is counted separately, to keep the size limit in events.
+        size_key = self._size_key(key)
+        client.lpush(key, *items)
+        client.incrby(size_key, sum(self.count_events(item) for item in items))
+        client.expire(key, self.timeout)
+        client.expire(size_key, self.timeout)
+
+    def _pop_items(self, key: KEY_TYPE, count: int) -> tuple[list[bytes], int, int]:
+        """Pop the oldest items until they hold at least `count` events.
+
+        Items are popped one by one, so at most a single item's events are popped
+        over the requested count. Return the items, the number of events they hold
+        and the number of events left in the buffer.
+        """
+        items: list[bytes] = []
+        events_count = 0
+        while events_count < count:
+            item = self.client.rpop(key)
+            if item is None:
+                break
+            items.append(item)
+            events_count += self.count_events(item)
+        size_key = self._size_key(key)
+        if not events_count:
+            return items, 0, max(0, int(self.client.get(size_key) or 0))
+        remaining = self.client.decrby(size_key, events_count)
+        if remaining < 0:
+            # Items stored without counting their events, e.g. before the count was
+            # introduced, were popped; start counting anew.
+            self.client.delete(size_key)
+            remaining = 0
+        return items, events_count, remaining
+
+    def _trim(self, key: KEY_TYPE, size: int) -> int:
+        """Drop the oldest events over the size limit and return their number."""
+        if size <= self.max_size:
+            return 0
+        _, dropped, _ = self._pop_items(key, size - self.max_size)
+        return dropped
+
     def _put_events(
         self, key: KEY_TYPE, events: list[bytes], client: Redis | None = None
     ) -> int:
@@ -122,16 +213,34 @@ class RedisBuffer(BaseBuffer):
         events_data = [self.encode(event) for event in events[start_index:]]
         if client is None:
             client = self.client
-        client.lpush(key, *events_data)
-        client.ltrim(key, 0, max(0, self.max_size - 1))
-        client.expire(key, self.timeout)
+        self._put_items(key, events_data, client)
         return max(0, len(events) - self.max_size)
 
+    def put_batch(self, events: list[bytes]) -> int:
+        """Store events as items holding up to `batch_size` events each.
+
+        Return the number of events dropped due to the buffer size limit.
+        """
+        if not events:
+            return 0
+        start_index = -self.max_size
+        dropped = max(0, len(events) - self.max_size)
+        events = events[start_index:]
+        batch_size = max(1, self.batch_size)
+        items = [
+            self.encode_batch(events[index : index + batch_size])
+            for index in range(0, len(events), batch_size)
+        ]
+        with self.client.pipeline(transaction=False) as pipe:
+            self._put_items(self.key, items, pipe)
+            result = pipe.execute()
+        return dropped + self._trim(self.key, result[1])
+
     def put_events(self, events: list[bytes]) -> int:
         with self.client.pipeline(transaction=False) as pipe:
             dropped = self._put_events(self.key, events, client=pipe)
             result = pipe.execute()
-        return dropped + max(0, result[0] - self.max_size)
+        return dropped + self._trim(self.key, result[1])
 
     def put_event(self, event: bytes) -> int:
         return self.put_events([event])
@@ -148,23 +257,17 @@ class RedisBuffer(BaseBuffer):
                 trimmed[key] = self._put_events(key, events_dict[key], client=pipe)
             result = pipe.execute()
         for key in keys:
-            buffer_len, _, _ = result.pop(0), result.pop(0), result.pop(0)
-            trimmed[key] += max(0, buffer_len - self.max_size)
+            _, size, _, _ = result[:4]
+            del result[:4]
+            trimmed[key] += self._trim(key, size)
         return trimmed
 
     def _pop_events(self, key: KEY_TYPE, batch_size: int) -> tuple[list[bytes], int]:
+        items, _, remaining = self._pop_items(key, max(1, batch_size))
         events = []
-        with self.client.pipeline(transaction=False) as pipe:
-            pipe.llen(key)
-            for _i in range(max(1, batch_size)):
-                pipe.rpop(key)
-            result = pipe.execute()
-        size = result.pop(0)
-        for elem in result:
-            if elem is None:
-                break
-            events.append(self.decode(elem))
-        return events, size - len(events)
+        for item in items:
+            events.extend(self.decode_events(item))
+        return events, remaining
 
     def pop_event(self) -> bytes | None:
         events, _ = self._pop_events(self.key, batch_size=1)
@@ -178,14 +281,77 @@ class RedisBuffer(BaseBuffer):
         return self._pop_events(self.key, self.batch_size)
 
     def clear(self) -> int:
+        size_key = self._size_key(self.key)
         with self.client.pipeline(transaction=False) as pipe:
-            pipe.llen(self.key)
-            pipe.delete(self.key)
+            pipe.get(size_key)
+            pipe.delete(self.key, size_key)
             result = pipe.execute()
-        return result[0]
+        return max(0, int(result[0] or 0))
 
     def size(self) -> int:
-        return self.client.llen(self.key)
+        return max(0, int(self.client.get(self._size_key(self.key)) or 0))
+
+
+class EventsAccumulator:
+    """Collect events in the process memory and store them in batches.
+
+    Events are passed to `store` by a background thread, every `flush_interval`
+    seconds or as soon as `max_events` events are collected, so reporting an event
+    doesn't wait for the buffer.
+    """
+
+    def __init__(
+        self,
+        store: Callable[[list[bytes]], None],
+        flush_interval: float,
+        max_events: int,
+    ):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_events = max_events
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.flush)
+
+    def _reset(self):
+        # Events collected before the fork are stored by the parent process.
+        self._events: list[bytes] = []
+        self._lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, event: bytes):
+        self._ensure_thread()
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self.max_events
+        if full:
+            self._flush_requested.set()
+
+    def flush(self):
+        with self._lock:
+            events, self._events = self._events, []
+        if events:
+            self.store(events)
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="observability-events-flush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Observability events dropped.")
 
 
 def get_buffer(
@@ -156,3 +156,71 @@ def test_pop_expired_events(buffer):
     with freeze_time(push_time + datetime.timedelta(seconds=buffer.timeout + 1)):
         popped_events = buffer.pop_events()
     assert popped_events == []
+
+
+def test_put_batch(buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(BATCH_SIZE + 1)]
+
+    # when
+    dropped = buffer.put_batch(events)
+
+    # then
+    assert dropped == 0
+    assert buffer.size() == BATCH_SIZE + 1
+    assert buffer.client.llen(buffer.key) == 2
+    assert buffer.pop_events() == events[:BATCH_SIZE]
+    assert buffer.pop_events() == events[BATCH_SIZE:]
+
+
+def test_put_batch_max_size(buffer, event_data):
+    # when
+    dropped = buffer.put_batch([event_data] * (MAX_SIZE + 1))
+
+    # then
+    assert dropped == 1
+    assert buffer.size() == MAX_SIZE
+
+
+def test_put_batch_drops_oldest_events_over_max_size(buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(MAX_SIZE)]
+    buffer.put_batch(events)
+
+    # when
+    dropped = buffer.put_batch([b"event-data-new"])
+
+    # then
+    assert dropped == BATCH_SIZE
+    assert buffer.size() == MAX_SIZE - BATCH_SIZE + 1
+    assert buffer.pop_events() == events[BATCH_SIZE:]
+    assert buffer.pop_events() == [b"event-data-new"]
+
+
+def test_pop_events_pops_batches_until_batch_size_events(buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(BATCH_SIZE)]
+    buffer.put_batch(events[:2])
+    buffer.put_batch(events[2:])
+    buffer.put_batch([b"event-data-next"])
+
+    # when
+    popped_events, size = buffer.pop_events_get_size()
+
+    # then
+    assert popped_events == events
+    assert size == 1
+    assert buffer.pop_events() == [b"event-data-next"]
+
+
+def test_pop_events_from_single_events_and_batches(buffer):
+    # given
+    buffer.put_event(b"event-data-0")
+    buffer.put_batch([b"event-data-1", b"event-data-2"])
+
+    # when
+    popped_events = buffer.pop_events()
+
+    # then
+    assert popped_events == [b"event-data-0", b"event-data-1", b"event-data-2"]
+    assert buffer.size() == 0
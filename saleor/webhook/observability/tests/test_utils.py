@@ -7,6 +7,7 @@ from celery.exceptions import Retry
 from django.http import HttpResponse
 from freezegun import freeze_time
 
+from ..buffers import EventsAccumulator
 from ..exceptions import ApiCallTruncationError, EventDeliveryAttemptTruncationError
 from ..payload_schema import JsonTruncText
 from ..payloads import CustomJsonEncoder
@@ -19,6 +20,7 @@ from ..utils import (
     report_api_call,
     report_event_delivery_attempt,
     report_gql_operation,
+    store_events,
     task_next_retry_date,
 )
 from .conftest import BATCH_SIZE
@@ -255,6 +257,51 @@ def test_put_event(patch_get_buffer, buffer, event_data):
     assert buffer.size() == 1
 
 
+@patch("saleor.webhook.observability.utils._events_accumulator")
+def test_put_event_collects_events_in_memory(
+    mocked_accumulator, settings, patch_get_buffer, buffer, event_data
+):
+    # given
+    settings.OBSERVABILITY_BUFFER_FLUSH_PERIOD = datetime.timedelta(seconds=1)
+
+    # when
+    put_event(lambda: event_data)
+
+    # then
+    mocked_accumulator.add.assert_called_once_with(event_data)
+    assert buffer.size() == 0
+
+
+def test_store_events(patch_get_buffer, buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(BATCH_SIZE)]
+
+    # when
+    store_events(events)
+
+    # then
+    assert buffer.size() == BATCH_SIZE
+    assert buffer.client.llen(buffer.key) == 1
+    assert buffer.pop_events() == events
+
+
+def test_events_accumulator_flush(event_data):
+    # given
+    stored_batches = []
+    accumulator = EventsAccumulator(
+        stored_batches.append, flush_interval=60, max_events=10
+    )
+    accumulator.add(event_data)
+    accumulator.add(event_data)
+
+    # when
+    accumulator.flush()
+    accumulator.flush()
+
+    # then
+    assert stored_batches == [[event_data, event_data]]
+
+
 @pytest.mark.parametrize(
     "error",
     [
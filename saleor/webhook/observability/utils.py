@@ -18,7 +18,7 @@ from pytimeparse import parse
 from ...core.utils import get_domain
 from ..event_types import WebhookEventAsyncType
 from ..utils import get_webhooks_for_event
-from .buffers import get_buffer
+from .buffers import EventsAccumulator, get_buffer
 from .exceptions import TruncationError
 from .payloads import generate_api_call_payload, generate_event_delivery_attempt_payload
 from .tracing import otel_trace
@@ -90,9 +90,26 @@ def task_next_retry_date(retry_error: "Retry") -> datetime.datetime | None:
     return None
 
 
+def store_events(events: list[bytes]):
+    with otel_trace("put_batch", "buffer"):
+        if get_buffer(get_buffer_name()).put_batch(events):
+            logger.warning("Observability buffer full, events dropped.")
+
+
+_events_accumulator = EventsAccumulator(
+    store_events,
+    flush_interval=settings.OBSERVABILITY_BUFFER_FLUSH_PERIOD.total_seconds(),
+    max_events=settings.OBSERVABILITY_BUFFER_BATCH_SIZE,
+)
+
+
 def put_event(generate_payload: Callable[[], bytes]):
     try:
         payload = generate_payload()
+        if settings.OBSERVABILITY_BUFFER_FLUSH_PERIOD:
+            # Stored in batches by a background thread.
+            _events_accumulator.add(payload)
+            return
         with otel_trace("put_event", "buffer"):
             if get_buffer(get_buffer_name()).put_event(payload):
                 logger.warning("Observability buffer full, event dropped.")
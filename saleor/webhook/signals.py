@@ -0,0 +1,10 @@
+from .cache import invalidate_webhooks_cache
+
+
+def invalidate_webhooks_cache_on_change(sender, **kwargs):
+    invalidate_webhooks_cache()
+
+
+def invalidate_webhooks_cache_on_app_permissions_change(sender, action, **kwargs):
+    if action in {"post_add", "post_remove", "post_clear"}:
+        invalidate_webhooks_cache()
@@ -1,9 +1,10 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
 from promise import Promise
 
+from ....app.models import App
 from ....graphql.app.enums import CircuitBreakerState
 from ....webhook.event_types import WebhookEventSyncType
 from .utils import create_breaker_board
@@ -263,3 +264,106 @@ def test_breaker_board_configuration_unexpected_dry_run_event(
         e.value.args[0]
         == f'Dry-run event "{event_name}" is not monitored by circuit breaker.'
     )
+
+
+def test_breaker_board_state_cached_in_process(
+    settings, breaker_storage, app_with_webhook
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage, state_cache_ttl_seconds=60)
+    app, webhook = app_with_webhook
+
+    wrapped_mocked_promise_func = MagicMock(
+        return_value=Promise.resolve({"data": "some"})
+    )
+    wrapped_function_mock = breaker_board.wrap_promise_func(wrapped_mocked_promise_func)
+
+    # when
+    with patch.object(
+        breaker_storage, "get_app_states", wraps=breaker_storage.get_app_states
+    ) as get_app_states_mock:
+        for _ in range(3):
+            wrapped_function_mock(
+                WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                "",
+                webhook,
+                False,
+            ).get()
+
+    # then
+    assert wrapped_mocked_promise_func.call_count == 3
+    get_app_states_mock.assert_called_once_with([app.id])
+    assert breaker_storage.get_event_count(app.id, "total") == 3
+
+
+def test_breaker_board_error_drops_cached_state(
+    settings, breaker_storage, app_with_webhook
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage, state_cache_ttl_seconds=60)
+    app, webhook = app_with_webhook
+
+    wrapped_mocked_promise_func = MagicMock(return_value=Promise.resolve(None))
+    wrapped_function_mock = breaker_board.wrap_promise_func(wrapped_mocked_promise_func)
+
+    # when
+    for _ in range(2):
+        wrapped_function_mock(
+            WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT, "", webhook, False
+        ).get()
+
+    # then the failure is taken into account despite the cached state
+    assert wrapped_mocked_promise_func.call_count == 1
+    assert breaker_board.get_cached_breaker_state(app.id) == CircuitBreakerState.OPEN
+
+
+def test_breaker_board_update_breaker_states_reads_storage_once(
+    settings, breaker_storage, app_with_webhook
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage)
+    app, _ = app_with_webhook
+    other_app = App.objects.create(
+        name="Other App", is_active=True, identifier="saleor.webhook.test.other"
+    )
+    breaker_storage.set_app_state(other_app.id, CircuitBreakerState.OPEN, 0)
+
+    # when
+    with patch.object(
+        breaker_storage, "get_app_states", wraps=breaker_storage.get_app_states
+    ) as get_app_states_mock:
+        states = breaker_board.update_breaker_states([app, other_app])
+
+    # then
+    get_app_states_mock.assert_called_once_with([app.id, other_app.id])
+    assert states == {
+        app.id: CircuitBreakerState.CLOSED,
+        other_app.id: CircuitBreakerState.HALF_OPEN,
+    }
+
+
+def test_breaker_board_prefetch_breaker_states(
+    settings, breaker_storage, app_with_webhook
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage, state_cache_ttl_seconds=60)
+    app, webhook = app_with_webhook
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+
+    wrapped_mocked_promise_func = MagicMock(
+        return_value=Promise.resolve({"data": "some"})
+    )
+    wrapped_function_mock = breaker_board.wrap_promise_func(wrapped_mocked_promise_func)
+
+    # when
+    breaker_board.prefetch_breaker_states(event_type, [webhook])
+    with patch.object(breaker_storage, "get_app_states") as get_app_states_mock:
+        wrapped_function_mock(event_type, "", webhook, False).get()
+
+    # then
+    get_app_states_mock.assert_not_called()
+    wrapped_mocked_promise_func.assert_called_once()
@@ -3,6 +3,7 @@ import datetime
 from freezegun import freeze_time
 
 from ....graphql.app.enums import CircuitBreakerState
+from ....webhook.circuit_breaker.storage import AppBreakerData
 
 APP_ID = 1
 NAME = "total"
@@ -77,3 +78,41 @@ def test_register_event_does_not_crash_on_redis_error(
     breaker_not_connected_storage,
 ):
     breaker_not_connected_storage.register_event(APP_ID, NAME, 5)
+
+
+def test_register_events(breaker_storage):
+    # when
+    breaker_storage.register_events(APP_ID, ["error", "total"], TTL_SECONDS)
+
+    # then
+    assert breaker_storage.get_event_count(APP_ID, "error") == 1
+    assert breaker_storage.get_event_count(APP_ID, "total") == 1
+
+
+def test_get_app_states(breaker_storage):
+    # given
+    other_app_id = APP_ID + 1
+    breaker_storage.set_app_state(APP_ID, CircuitBreakerState.OPEN, 100)
+    breaker_storage.register_events(APP_ID, ["error", "total"], TTL_SECONDS)
+    breaker_storage.register_events(APP_ID, ["total"], TTL_SECONDS)
+
+    # when
+    app_states = breaker_storage.get_app_states([APP_ID, other_app_id])
+
+    # then
+    assert app_states[APP_ID] == AppBreakerData(
+        state=CircuitBreakerState.OPEN, changed_at=100, total=2, errors=1
+    )
+    assert app_states[other_app_id] == AppBreakerData(
+        state=CircuitBreakerState.CLOSED, changed_at=0, total=0, errors=0
+    )
+
+
+def test_get_app_states_does_not_crash_on_redis_error(breaker_not_connected_storage):
+    # when
+    app_states = breaker_not_connected_storage.get_app_states([APP_ID])
+
+    # then
+    assert app_states[APP_ID] == AppBreakerData(
+        state=CircuitBreakerState.CLOSED, changed_at=0, total=0, errors=0
+    )
@@ -10,6 +10,7 @@ def create_breaker_board(
     success_count_recovery=10,
     cooldown_seconds=10,
     ttl_seconds=10,
+    state_cache_ttl_seconds=0,
 ):
     return BreakerBoard(
         storage=storage,
@@ -20,4 +21,5 @@ def create_breaker_board(
         success_count_recovery=success_count_recovery,
         cooldown_seconds=cooldown_seconds,
         ttl_seconds=ttl_seconds,
+        state_cache_ttl_seconds=state_cache_ttl_seconds,
     )
@@ -0,0 +1,104 @@
+import pytest
+
+from ..cache import clear_local_webhooks_cache
+from ..event_types import WebhookEventAsyncType
+from ..models import Webhook
+from ..utils import get_webhooks_for_event, get_webhooks_for_multiple_events
+
+
+@pytest.fixture(autouse=True)
+def _enable_webhooks_cache(settings):
+    settings.WEBHOOK_SUBSCRIBERS_CACHE_TIMEOUT = 60
+    clear_local_webhooks_cache()
+    yield
+    clear_local_webhooks_cache()
+
+
+@pytest.fixture
+def order_created_webhook(app, permission_manage_orders):
+    app.permissions.add(permission_manage_orders)
+    webhook = Webhook.objects.create(
+        app=app, target_url="https://www.example.com/webhook"
+    )
+    webhook.events.create(event_type=WebhookEventAsyncType.ORDER_CREATED)
+    return webhook
+
+
+def test_get_webhooks_for_event_is_cached(
+    order_created_webhook, django_assert_num_queries
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    get_webhooks_for_event(event_type)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = list(get_webhooks_for_event(event_type))
+        permissions = list(webhooks[0].app.permissions.all())
+
+    # then
+    assert webhooks == [order_created_webhook]
+    assert len(permissions) == 1
+
+
+def test_get_webhooks_for_event_returns_copies(order_created_webhook):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+
+    # when
+    first_webhooks = list(get_webhooks_for_event(event_type))
+    second_webhooks = list(get_webhooks_for_event(event_type))
+
+    # then
+    assert first_webhooks == second_webhooks
+    assert first_webhooks[0] is not second_webhooks[0]
+
+
+def test_get_webhooks_for_event_invalidated_on_webhook_change(
+    order_created_webhook, django_capture_on_commit_callbacks
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    assert list(get_webhooks_for_event(event_type)) == [order_created_webhook]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order_created_webhook.is_active = False
+        order_created_webhook.save(update_fields=["is_active"])
+
+    # then
+    assert list(get_webhooks_for_event(event_type)) == []
+
+
+def test_get_webhooks_for_event_invalidated_on_app_permissions_change(
+    order_created_webhook, permission_manage_orders, django_capture_on_commit_callbacks
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    assert list(get_webhooks_for_event(event_type)) == [order_created_webhook]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order_created_webhook.app.permissions.remove(permission_manage_orders)
+
+    # then
+    assert list(get_webhooks_for_event(event_type)) == []
+
+
+def test_get_webhooks_for_multiple_events_is_cached(
+    order_created_webhook, django_assert_num_queries
+):
+    # given
+    event_types = [
+        WebhookEventAsyncType.ORDER_CREATED,
+        WebhookEventAsyncType.ORDER_UPDATED,
+    ]
+    get_webhooks_for_multiple_events(event_types)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks_map = get_webhooks_for_multiple_events(event_types)
+
+    # then
+    assert webhooks_map[WebhookEventAsyncType.ORDER_CREATED] == {order_created_webhook}
+    assert webhooks_map[WebhookEventAsyncType.ORDER_UPDATED] == set()
@@ -27,6 +27,19 @@ SUBSCRIPTION_QUERY = """
     }
 """
 
+SUBSCRIPTION_QUERY_WITH_ID = """
+    subscription {
+        event {
+            ... on ProductVariantUpdated {
+                productVariant {
+                    id
+                    name
+                }
+            }
+        }
+    }
+"""
+
 
 @override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
 def test_create_deliveries_different_pre_save_payloads(webhook_app, variant):
@@ -135,7 +148,7 @@ def test_create_deliveries_reuse_request_for_webhooks(
     webhook_2 = Webhook.objects.create(
         name="Webhook 2",
         app=webhook_app,
-        subscription_query=SUBSCRIPTION_QUERY,
+        subscription_query=SUBSCRIPTION_QUERY_WITH_ID,
     )
     webhook_2.events.create(event_type=event_type)
 
@@ -163,6 +176,81 @@ def test_create_deliveries_reuse_request_for_webhooks(
     assert request_1.dataloaders is request_2.dataloaders
 
 
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+def test_create_deliveries_share_payload_for_identical_subscription_queries(
+    mock_generate_payload_from_subscription, webhook_app, variant
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhook_1 = Webhook.objects.create(
+        name="Webhook 1",
+        app=webhook_app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    webhook_2 = Webhook.objects.create(
+        name="Webhook 2",
+        app=webhook_app,
+        # the same query with different formatting and a comment
+        subscription_query=(
+            "# variant name\n"
+            "subscription { event { ... on ProductVariantUpdated "
+            "{ productVariant { name } } } }"
+        ),
+    )
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=[webhook_1, webhook_2],
+    )
+
+    # then
+    assert mock_generate_payload_from_subscription.call_count == 1
+    assert len(event_deliveries) == 2
+    assert {delivery.webhook for delivery in event_deliveries} == {
+        webhook_1,
+        webhook_2,
+    }
+    assert event_deliveries[0].payload_id == event_deliveries[1].payload_id
+    assert json.loads(event_deliveries[0].payload.get_payload()) == {
+        "productVariant": {"name": variant.name}
+    }
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+def test_create_deliveries_generate_payload_per_app(
+    mock_generate_payload_from_subscription, webhook_app, app, variant
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhooks = [
+        Webhook.objects.create(
+            name=f"Webhook {index}",
+            app=owner_app,
+            subscription_query=SUBSCRIPTION_QUERY,
+        )
+        for index, owner_app in enumerate([webhook_app, app])
+    ]
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=webhooks,
+    )
+
+    # then
+    assert mock_generate_payload_from_subscription.call_count == 2
+    assert len(event_deliveries) == 2
+
+
 def test_create_deliveries_for_multiple_subscription_objects(
     subscription_product_updated_webhook, product_list
 ):
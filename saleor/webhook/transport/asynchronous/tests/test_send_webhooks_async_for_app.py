@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import ANY, patch
 
 from .....core.models import EventDelivery, EventDeliveryAttempt, EventDeliveryStatus
@@ -214,3 +216,44 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
         kwargs={"app_id": app.id, "telemetry_context": ANY},
     )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_multiple_webhooks_async_for_app_respects_host_limit(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_deliveries,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_MAX_WORKERS = 3
+    settings.WEBHOOK_ASYNC_MAX_CONNECTIONS_PER_HOST = 1
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def send_webhook(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS)
+
+    mock_send_webhook_using_scheme_method.side_effect = send_webhook
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert mock_send_webhook_using_scheme_method.call_count == 3
+    assert max_in_flight == 1
+    assert not EventDelivery.objects.exists()
@@ -1,8 +1,11 @@
+import contextvars
 import datetime
 import json
 import logging
+import threading
 from collections import defaultdict
 from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -31,6 +34,7 @@ from ....core.utils.url import sanitize_url_for_logging
 from ....graphql.webhook.subscription_payload import (
     generate_payload_promise_from_subscription,
     get_pre_save_payload_key,
+    group_webhooks_by_payload,
     initialize_request,
 )
 from ... import observability
@@ -63,6 +67,7 @@ if TYPE_CHECKING:
     from ....graphql.core.context import SaleorContext
     from ....graphql.core.dataloaders import DataLoader
     from ....webhook.models import Webhook
+    from ..utils import EventDeliveryWithAttemptCount
 
 
 logger = logging.getLogger(__name__)
@@ -119,12 +124,15 @@ def create_deliveries_for_multiple_subscription_objects(
     request_map: dict[int, SaleorContext] = {}
 
     promises = []
-    subscribable_object_with_webhook = []
+    subscribable_object_with_webhooks = []
+    webhooks_groups = group_webhooks_by_payload(webhooks)
     for subscribable_object in subscribable_objects:
         # Dataloaders are shared between calls to generate_payload_from_subscription to
         # reuse their cache. This avoids unnecessary DB queries when different webhooks
         # need to resolve the same data.
-        for webhook in webhooks:
+        for subscription_query, grouped_webhooks in webhooks_groups:
+            # The payload is generated once for all webhooks of the group.
+            webhook = grouped_webhooks[0]
             request = request_map.get(webhook.app_id)
             if not request:
                 request = initialize_request(
@@ -141,10 +149,12 @@ def create_deliveries_for_multiple_subscription_objects(
             promise = generate_payload_promise_from_subscription(
                 event_type=event_type,
                 subscribable_object=subscribable_object,
-                subscription_query=webhook.subscription_query,
+                subscription_query=subscription_query,
                 request=request,
             )
-            subscribable_object_with_webhook.append((subscribable_object, webhook))
+            subscribable_object_with_webhooks.append(
+                (subscribable_object, grouped_webhooks)
+            )
             promises.append(promise)
 
     def process_webhook_payloads(webhook_payloads):
@@ -153,8 +163,8 @@ def create_deliveries_for_multiple_subscription_objects(
         event_deliveries = []
         event_deliveries_for_bulk_update = []
 
-        for (subscribable_object, webhook), data in zip(
-            subscribable_object_with_webhook, webhook_payloads, strict=False
+        for (subscribable_object, grouped_webhooks), data in zip(
+            subscribable_object_with_webhooks, webhook_payloads, strict=False
         ):
             if not data:
                 logger.info(
@@ -163,32 +173,35 @@ def create_deliveries_for_multiple_subscription_objects(
                 )
                 continue
 
-            if (
-                settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
-                and pre_save_payloads
-            ):
-                key = get_pre_save_payload_key(webhook, subscribable_object)
-                pre_save_payload = pre_save_payloads.get(key)
-                if pre_save_payload and pre_save_payload == data:
-                    logger.info(
-                        "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
-                        webhook.id,
-                        event_type,
-                        sanitize_url_for_logging(webhook.target_url),
-                    )
-                    continue
-
-            payload_data = json.dumps({**data})
-            event_payloads_data.append(payload_data)
-            event_payload = EventPayload()
-            event_payloads.append(event_payload)
-            event_delivery = EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
-            )
-            event_deliveries_for_bulk_update.append(event_delivery)
+            # Deliveries of the webhooks with identical payloads share the payload.
+            event_payload = None
+            for webhook in grouped_webhooks:
+                if (
+                    settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
+                    and pre_save_payloads
+                ):
+                    key = get_pre_save_payload_key(webhook, subscribable_object)
+                    pre_save_payload = pre_save_payloads.get(key)
+                    if pre_save_payload and pre_save_payload == data:
+                        logger.info(
+                            "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
+                            webhook.id,
+                            event_type,
+                            sanitize_url_for_logging(webhook.target_url),
+                        )
+                        continue
+
+                if event_payload is None:
+                    event_payloads_data.append(json.dumps({**data}))
+                    event_payload = EventPayload()
+                    event_payloads.append(event_payload)
+                event_delivery = EventDelivery(
+                    status=EventDeliveryStatus.PENDING,
+                    event_type=event_type,
+                    payload=event_payload,
+                    webhook=webhook,
+                )
+                event_deliveries_for_bulk_update.append(event_delivery)
 
             if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
                 with allow_writer():
@@ -843,6 +856,113 @@ def send_webhook_request_async(
     clear_successful_delivery(delivery)
 
 
+def _send_delivery(
+    delivery_with_count: "EventDeliveryWithAttemptCount",
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+) -> WebhookResponse:
+    """Send a single delivery of the batch.
+
+    Runs in a worker thread, so it must not query the database; the delivery is
+    fetched with its payload, webhook and app.
+    """
+    delivery = delivery_with_count.delivery
+    webhook = delivery.webhook
+    try:
+        if not delivery.payload:
+            raise ValueError(f"Event delivery id: {delivery.id} has no payload.")
+        data = delivery.payload.get_payload()
+        # Convert payload to bytes if it's not already.
+        data = data if isinstance(data, bytes) else data.encode("utf-8")
+        # Count payload size in bytes.
+        payload_size = len(data)
+
+        if delivery_with_count.count == 0:
+            record_first_delivery_attempt_delay(
+                delivery.created_at, delivery.event_type, webhook.app
+            )
+        with webhooks_otel_trace(
+            delivery.event_type,
+            payload_size,
+            webhook.app,
+            span_links=telemetry_context.links,
+        ):
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                data,
+                webhook.custom_headers,
+            )
+
+        record_external_request(
+            delivery.event_type,
+            webhook.target_url,
+            response,
+            payload_size,
+            webhook.app,
+            sync=False,
+        )
+    except ValueError as e:
+        response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+    return response
+
+
+def _send_delivery_with_host_limit(
+    host_semaphore: threading.BoundedSemaphore,
+    delivery_with_count: "EventDeliveryWithAttemptCount",
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+) -> WebhookResponse:
+    with host_semaphore:
+        return _send_delivery(delivery_with_count, domain, telemetry_context)
+
+
+def send_deliveries_concurrently(
+    deliveries: list["EventDeliveryWithAttemptCount"],
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+) -> dict[int, WebhookResponse]:
+    """Send the deliveries using a bounded pool of threads.
+
+    A slow target delays only the deliveries sent to it instead of the whole
+    batch. The number of requests sent at the same time to a single host is
+    limited by `WEBHOOK_ASYNC_MAX_CONNECTIONS_PER_HOST`.
+    """
+    max_workers = min(settings.WEBHOOK_ASYNC_MAX_WORKERS, len(deliveries))
+    if max_workers <= 1:
+        return {
+            delivery_with_count.delivery.pk: _send_delivery(
+                delivery_with_count, domain, telemetry_context
+            )
+            for delivery_with_count in deliveries
+        }
+
+    host_semaphores: dict[str, threading.BoundedSemaphore] = defaultdict(
+        lambda: threading.BoundedSemaphore(
+            settings.WEBHOOK_ASYNC_MAX_CONNECTIONS_PER_HOST
+        )
+    )
+    futures = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="webhook-delivery"
+    ) as executor:
+        for delivery_with_count in deliveries:
+            host = urlparse(delivery_with_count.delivery.webhook.target_url).netloc
+            # Each task runs in a copy of the current context, so the webhook spans
+            # are children of the task span.
+            futures[delivery_with_count.delivery.pk] = executor.submit(
+                contextvars.copy_context().run,
+                _send_delivery_with_host_limit,
+                host_semaphores[host],
+                delivery_with_count,
+                domain,
+                telemetry_context,
+            )
+    return {delivery_id: future.result() for delivery_id, future in futures.items()}
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -866,69 +986,29 @@ def send_webhooks_async_for_app(
     failed_deliveries_attempts = []
     successful_deliveries = []
 
+    responses = send_deliveries_concurrently(
+        list(deliveries.values()), domain, telemetry_context
+    )
     for delivery_id, delivery_with_count in deliveries.items():
         delivery = delivery_with_count.delivery
         attempt_count = delivery_with_count.count
         attempt = attempts_for_deliveries[delivery_id]
+        response = responses[delivery_id]
 
-        webhook = delivery.webhook
-
-        try:
-            if not delivery.payload:
-                raise ValueError(f"Event delivery id: {delivery_id} has no payload.")
-            data = delivery.payload.get_payload()
-            # Convert payload to bytes if it's not already.
-            data = data if isinstance(data, bytes) else data.encode("utf-8")
-            # Count payload size in bytes.
-            payload_size = len(data)
-
-            if attempt_count == 0:
-                record_first_delivery_attempt_delay(
-                    delivery.created_at, delivery.event_type, webhook.app
-                )
-            with webhooks_otel_trace(
-                delivery.event_type,
-                payload_size,
-                webhook.app,
-                span_links=telemetry_context.links,
-            ):
-                response = send_webhook_using_scheme_method(
-                    webhook.target_url,
-                    domain,
-                    webhook.secret_key,
-                    delivery.event_type,
-                    data,
-                    webhook.custom_headers,
-                )
-
-            record_external_request(
+        if response.status == EventDeliveryStatus.FAILED:
+            attempt_update(attempt, response, with_save=False)
+            failed_deliveries_attempts.append((delivery, attempt, attempt_count))
+        elif response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                delivery.webhook.id,
+                sanitize_url_for_logging(delivery.webhook.target_url),
                 delivery.event_type,
-                webhook.target_url,
-                response,
-                payload_size,
-                webhook.app,
-                sync=False,
-            )
-            if response.status == EventDeliveryStatus.FAILED:
-                attempt_update(attempt, response, with_save=False)
-                failed_deliveries_attempts.append((delivery, attempt, attempt_count))
-            elif response.status == EventDeliveryStatus.SUCCESS:
-                task_logger.info(
-                    "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                    webhook.id,
-                    sanitize_url_for_logging(webhook.target_url),
-                    delivery.event_type,
-                    delivery.id,
-                )
-                delivery.status = EventDeliveryStatus.SUCCESS
-                # update attempt without save to provide proper data in observability
-                attempt_update(attempt, response, with_save=False)
-        except ValueError as e:
-            response = WebhookResponse(
-                content=str(e), status=EventDeliveryStatus.FAILED
+                delivery.id,
             )
+            delivery.status = EventDeliveryStatus.SUCCESS
+            # update attempt without save to provide proper data in observability
             attempt_update(attempt, response, with_save=False)
-            failed_deliveries_attempts.append((delivery, attempt, attempt_count))
 
         observability.report_event_delivery_attempt(attempt)
         successful_deliveries.append(delivery)
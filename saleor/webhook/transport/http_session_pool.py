@@ -0,0 +1,118 @@
+import os
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from opentelemetry.semconv.attributes import server_attributes
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests_hardened import HTTPSession
+from requests_hardened.ip_filter_adapter import IPFilterAdapter
+
+from ...core.http_client import HTTPClient
+from ...core.telemetry import MetricType, Scope, Unit, meter
+
+METRIC_HTTP_SESSION_POOL_LOOKUP = meter.create_metric(
+    "saleor.webhook.http_session_pool.lookup",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of lookups of keep-alive HTTP sessions for webhook targets.",
+)
+HTTP_SESSION_POOL_HIT_ATTRIBUTE = "saleor.webhook.http_session_pool.hit"
+
+
+class HTTPSessionPool:
+    """Per-process keep-alive HTTP sessions, one per target host.
+
+    Reusing a session keeps its connections open between requests sent to the same
+    host, so subsequent webhooks skip the TCP and TLS handshakes. The least recently
+    used sessions are closed when the number of hosts exceeds `max_hosts`.
+    """
+
+    def __init__(self, max_hosts: int, pool_maxsize: int):
+        self.max_hosts = max_hosts
+        self.pool_maxsize = pool_maxsize
+        self._sessions: OrderedDict[str, requests.Session] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _create_adapter(self, is_https_proto: bool) -> HTTPAdapter:
+        config = HTTPClient.config
+        adapter: HTTPAdapter
+        if config.ip_filter_enable:
+            # Build the adapter the same way `HTTPSession` does, so the IP filtering
+            # applies to the pooled connections too.
+            adapter = IPFilterAdapter(
+                is_https_proto=is_https_proto,
+                allow_loopback=config.ip_filter_allow_loopback_ips,
+                tls_sni_support=config.ip_filter_tls_sni_support,
+            )
+        else:
+            adapter = HTTPAdapter()
+        adapter.init_poolmanager(
+            DEFAULT_POOLSIZE, self.pool_maxsize, block=DEFAULT_POOLBLOCK
+        )
+        return adapter
+
+    def _create_session(self) -> requests.Session:
+        session = HTTPSession(config=HTTPClient.config)
+        session.mount("http://", self._create_adapter(is_https_proto=False))
+        session.mount("https://", self._create_adapter(is_https_proto=True))
+        return session
+
+    def _reset_after_fork(self):
+        # Connections opened by the parent process must not be shared with the
+        # forked workers.
+        if self._pid != os.getpid():
+            self._sessions = OrderedDict()
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    def get_session(self, url: str) -> requests.Session:
+        self._reset_after_fork()
+        parts = urlparse(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        evicted_sessions = []
+        with self._lock:
+            session = self._sessions.get(host)
+            hit = session is not None
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+                while len(self._sessions) > self.max_hosts:
+                    _, evicted_session = self._sessions.popitem(last=False)
+                    evicted_sessions.append(evicted_session)
+            else:
+                self._sessions.move_to_end(host)
+
+        for evicted_session in evicted_sessions:
+            evicted_session.close()
+
+        meter.record(
+            METRIC_HTTP_SESSION_POOL_LOOKUP,
+            1,
+            Unit.REQUEST,
+            attributes={
+                server_attributes.SERVER_ADDRESS: parts.hostname or "",
+                HTTP_SESSION_POOL_HIT_ATTRIBUTE: hit,
+            },
+        )
+        return session
+
+    def send_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def clear(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+webhook_session_pool = HTTPSessionPool(
+    max_hosts=settings.WEBHOOK_HTTP_SESSION_POOL_MAX_HOSTS,
+    pool_maxsize=settings.WEBHOOK_HTTP_SESSION_POOL_MAXSIZE,
+)
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Iterable
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar, Union
 from urllib.parse import urlparse
@@ -448,6 +449,15 @@ if breaker_board := initialize_breaker_board():
     )
 
 
+def prefetch_circuit_breaker_states(event_type: str, webhooks: Iterable["Webhook"]):
+    """Load circuit breaker states of all webhooks' apps at once.
+
+    Call it before triggering the sync event for several webhooks.
+    """
+    if breaker_board:
+        breaker_board.prefetch_breaker_states(event_type, webhooks)
+
+
 def trigger_transaction_request(
     transaction_data: "TransactionActionData", event_type: str, requestor
 ) -> None:
@@ -463,9 +473,10 @@ def trigger_transaction_request(
             transaction_data.transaction, transaction_data.event
         )
         return
-    webhook = get_webhooks_for_event(
+    webhooks = get_webhooks_for_event(
         event_type, apps_ids=[transaction_data.transaction_app_owner.pk]
-    ).first()
+    )
+    webhook = webhooks[0] if webhooks else None
     if not webhook:
         create_failed_transaction_event(
             transaction_data.event,
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from requests_hardened import HTTPSession
+from requests_hardened.ip_filter_adapter import IPFilterAdapter
+
+from ....core.http_client import HTTPClient
+from ..http_session_pool import HTTPSessionPool
+
+
+def test_get_session_reuses_session_for_host():
+    # given
+    pool = HTTPSessionPool(max_hosts=10, pool_maxsize=5)
+
+    # when
+    session = pool.get_session("https://app.example.com/api/webhooks/order")
+    other_session = pool.get_session("https://app.example.com/api/webhooks/product")
+
+    # then
+    assert isinstance(session, HTTPSession)
+    assert session is other_session
+
+
+def test_get_session_separates_hosts():
+    # given
+    pool = HTTPSessionPool(max_hosts=10, pool_maxsize=5)
+
+    # when
+    session = pool.get_session("https://app.example.com/api/webhooks")
+    other_session = pool.get_session("https://other.example.com/api/webhooks")
+
+    # then
+    assert session is not other_session
+
+
+def test_get_session_mounts_adapters_with_pool_maxsize():
+    # given
+    pool = HTTPSessionPool(max_hosts=10, pool_maxsize=5)
+
+    # when
+    session = pool.get_session("https://app.example.com/api/webhooks")
+
+    # then
+    adapter = session.get_adapter("https://app.example.com/api/webhooks")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 5
+
+
+@patch.object(HTTPClient.config, "ip_filter_allow_loopback_ips", False)
+@patch.object(HTTPClient.config, "ip_filter_enable", True)
+def test_get_session_keeps_ip_filter_adapters(settings):
+    # given
+    settings.HTTP_IP_FILTER_ENABLED = True
+    pool = HTTPSessionPool(max_hosts=10, pool_maxsize=5)
+
+    # when
+    session = pool.get_session("https://app.example.com/api/webhooks")
+
+    # then
+    https_adapter = session.get_adapter("https://app.example.com/api/webhooks")
+    http_adapter = session.get_adapter("http://app.example.com/api/webhooks")
+    assert isinstance(https_adapter, IPFilterAdapter)
+    assert isinstance(http_adapter, IPFilterAdapter)
+    assert https_adapter._is_https_proto is True
+    assert http_adapter._is_https_proto is False
+    assert https_adapter._allow_loopback is False
+    assert https_adapter.poolmanager.connection_pool_kw["maxsize"] == 5
+    assert http_adapter.poolmanager.connection_pool_kw["maxsize"] == 5
+
+
+@patch.object(HTTPSession, "close")
+def test_get_session_evicts_least_recently_used_host(mocked_close):
+    # given
+    pool = HTTPSessionPool(max_hosts=2, pool_maxsize=5)
+    first_session = pool.get_session("https://first.example.com/")
+    pool.get_session("https://second.example.com/")
+    pool.get_session("https://first.example.com/")
+
+    # when
+    pool.get_session("https://third.example.com/")
+
+    # then
+    mocked_close.assert_called_once()
+    assert pool.get_session("https://first.example.com/") is first_session
+
+
+@patch.object(HTTPSession, "request")
+def test_send_request_uses_pooled_session(mocked_request):
+    # given
+    pool = HTTPSessionPool(max_hosts=10, pool_maxsize=5)
+    url = "https://app.example.com/api/webhooks"
+
+    # when
+    pool.send_request("POST", url, data=b"{}", allow_redirects=False)
+
+    # then
+    mocked_request.assert_called_once_with(
+        "POST", url, data=b"{}", allow_redirects=False
+    )
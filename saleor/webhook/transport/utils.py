@@ -7,6 +7,7 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from time import time
 from typing import Optional
 from urllib.parse import unquote, urlparse, urlunparse
@@ -20,6 +21,7 @@ from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Count
 from django.urls import reverse
 from django.utils.text import slugify
@@ -51,6 +53,7 @@ from ..const import APP_ID_PREFIX
 from ..event_types import WebhookEventAsyncType
 from ..models import Webhook
 from . import signature_for_payload
+from .http_session_pool import webhook_session_pool
 
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
@@ -205,6 +208,27 @@ def generate_cache_key_for_webhook(
     )
 
 
+@lru_cache(maxsize=32)
+def _get_static_webhook_headers(
+    domain: str, public_url: str | None, enable_ssl: bool
+) -> dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        DeprecatedAppHeaders.DOMAIN: domain,
+        AppHeaders.DOMAIN: domain,
+        AppHeaders.API_URL: build_absolute_uri(reverse("api"), domain),
+    }
+
+
+def get_static_webhook_headers(domain: str) -> dict[str, str]:
+    """Return the headers that are the same for all webhooks sent from the domain.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    # Settings used to build the API URL are part of the cache key.
+    return _get_static_webhook_headers(domain, settings.PUBLIC_URL, settings.ENABLE_SSL)
+
+
 # TODO (PE-568): change typing of data to `bytes` to avoid unnecessary encoding.
 def send_webhook_using_http(
     target_url,
@@ -228,23 +252,25 @@ def send_webhook_using_http(
     :return: WebhookResponse object.
     """
     headers = {
-        "Content-Type": "application/json",
+        **get_static_webhook_headers(domain),
         # X- headers will be deprecated in Saleor 4.0, proper headers are without X-
         DeprecatedAppHeaders.EVENT_TYPE: event_type,
-        DeprecatedAppHeaders.DOMAIN: domain,
         DeprecatedAppHeaders.SIGNATURE: signature,
         AppHeaders.EVENT_TYPE: event_type,
-        AppHeaders.DOMAIN: domain,
         AppHeaders.SIGNATURE: signature,
-        AppHeaders.API_URL: build_absolute_uri(reverse("api"), domain),
     }
     tracer.inject_context(headers)
 
     if custom_headers:
         headers.update(custom_headers)
 
+    http_client = (
+        webhook_session_pool
+        if settings.WEBHOOK_HTTP_SESSION_POOL_ENABLED
+        else HTTPClient
+    )
     try:
-        response = HTTPClient.send_request(
+        response = http_client.send_request(
             "POST",
             target_url,
             data=message,
@@ -593,24 +619,31 @@ def clear_successful_deliveries(deliveries: list["EventDelivery"]):
         if payload_id := delivery.payload_id:
             payload_ids_to_delete.append(payload_id)
 
-            payloads_to_delete = EventPayload.objects.filter(
-                pk=payload_id, deliveries__isnull=True
-            )
+    if not delivery_ids_to_delete:
+        return
 
-    if delivery_ids_to_delete:
+    with transaction.atomic():
         EventDelivery.objects.filter(pk__in=delivery_ids_to_delete).delete()
-    if payload_ids_to_delete:
-        payloads_to_delete = EventPayload.objects.filter(
-            pk__in=payload_ids_to_delete, deliveries__isnull=True
-        )
-        files_to_delete = [
-            event_payload.payload_file.name
-            for event_payload in payloads_to_delete.using(
-                settings.DATABASE_CONNECTION_REPLICA_NAME
+        # Payloads with the same content are reused by new deliveries, so only the
+        # payloads that are still unused are deleted. Payloads locked by
+        # transactions creating deliveries that reuse them are skipped.
+        payloads_to_delete = list(
+            EventPayload.objects.filter(
+                pk__in=payload_ids_to_delete, deliveries__isnull=True
             )
-            if event_payload.payload_file
-        ]
-        payloads_to_delete.delete()
+            .select_for_update(of=("self",), skip_locked=True)
+            .only("pk", "payload_file")
+        )
+        EventPayload.objects.filter(
+            pk__in=[payload.pk for payload in payloads_to_delete]
+        ).delete()
+
+    files_to_delete = [
+        payload.payload_file.name
+        for payload in payloads_to_delete
+        if payload.payload_file
+    ]
+    if files_to_delete:
         delete_files_from_private_storage_task(files_to_delete)
 
 
@@ -7,6 +7,7 @@ from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 
 from ..app.models import App
+from .cache import get_or_load_webhooks
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
 
@@ -71,8 +72,14 @@ def get_webhooks_for_event(
     webhooks: Optional["QuerySet[Webhook]"] = None,
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: list[str] | None = None,
-) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+) -> list[Webhook]:
+    """Get active webhooks from the database for an event.
+
+    When the lookup isn't narrowed down by any argument, the webhooks are served
+    from the in-process cache, see `get_or_load_webhooks`.
+    """
+    if webhooks is None and not apps_ids and not apps_identifier:
+        return _get_cached_webhooks_for_event(event_type)
 
     if webhooks is None:
         # For this QS replica usage is applied later, as this QS could be also passed
@@ -83,14 +90,29 @@ def get_webhooks_for_event(
         event_type=event_type, apps_ids=apps_ids, apps_identifier=apps_identifier
     )
 
-    return (
+    return list(
         webhooks.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         .filter(filters)
         .select_related("app")
         .prefetch_related("app__permissions__content_type")
+        .order_by("pk")
     )
 
 
+def _get_cached_webhooks_for_event(event_type: str) -> list[Webhook]:
+    def load_webhooks() -> list[Webhook]:
+        filters = get_filter_for_single_webhook_event(event_type=event_type)
+        return list(
+            Webhook.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .filter(filters)
+            .select_related("app")
+            .prefetch_related("app__permissions__content_type")
+            .order_by("pk")
+        )
+
+    return get_or_load_webhooks(("event", event_type), load_webhooks)
+
+
 def get_webhooks_for_app_lifecycle_event(
     event_type: str,
     app: "App",
@@ -128,6 +150,16 @@ def get_webhooks_for_app_lifecycle_event(
 
 def get_webhooks_for_multiple_events(
     event_types: Iterable[str],
+) -> dict[str, set[Webhook]]:
+    set_event_types = frozenset(event_types)
+    return get_or_load_webhooks(
+        ("multiple_events", set_event_types),
+        lambda: _get_webhooks_for_multiple_events(set_event_types),
+    )
+
+
+def _get_webhooks_for_multiple_events(
+    event_types: Iterable[str],
 ) -> dict[str, set[Webhook]]:
     set_event_types = set(event_types)
     if set_event_types.intersection(WebhookEventAsyncType.ALL):